@@ -1,41 +1,147 @@
 #!/usr/bin/env python3
-import argparse
 import json
 import os
+import struct
 import sys
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Set
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None
 
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+if orjson is not None:
+    JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+else:
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(name) or default)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+STDIN_BUFFER_SIZE = _env_int("GESTION_OV_STDIN_BUF", 256 * 1024)
+
+# PyInstaller bundles src.python into the frozen executable; only script runs need the repo root on sys.path.
+if not getattr(sys, "frozen", False):
+    PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+
+# The generator modules (and python-docx behind them) are imported on the first generate request,
+# so --ping and ping commands answer without paying for them.
+generate_document: Any = None
+generate_role: Any = None
+
+# --serve frames: 4-byte big-endian length followed by the UTF-8 JSON body.
+FRAME_HEADER = struct.Struct(">I")
+
+_STDOUT = sys.stdout.buffer
+_SEP = os.sep
+
+# Output directories already created by this process (a --serve worker reuses them across requests).
+_ENSURED_DIRS: Set[str] = set()
+
+
+def dumps_json(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(raw: Any) -> Any:
+    start = raw[:1]
+    if start.isspace():
+        start = raw.lstrip()[:1]
+    if start != b"{":
+        raise ValueError("Invalid JSON input: expected a JSON object")
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw.decode("utf-8"))
+    except JSON_DECODE_ERRORS as exc:
+        raise ValueError(f"Invalid JSON input: {exc}") from exc
 
 
 def emit_json(payload: Dict[str, Any]) -> None:
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False))
-    sys.stdout.flush()
+    # One write on the binary stream: no text-codec pass and a single write(2) for the response.
+    _STDOUT.write(dumps_json(payload) + b"\n")
+    _STDOUT.flush()
+
+
+def read_stdin_bytes() -> bytearray:
+    stream = sys.stdin.buffer
+    chunk = bytearray(STDIN_BUFFER_SIZE)
+    view = memoryview(chunk)
+    data = bytearray()
+    while True:
+        n = stream.readinto(view)
+        if not n:
+            break
+        data += view[:n]
+    return data
 
 
 def parse_request() -> Dict[str, Any]:
-    raw = sys.stdin.buffer.read()
+    raw = read_stdin_bytes()
     if not raw:
         return {}
+    return loads_json(raw)
+
+
+def read_frame(stream) -> Optional[bytes]:
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return body
+
+
+def write_frame(stream, data: bytes) -> None:
+    stream.write(FRAME_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def ensure_output_dir(output_dir: str, ensure_dir: Callable[[str], None]) -> None:
+    if output_dir in _ENSURED_DIRS:
+        return
+    ensure_dir(output_dir)
+    _ENSURED_DIRS.add(output_dir)
+
+
+def generate_in_output_dir(
+    output_dir: str,
+    ensure_dir: Callable[[str], None],
+    generate: Callable[..., None],
+    *args: Any,
+) -> None:
+    ensure_output_dir(output_dir, ensure_dir)
     try:
-        return json.loads(raw.decode("utf-8"))
-    except Exception as exc:  # pragma: no cover
-        raise ValueError(f"Invalid JSON input: {exc}") from exc
+        generate(*args)
+    except FileNotFoundError:
+        # The directory was removed or moved after we cached it: recreate it and try once more.
+        _ENSURED_DIRS.discard(output_dir)
+        ensure_output_dir(output_dir, ensure_dir)
+        generate(*args)
 
 
-def normalize_script_name(script_value: Any) -> str:
-    script = str(script_value or "").strip().replace("\\", "/")
-    script = os.path.basename(script).lower()
-    return script
+def join_output_path(output_dir: str, file_name: str) -> str:
+    # file_name comes from the sanitized filename builders, so plain concatenation matches os.path.join.
+    if output_dir.endswith(("/", "\\")):
+        return output_dir + file_name
+    return output_dir + _SEP + file_name
 
 
 def run_generate_document(payload: Dict[str, Any]) -> Dict[str, Any]:
-    from src.python import generate_document
-
-    document_type = str(payload.get("documentType") or "").strip()
+    # Interned so the type-keyed maps and comparisons downstream hit the identity fast path.
+    document_type = sys.intern(str(payload.get("documentType") or "").strip())
     output_dir = str(payload.get("outputDir") or "").strip()
 
     if not output_dir:
@@ -43,81 +149,118 @@ def run_generate_document(payload: Dict[str, Any]) -> Dict[str, Any]:
     if not document_type:
         raise ValueError("Missing required field: documentType")
 
-    generate_document.ensure_dir(output_dir)
     docx_name = generate_document.build_docx_filename(document_type, payload)
-    docx_path = os.path.join(output_dir, docx_name)
-    generate_document.generate_generic_docx({**payload, "documentType": document_type}, docx_path)
+    docx_path = join_output_path(output_dir, docx_name)
+    # The payload comes straight from the parsed request, so normalizing it in place is safe.
+    payload["documentType"] = document_type
+    generate_in_output_dir(
+        output_dir, generate_document.ensure_dir, generate_document.generate_generic_docx, payload, docx_path
+    )
 
     return {"success": True, "docxFileName": docx_name, "docxFilePath": docx_path}
 
 
 def run_generate_role(payload: Dict[str, Any]) -> Dict[str, Any]:
-    from src.python import generate_role
-
     output_dir = str(payload.get("outputDir") or "").strip()
     if not output_dir:
         raise ValueError("Missing required field: outputDir")
 
-    generate_role.ensure_dir(output_dir)
     safe_start = generate_role.safe_filename_part(payload.get("safeStart") or payload.get("periodStart") or "")
     safe_end = generate_role.safe_filename_part(payload.get("safeEnd") or payload.get("periodEnd") or "")
 
     docx_name = f"role_journees_{safe_start}_{safe_end}.docx"
-    docx_path = os.path.join(output_dir, docx_name)
-    generate_role.draw_role_docx(payload, docx_path)
+    docx_path = join_output_path(output_dir, docx_name)
+    generate_in_output_dir(output_dir, generate_role.ensure_dir, generate_role.draw_role_docx, payload, docx_path)
 
     return {"success": True, "docxFileName": docx_name, "docxFilePath": docx_path}
 
 
+SCRIPT_HANDLERS = {
+    "generate_document.py": run_generate_document,
+    "generate_document": run_generate_document,
+    "generate_role.py": run_generate_role,
+    "generate_role": run_generate_role,
+}
+
+
+def load_generators() -> None:
+    global generate_document, generate_role
+    if generate_role is None:
+        from src.python import generate_document, generate_role
+
+
 def handle_generate(script: Any, payload: Any) -> Dict[str, Any]:
-    script_name = normalize_script_name(script)
+    load_generators()
+    script_name = str(script or "").strip().rsplit("/", 1)[-1].rsplit("\\", 1)[-1].lower()
     data = payload if isinstance(payload, dict) else {}
 
-    if script_name in ("generate_document.py", "generate_document"):
-        return run_generate_document(data)
-    if script_name in ("generate_role.py", "generate_role"):
-        return run_generate_role(data)
+    handler = SCRIPT_HANDLERS.get(script_name)
+    if handler is not None:
+        return handler(data)
 
     raise ValueError(f"Unsupported backend script: {script_name or '(empty)'}")
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--ping", action="store_true")
-    args, _ = parser.parse_known_args()
-
-    if args.ping:
-        emit_json({"success": True, "status": "ok"})
-        return
-
-    request = parse_request()
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
     command = str(request.get("command") or "generate").strip().lower()
 
     if command == "ping":
-        emit_json({"success": True, "status": "ok"})
-        return
+        return {"success": True, "status": "ok"}
     if command != "generate":
         raise ValueError(f"Unsupported backend command: {command}")
 
-    result = handle_generate(request.get("script"), request.get("payload"))
-    emit_json(result)
+    return handle_generate(request.get("script"), request.get("payload"))
+
+
+def error_response(exc: BaseException) -> Dict[str, Any]:
+    if isinstance(exc, ModuleNotFoundError):
+        return {
+            "success": False,
+            "message": (
+                "Missing Python dependency for backend executable. "
+                "Rebuild with PyInstaller after installing backend/requirements.txt."
+            ),
+            "error": str(exc),
+        }
+    return {"success": False, "message": str(exc)}
+
+
+def serve() -> None:
+    # Long-lived worker: one framed JSON response per framed request until stdin closes.
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    # A --serve worker is started ahead of its first request, so it pays the imports up front.
+    # A failure here is reported by the first request, which retries the import.
+    try:
+        load_generators()
+    except Exception:
+        pass
+    while True:
+        raw = read_frame(stdin)
+        if raw is None:
+            return
+        try:
+            response = handle_request(loads_json(raw) if raw else {})
+        except Exception as exc:
+            response = error_response(exc)
+        write_frame(stdout, dumps_json(response))
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if "--ping" in argv:
+        emit_json({"success": True, "status": "ok"})
+        return
+    if "--serve" in argv:
+        serve()
+        return
+
+    emit_json(handle_request(parse_request()))
 
 
 if __name__ == "__main__":
     try:
         main()
-    except ModuleNotFoundError as exc:
-        emit_json(
-            {
-                "success": False,
-                "message": (
-                    "Missing Python dependency for backend executable. "
-                    "Rebuild with PyInstaller after installing backend/requirements.txt."
-                ),
-                "error": str(exc),
-            }
-        )
-        sys.exit(1)
     except Exception as exc:  # pragma: no cover
-        emit_json({"success": False, "message": str(exc)})
+        emit_json(error_response(exc))
         sys.exit(1)
@@ -73,7 +73,7 @@ function ensureRequirementsFile() {
     return;
   }
 
-  const defaultRequirements = ['pyinstaller>=6.0', 'python-docx>=1.1.0', ''].join('\n');
+  const defaultRequirements = ['pyinstaller>=6.0', 'python-docx>=1.1.0,<2', 'orjson>=3.9', ''].join('\n');
   fs.mkdirSync(backendDir, { recursive: true });
   fs.writeFileSync(requirementsPath, defaultRequirements, 'utf8');
   info(`Created missing ${path.relative(projectRoot, requirementsPath)}`);
@@ -140,6 +140,7 @@ function buildPyInstallerArgs() {
   const args = [
     '--noconfirm',
     mode === 'onefile' ? '--onefile' : '--onedir',
+    '--noupx',
     '--name',
     'mybackend',
     '--paths',
@@ -148,6 +149,8 @@ function buildPyInstallerArgs() {
     'src.python.generate_document',
     '--hidden-import',
     'src.python.generate_role',
+    '--hidden-import',
+    'docx',
     entryPoint
   ];
 
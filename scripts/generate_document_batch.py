@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Generate several documents in parallel through the backend handler (development tool).
+
+Reads {"batch": [payload, ...]} on stdin, where each payload is what the app sends as a
+generate_document request, and prints a JSON array with one result per entry. Not shipped:
+the app goes through backend/main.py, one document per request.
+"""
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from backend import main as backend  # noqa: E402
+
+
+def output_path(payload: Any) -> Optional[str]:
+    # None when the entry is invalid; the backend handler reports why when the entry runs.
+    if not isinstance(payload, dict):
+        return None
+    document_type = str(payload.get("documentType") or "").strip()
+    output_dir = str(payload.get("outputDir") or "").strip()
+    if not document_type or not output_dir:
+        return None
+    try:
+        file_name = backend.generate_document.build_docx_filename(document_type, payload)
+    except Exception:
+        return None
+    return backend.join_output_path(output_dir, file_name)
+
+
+def generate_entry(payload: Any) -> Dict[str, Any]:
+    # One failing document must not sink the rest of the batch.
+    try:
+        if not isinstance(payload, dict):
+            raise ValueError("Batch entries must be JSON objects")
+        return backend.handle_generate("generate_document", payload)
+    except Exception as exc:
+        return backend.error_response(exc)
+
+
+def generate_batch(payloads: List[Any]) -> List[Dict[str, Any]]:
+    # Two entries writing the same file would race, so every entry after the first for a given
+    # path is rejected.
+    backend.load_generators()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+    seen_paths = set()
+    pending: List[int] = []
+    for i, payload in enumerate(payloads):
+        docx_path = output_path(payload)
+        if docx_path is not None:
+            key = os.path.normcase(os.path.abspath(docx_path))
+            if key in seen_paths:
+                results[i] = {"success": False, "message": f"Duplicate output file in batch: {docx_path}"}
+                continue
+            seen_paths.add(key)
+        pending.append(i)
+
+    jobs = [payloads[i] for i in pending]
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        done = [generate_entry(p) for p in jobs]
+    else:
+        # Forked workers (Linux) inherit the generator modules imported above; spawned workers
+        # (Windows, macOS) import them again on their first document.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            done = list(executor.map(generate_entry, jobs))
+    for i, result in zip(pending, done):
+        results[i] = result
+    return results
+
+
+def main() -> None:
+    request = json.loads(sys.stdin.buffer.read() or b"{}")
+    batch = request.get("batch") if isinstance(request, dict) else None
+    if not isinstance(batch, list):
+        raise ValueError('Expected {"batch": [payload, ...]} on stdin')
+    sys.stdout.write(json.dumps(generate_batch(batch), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
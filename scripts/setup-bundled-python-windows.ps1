@@ -50,7 +50,7 @@ Write-Step "Upgrading pip"
 & $venvPython -m pip install --upgrade pip
 
 Write-Step "Installing python-docx"
-& $venvPython -m pip install python-docx
+& $venvPython -m pip install "python-docx>=1.1.0,<2"
 
 Write-Step "Verifying imports"
 & $venvPython -c "import docx, lxml; print('ok')"
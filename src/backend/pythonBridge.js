@@ -6,6 +6,8 @@ const { getBackendPath } = require('./backendPath');
 const { getBackendWorkingDirectory, appendBackendLog } = require('./backendRuntime');
 
 const autoInstallStatusByPython = new Map();
+// Same range as backend/requirements.txt: the generators rely on python-docx 1.x internals.
+const PYTHON_DOCX_REQUIREMENT = 'python-docx>=1.1.0,<2';
 let loggedBackendExePath = false;
 
 function normalizePathIfExists(candidate) {
@@ -233,6 +235,184 @@ function runBackendJsonOnce(backendExePath, requestPayload) {
   });
 }
 
+// `mybackend --serve` frames: 4-byte big-endian length followed by the UTF-8 JSON body.
+const FRAME_HEADER_BYTES = 4;
+const SERVE_STDERR_LIMIT = 4000;
+// A request that gets no answer within this delay is treated as hung: the worker is killed and the
+// next request starts a fresh one. Measured from when the request reaches the head of the queue.
+const SERVE_REQUEST_TIMEOUT_MS = Number(process.env.GOV_BACKEND_TIMEOUT_MS) || 120000;
+let persistentBackend = null;
+
+function clearHeadTimeout(state) {
+  if (state.timer) {
+    clearTimeout(state.timer);
+    state.timer = null;
+  }
+}
+
+function armHeadTimeout(state) {
+  if (state.timer || !state.pending.length) return;
+  const head = state.pending[0];
+  state.timer = setTimeout(() => {
+    state.timer = null;
+    if (state.pending[0] !== head) return;
+    state.pending.shift();
+    appendBackendLog(`SERVE request timeout after ${SERVE_REQUEST_TIMEOUT_MS} ms; restarting worker`);
+    if (persistentBackend === state) persistentBackend = null;
+    head.reject(
+      new Error(
+        `Backend Python exécutable: délai dépassé (${SERVE_REQUEST_TIMEOUT_MS} ms). ` +
+        `stderr=${state.stderr.slice(0, 500)}`
+      )
+    );
+    // The requests queued behind it are failed by the close handler and retried one-shot.
+    try {
+      state.child.kill();
+    } catch (error) {
+      // Already exited.
+    }
+  }, SERVE_REQUEST_TIMEOUT_MS);
+}
+
+function failPendingBackendRequests(state, error) {
+  clearHeadTimeout(state);
+  const pending = state.pending.splice(0, state.pending.length);
+  for (const request of pending) {
+    request.reject(error);
+  }
+}
+
+function stopPersistentBackend() {
+  const state = persistentBackend;
+  persistentBackend = null;
+  if (!state) return;
+  clearHeadTimeout(state);
+  try {
+    state.child.stdin.end();
+  } catch (error) {
+    // The child may already be gone; nothing left to close.
+  }
+}
+
+function startPersistentBackend(backendExePath) {
+  const backendCwd = getBackendWorkingDirectory(backendExePath);
+  appendBackendLog(`SERVE start exe="${backendExePath}" cwd="${backendCwd}"`);
+
+  const child = spawn(backendExePath, ['--serve'], {
+    stdio: ['pipe', 'pipe', 'pipe'],
+    windowsHide: true,
+    cwd: backendCwd
+  });
+
+  const state = {
+    exePath: backendExePath,
+    child,
+    pending: [],
+    buffer: Buffer.alloc(0),
+    // stderr written since the last response, i.e. by the request currently being served.
+    stderr: '',
+    timer: null
+  };
+
+  child.stdout.on('data', (data) => {
+    state.buffer = state.buffer.length ? Buffer.concat([state.buffer, data]) : data;
+    while (state.buffer.length >= FRAME_HEADER_BYTES) {
+      const length = state.buffer.readUInt32BE(0);
+      if (state.buffer.length < FRAME_HEADER_BYTES + length) break;
+      const body = state.buffer.subarray(FRAME_HEADER_BYTES, FRAME_HEADER_BYTES + length);
+      state.buffer = state.buffer.subarray(FRAME_HEADER_BYTES + length);
+      clearHeadTimeout(state);
+      const request = state.pending.shift();
+      const stderr = state.stderr;
+      state.stderr = '';
+      if (request) {
+        request.resolve({ text: body.toString('utf8'), stderr });
+      }
+      armHeadTimeout(state);
+    }
+  });
+
+  child.stderr.on('data', (data) => {
+    const text = data.toString('utf8');
+    state.stderr = (state.stderr + text).slice(-SERVE_STDERR_LIMIT);
+    const cleaned = text.trim();
+    if (cleaned) {
+      appendBackendLog(`SERVE stderr: ${cleaned}`);
+    }
+  });
+
+  child.stdin.on('error', (error) => {
+    appendBackendLog(`SERVE stdin error: ${error.message}`);
+  });
+
+  child.on('error', (error) => {
+    appendBackendLog(
+      `SERVE spawn error exe="${backendExePath}" cwd="${backendCwd}" ` +
+      `code=${error.code || 'UNKNOWN'} message="${error.message}"`
+    );
+    if (persistentBackend === state) persistentBackend = null;
+    failPendingBackendRequests(
+      state,
+      new Error(
+        `Impossible de lancer le backend exécutable (${backendExePath}). ` +
+        `Code=${error.code || 'UNKNOWN'} Message=${error.message}`
+      )
+    );
+  });
+
+  child.on('close', (code) => {
+    appendBackendLog(`SERVE close exit=${code}`);
+    if (persistentBackend === state) persistentBackend = null;
+    const error = new Error(
+      `Backend Python exécutable arrêté (exit ${code}). stderr=${state.stderr.slice(0, 500)}`
+    );
+    error.backendClosed = true;
+    failPendingBackendRequests(state, error);
+  });
+
+  return state;
+}
+
+function getPersistentBackend(backendExePath) {
+  if (persistentBackend && persistentBackend.exePath !== backendExePath) {
+    stopPersistentBackend();
+  }
+  if (!persistentBackend) {
+    persistentBackend = startPersistentBackend(backendExePath);
+  }
+  return persistentBackend;
+}
+
+function runBackendJsonPersistent(backendExePath, requestPayload) {
+  const state = getPersistentBackend(backendExePath);
+  appendBackendLog(`REQ start (serve) exe="${backendExePath}"`);
+
+  return new Promise((resolve, reject) => {
+    state.pending.push({ resolve, reject });
+    armHeadTimeout(state);
+    const body = Buffer.from(JSON.stringify(requestPayload), 'utf8');
+    const header = Buffer.alloc(FRAME_HEADER_BYTES);
+    header.writeUInt32BE(body.length, 0);
+    state.child.stdin.write(Buffer.concat([header, body]));
+  }).then(({ text, stderr }) => {
+    let parsed;
+    try {
+      parsed = text ? JSON.parse(text) : null;
+    } catch (error) {
+      appendBackendLog(`REQ invalid JSON (serve) stdout="${text.slice(0, 800)}"`);
+      throw new Error(`Backend Python exécutable: sortie invalide. stdout=${text.slice(0, 500)}`);
+    }
+
+    validateGeneratorResponse(parsed, stderr, 'serve', 'Backend Python exécutable');
+    appendBackendLog(
+      `REQ success docx="${parsed.docxFilePath || ''}" file="${parsed.docxFileName || ''}"`
+    );
+    return parsed;
+  });
+}
+
+app.on('will-quit', stopPersistentBackend);
+
 function runPythonScriptJsonOnce(pythonBin, scriptPath, payload) {
   return new Promise((resolve, reject) => {
     const child = spawn(pythonBin, [scriptPath], {
@@ -319,13 +499,13 @@ function runCommand(pythonBin, args) {
 async function installPythonDocx(pythonBin, { preferBundledInstall = false } = {}) {
   const attempts = preferBundledInstall
     ? [
-        ['-m', 'pip', 'install', 'python-docx'],
-        ['-m', 'pip', 'install', '--break-system-packages', 'python-docx']
+        ['-m', 'pip', 'install', PYTHON_DOCX_REQUIREMENT],
+        ['-m', 'pip', 'install', '--break-system-packages', PYTHON_DOCX_REQUIREMENT]
       ]
     : [
-        ['-m', 'pip', 'install', '--user', 'python-docx'],
-        ['-m', 'pip', 'install', '--user', '--break-system-packages', 'python-docx'],
-        ['-m', 'pip', 'install', 'python-docx']
+        ['-m', 'pip', 'install', '--user', PYTHON_DOCX_REQUIREMENT],
+        ['-m', 'pip', 'install', '--user', '--break-system-packages', PYTHON_DOCX_REQUIREMENT],
+        ['-m', 'pip', 'install', PYTHON_DOCX_REQUIREMENT]
       ];
 
   let lastError = null;
@@ -395,11 +575,21 @@ async function runWithPythonFallback(relativeScriptPath, payload) {
 async function runPythonJson(relativeScriptPath, payload) {
   const backendExePath = getBackendPath();
   if (fs.existsSync(backendExePath)) {
-    return runBackendJsonOnce(backendExePath, {
+    const request = {
       command: 'generate',
       script: relativeScriptPath,
       payload
-    });
+    };
+    try {
+      return await runBackendJsonPersistent(backendExePath, request);
+    } catch (error) {
+      if (!error.backendClosed) {
+        throw error;
+      }
+      // The long-lived worker died mid-request; retry once with a one-shot process.
+      appendBackendLog(`REQ serve fallback: ${error.message}`);
+      return runBackendJsonOnce(backendExePath, request);
+    }
   }
 
   if (app.isPackaged) {
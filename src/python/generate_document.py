@@ -1,27 +1,129 @@
 #!/usr/bin/env python3
 import calendar
+import copy
+import io
 import json
 import math
 import os
 import re
 import sys
+import zipfile
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None
 
 
 RCAR_RATE = 0.06
 
+_SAFE_FN_RE = re.compile(r"[^0-9A-Za-z._-]+")
+_NON_DIGIT_RE = re.compile(r"\D")
+_DMY_DATE_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+
+# Clark-notation WordprocessingML tags, identical to qn("w:<name>") but built once for the XML helpers.
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_XMLNS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_QN = {
+    name: _W_NS + name
+    for name in (
+        "tblLayout",
+        "tblW",
+        "tblInd",
+        "tblBorders",
+        "tblCellMar",
+        "tcBorders",
+        "tcPr",
+        "sectPr",
+        "top",
+        "left",
+        "bottom",
+        "right",
+        "insideH",
+        "insideV",
+        "val",
+        "sz",
+        "color",
+        "w",
+        "type",
+        "before",
+        "after",
+        "p",
+        "tbl",
+    )
+}
+_TABLE_EDGES = ("top", "left", "bottom", "right", "insideH", "insideV")
+
+# Dotted fill-in lines left blank for handwritten dates and account numbers.
+_DOTS_25 = "." * 25
+_DOTS_35 = "." * 35
+_DOTS_45 = "." * 45
+
+# Fixed bordereau sentences; only the amount in words changes between documents.
+_BORDEREAU_ARRETE_TEMPLATE = (
+    "Arrêté le présent bordereau, comprenant quittances et pièces à la somme total\nde : {words}."
+)
+_BORDEREAU_RENVOI_TEMPLATE = (
+    "Renvoi est fait régisseur désigné ci-dessus du présent bordereau été définitivement à la somme\n"
+    "de : {words}"
+)
+
+# python-docx symbols, bound by _load_docx() on first use so the module stays
+# importable (filename helpers, number formatting) without the dependency.
+Document: Any = None
+Length: Any = None
+Mm: Any = None
+Pt: Any = None
+OxmlElement: Any = None
+parse_xml: Any = None
+WD_ALIGN_PARAGRAPH: Any = None
+WD_ALIGN_VERTICAL: Any = None
+WD_ROW_HEIGHT_RULE: Any = None
+WD_STYLE_TYPE: Any = None
+WD_TABLE_ALIGNMENT: Any = None
+ContentTypesItem: Any = None
+
+
+def _load_docx() -> None:
+    global Document, Length, Mm, Pt, OxmlElement, parse_xml, ContentTypesItem
+    global WD_ALIGN_PARAGRAPH, WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_STYLE_TYPE, WD_TABLE_ALIGNMENT
+    if Document is not None:
+        return
+    try:
+        from docx import Document as document_factory
+        from docx.enum.table import WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT
+        from docx.enum.style import WD_STYLE_TYPE
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.oxml import OxmlElement, parse_xml
+        from docx.shared import Length, Mm, Pt
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+    try:
+        # Private to python-docx; backend/requirements.txt pins the major version it exists in.
+        from docx.opc.pkgwriter import _ContentTypesItem as ContentTypesItem
+    except ImportError as exc:
+        raise RuntimeError("Unsupported python-docx version. Install: python-docx>=1.1.0,<2") from exc
+    Document = document_factory
+
 
 def safe_filename_part(value: Any) -> str:
     text = str(value or "").strip()
     text = text.replace("\\", "-").replace("/", "-")
-    text = re.sub(r"[^0-9A-Za-z._-]+", "_", text)
+    text = _SAFE_FN_RE.sub("_", text)
     text = text.strip("._-")
     return text or "unknown"
 
 
 def ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+    # The output directory usually exists already; one stat() then replaces makedirs' stat + mkdir attempt.
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
 
 
 def parse_input_json() -> Dict[str, Any]:
@@ -29,6 +131,9 @@ def parse_input_json() -> Dict[str, Any]:
     if not raw:
         raise ValueError("No JSON input received on stdin")
     try:
+        # orjson parses the UTF-8 bytes directly, without decoding to str first.
+        if orjson is not None:
+            return orjson.loads(raw)
         return json.loads(raw.decode("utf-8"))
     except Exception as exc:
         raise ValueError(f"Invalid JSON input: {exc}") from exc
@@ -45,6 +150,27 @@ def parse_date(value: Any) -> Optional[date]:
     text = str(value).strip()
     if not text:
         return None
+    return _parse_date_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> Optional[date]:
+    # Birth dates repeat across the documents of a batch; date objects are immutable so caching is safe.
+    if len(text) == 10:
+        # Plain YYYY-MM-DD is what the app sends; build it directly and leave anything odd to fromisoformat.
+        match = _ISO_DATE_RE.fullmatch(text)
+        if match:
+            try:
+                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            except ValueError:
+                return None
+
+    match = _DMY_DATE_RE.match(text)
+    if match:
+        try:
+            return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        except ValueError:
+            return None
 
     if "/" in text:
         parts = [p.strip() for p in text.split("/")]
@@ -76,7 +202,13 @@ def calculate_age_at(birth: Any, ref: date) -> Optional[int]:
 
 
 def round2(value: Any) -> float:
-    return float(f"{float(value or 0):.2f}")
+    # round() is correctly rounded like the "%.2f" format/parse it replaces, without the string trip.
+    return round(float(value or 0), 2)
+
+
+def split_amount(value: Any) -> Tuple[int, int]:
+    # (dirhams, centimes) from the rounded cent count; avoids the floor/subtract float dance.
+    return divmod(int(round(float(value or 0) * 100)), 100)
 
 
 def calculate_igr_deduction(date_naissance: Any, ref_date: date, gross_salary: float, age_limit: int) -> float:
@@ -90,96 +222,128 @@ def calculate_net_salary(date_naissance: Any, ref_date: date, gross_salary: floa
     return round2(float(gross_salary) - calculate_igr_deduction(date_naissance, ref_date, gross_salary, age_limit))
 
 
+@lru_cache(maxsize=256)
+def _monthrange(year: int, month: int) -> int:
+    return calendar.monthrange(year, month)[1]
+
+
 def month_start_end(year: int, month: int) -> Tuple[date, date]:
-    end_day = calendar.monthrange(year, month)[1]
+    end_day = _monthrange(year, month)
     return date(year, month, 1), date(year, month, end_day)
 
 
+@lru_cache(maxsize=128)
+def fmt_ddmmyyyy(year: int, month: int, day: int) -> str:
+    return f"{day:02d}/{month:02d}/{year}"
+
+
+@lru_cache(maxsize=1024)
 def fmt_amount(amount: float) -> str:
+    # Worker amounts repeat (same daily rate x day count), so the cache hit beats re-formatting.
     return f"{float(amount or 0):.2f}"
 
 
 def fmt_amount_receipt(amount: Any) -> str:
-    try:
+    if isinstance(amount, (float, int)):
         value = float(amount or 0)
-    except Exception:
-        value = 0.0
+    else:
+        try:
+            value = float(amount or 0)
+        except Exception:
+            value = 0.0
+    if not value:
+        # -0.0 hashes like 0.0 but formats differently, so keep it out of the cache.
+        return f"{value:.2f}"
+    return _fmt_amount_receipt_cached(value)
+
+
+@lru_cache(maxsize=2048)
+def _fmt_amount_receipt_cached(value: float) -> str:
     return f"{value:,.2f}".replace(",", " ")
 
 
+_UNITS_FR = (
+    "Zero",
+    "Un",
+    "Deux",
+    "Trois",
+    "Quatre",
+    "Cinq",
+    "Six",
+    "Sept",
+    "Huit",
+    "Neuf",
+    "Dix",
+    "Onze",
+    "Douze",
+    "Treize",
+    "Quatorze",
+    "Quinze",
+    "Seize",
+    "Dix Sept",
+    "Dix Huit",
+    "Dix Neuf",
+)
+_TENS_FR = ("", "", "Vingt", "Trente", "Quarante", "Cinquante", "Soixante")
+
+
+def _spell_three_digits_fr(n: int) -> str:
+    hundred, rest = divmod(n, 100)
+    if rest < 20:
+        rest_words = _UNITS_FR[rest]
+    elif rest < 70:
+        ten, unit = divmod(rest, 10)
+        rest_words = _TENS_FR[ten] if unit == 0 else f"{_TENS_FR[ten]} {_UNITS_FR[unit]}"
+    elif rest < 80:
+        rest_words = f"Soixante {_UNITS_FR[rest - 60]}"
+    elif rest == 80:
+        rest_words = "Quatre Vingt"
+    else:
+        rest_words = f"Quatre Vingt {_UNITS_FR[rest - 80]}"
+
+    if hundred == 0:
+        return rest_words
+    hundred_part = "Cent" if hundred == 1 else f"{_UNITS_FR[hundred]} Cent"
+    if rest == 0:
+        return hundred_part
+    return f"{hundred_part} {rest_words}"
+
+
+# Every 0-999 group spelled out once at import, so the millions, thousands and units groups are lookups.
+_FR_0_999 = tuple(_spell_three_digits_fr(n) for n in range(1000))
+
+
+def _three_digits_fr(n: int) -> str:
+    # Millions past 999 (amounts of a billion and more) still go through the arithmetic.
+    return _FR_0_999[n] if n < 1000 else _spell_three_digits_fr(n)
+
+
 def number_to_words_fr(num: float) -> str:
-    whole_part = int(math.floor(float(num or 0)))
-
-    units = [
-        "Zero",
-        "Un",
-        "Deux",
-        "Trois",
-        "Quatre",
-        "Cinq",
-        "Six",
-        "Sept",
-        "Huit",
-        "Neuf",
-        "Dix",
-        "Onze",
-        "Douze",
-        "Treize",
-        "Quatorze",
-        "Quinze",
-        "Seize",
-        "Dix Sept",
-        "Dix Huit",
-        "Dix Neuf",
-    ]
-    tens = ["", "", "Vingt", "Trente", "Quarante", "Cinquante", "Soixante"]
-
-    def two_digits(n: int) -> str:
-        if n < 20:
-            return units[n]
-        if n < 70:
-            ten = n // 10
-            unit = n % 10
-            return tens[ten] if unit == 0 else f"{tens[ten]} {units[unit]}"
-        if n < 80:
-            return f"Soixante {two_digits(n - 60)}"
-        if n == 80:
-            return "Quatre Vingt"
-        return f"Quatre Vingt {two_digits(n - 80)}"
-
-    def three_digits(n: int) -> str:
-        hundred = n // 100
-        rest = n % 100
-        if hundred == 0:
-            hundred_part = ""
-        elif hundred == 1:
-            hundred_part = "Cent"
-        else:
-            hundred_part = f"{units[hundred]} Cent"
+    # Only the integer part is spelled out, so it is the natural cache key.
+    return _int_to_words_fr(int(math.floor(float(num or 0))))
 
-        if rest == 0:
-            return hundred_part
-        if not hundred_part:
-            return two_digits(rest)
-        return f"{hundred_part} {two_digits(rest)}"
 
-    def to_words(n: int) -> str:
-        if n == 0:
-            return "Zero"
-        parts: List[str] = []
-        millions = n // 1_000_000
-        thousands = (n % 1_000_000) // 1000
-        rest = n % 1000
+@lru_cache(maxsize=2048)
+def _int_to_words_fr(n: int) -> str:
+    if n == 0:
+        return "Zero"
 
-        if millions > 0:
-            parts.append(f"{three_digits(millions)} Million" + ("s" if millions > 1 else ""))
-        if thousands > 0:
-            parts.append("Mille" if thousands == 1 else f"{three_digits(thousands)} Mille")
-        if rest > 0:
-            parts.append(three_digits(rest))
-        return " ".join(parts)
+    millions = n // 1_000_000
+    thousands = (n % 1_000_000) // 1000
+    rest = n % 1000
+    parts: List[str] = []
+    if millions > 0:
+        parts.append(f"{_three_digits_fr(millions)} Million" + ("s" if millions > 1 else ""))
+    if thousands > 0:
+        parts.append("Mille" if thousands == 1 else f"{_three_digits_fr(thousands)} Mille")
+    if rest > 0:
+        parts.append(_three_digits_fr(rest))
+    return " ".join(parts)
 
-    return to_words(whole_part)
+
+@lru_cache(maxsize=256)
+def _amount_words_upper(whole_part: int, cents: int) -> str:
+    return f"{_int_to_words_fr(whole_part).upper()} DHS {cents:02d} CTS"
 
 
 DOC_FILE_BASE_MAP = {
@@ -211,41 +375,68 @@ DOC_TITLE_MAP = {
 }
 
 
+class WorkerRow(NamedTuple):
+    nom_prenom: str
+    cin: str
+    type: str
+    days: int
+    gross: float
+    deduction: float
+    net: float
+
+
 def build_workers_financial_rows(
     report_rows: List[Dict[str, Any]],
     ref_date: date,
     age_limit: int,
-) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
-    rows_out: List[Dict[str, Any]] = []
-    totals = {"days": 0.0, "gross": 0.0, "deduction": 0.0, "net": 0.0}
-
+) -> Tuple[List[WorkerRow], Dict[str, float]]:
+    if not report_rows:
+        return [], {"days": 0.0, "gross": 0.0, "deduction": 0.0, "net": 0.0}
+
+    rows_out: List[WorkerRow] = []
+    days_total = gross_total = deduction_total = net_total = 0.0
+    # Same rule as calculate_igr_deduction: age <= limit exactly when the birth date falls after the
+    # same calendar day (limit + 1) years before ref_date, so one tuple compare replaces the age math.
+    limit = int(age_limit)
+    rate = RCAR_RATE
+    cutoff = (ref_date.year - limit - 1, ref_date.month, ref_date.day)
+
+    # Single pass over the report: each worker dict is read once, through a bound get.
     for w in report_rows:
-        days = int(w.get("days_worked") or w.get("total_days") or 0)
-        gross = float(w.get("amount") or w.get("total_amount") or 0.0)
+        get = w.get
+        days = int(get("days_worked") or get("total_days") or 0)
+        gross = float(get("amount") or get("total_amount") or 0.0)
         if days <= 0 or gross <= 0:
             continue
 
-        deduction = calculate_igr_deduction(w.get("date_naissance"), ref_date, gross, age_limit)
+        b = parse_date(get("date_naissance"))
+        deduction = round2(gross * rate) if b is None or (b.year, b.month, b.day) > cutoff else 0.0
         net = round2(gross - deduction)
 
-        totals["days"] += days
-        totals["gross"] += gross
-        totals["deduction"] += deduction
-        totals["net"] += net
+        days_total += days
+        gross_total += gross
+        deduction_total += deduction
+        net_total += net
 
         rows_out.append(
-            {
-                "nom_prenom": str(w.get("nom_prenom") or ""),
-                "cin": str(w.get("cin") or ""),
-                "type": str(w.get("type") or ""),
-                "days": days,
-                "gross": round2(gross),
-                "deduction": round2(deduction),
-                "net": round2(net),
-            }
+            WorkerRow(
+                str(get("nom_prenom") or ""),
+                str(get("cin") or ""),
+                str(get("type") or ""),
+                days,
+                round2(gross),
+                # Already rounded above; round() to 2 places is idempotent.
+                deduction,
+                net,
+            )
         )
 
-    totals = {k: round2(v) for k, v in totals.items()}
+    totals = {
+        "days": round2(days_total),
+        "gross": round2(gross_total),
+        "deduction": round2(deduction_total),
+        "net": round2(net_total),
+    }
     return rows_out, totals
 
 
@@ -266,7 +457,7 @@ def build_docx_filename(document_type: str, payload: Dict[str, Any]) -> str:
         months = ((payload.get("report") or {}).get("period") or {}).get("months") or []
         if months:
             period_from = date(int(year), int(months[0]), 1)
-            period_to = date(int(year), int(months[-1]), calendar.monthrange(int(year), int(months[-1]))[1])
+            period_to = date(int(year), int(months[-1]), _monthrange(int(year), int(months[-1])))
         else:
             period_from = date(int(year), 1, 1)
             period_to = date(int(year), 1, 1)
@@ -282,8 +473,6 @@ def build_docx_filename(document_type: str, payload: Dict[str, Any]) -> str:
 
 
 def set_page_margins(section, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
-    from docx.shared import Mm
-
     section.top_margin = Mm(top_mm)
     section.bottom_margin = Mm(bottom_mm)
     section.left_margin = Mm(left_mm)
@@ -291,17 +480,12 @@ def set_page_margins(section, *, top_mm: float, bottom_mm: float, left_mm: float
 
 
 def set_default_font(doc, *, font_name: str, font_size_pt: float) -> None:
-    from docx.shared import Pt
-
     normal = doc.styles["Normal"]
     normal.font.name = font_name
     normal.font.size = Pt(font_size_pt)
 
 
 def add_centered_title(doc, text: str, *, font_size_pt: float) -> None:
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.shared import Pt
-
     p = doc.add_paragraph()
     p.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = p.add_run(text)
@@ -309,20 +493,62 @@ def add_centered_title(doc, text: str, *, font_size_pt: float) -> None:
     run.font.size = Pt(font_size_pt)
 
 
-def add_table_with_widths(doc, *, cols: int, col_widths_mm: List[float]):
-    from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.shared import Mm
+@lru_cache(maxsize=256)
+def _mm_widths(widths_mm: Tuple[float, ...]) -> Tuple[Any, ...]:
+    return tuple(Mm(w) for w in widths_mm)
+
 
+def add_table_with_widths(doc, *, cols: int, col_widths_mm: Sequence[Any]):
+    # Widths are either millimetres or lengths already built by _mm_widths().
+    if col_widths_mm and not isinstance(col_widths_mm[0], Length):
+        col_widths_mm = _mm_widths(tuple(col_widths_mm))
     t = doc.add_table(rows=1, cols=cols)
     t.alignment = WD_TABLE_ALIGNMENT.CENTER
     t.style = "Table Grid"
     t.autofit = False
-    for i, w in enumerate(col_widths_mm):
-        if i < len(t.columns):
-            t.columns[i].width = Mm(w)
+    for column, width in zip(t.columns, col_widths_mm):
+        column.width = width
     return t
 
 
+# Blank A4 documents with margins and default font applied, keyed by those settings. Copying a
+# prototype is several times cheaper than Document() re-reading and parsing the bundled template.
+_DOCUMENT_PROTOTYPES: Dict[Tuple[float, float, float, float, str, float], Any] = {}
+
+
+def set_column_widths(table, col_widths_mm: Sequence[float]) -> None:
+    # row.cells rebuilds the row's whole cell list on every access, so read it once per row
+    # instead of once per (row, column).
+    widths = _mm_widths(tuple(col_widths_mm))
+    for column, width in zip(table.columns, widths):
+        column.width = width
+    for row in table.rows:
+        for cell, width in zip(row.cells, widths):
+            cell.width = width
+
+
+def new_a4_document(
+    *,
+    top_mm: float,
+    bottom_mm: float,
+    left_mm: float,
+    right_mm: float,
+    font_size_pt: float,
+    font_name: str = "Times New Roman",
+):
+    key = (top_mm, bottom_mm, left_mm, right_mm, font_name, font_size_pt)
+    prototype = _DOCUMENT_PROTOTYPES.get(key)
+    if prototype is None:
+        prototype = Document()
+        section0 = prototype.sections[0]
+        section0.page_width = Mm(210)
+        section0.page_height = Mm(297)
+        set_page_margins(section0, top_mm=top_mm, bottom_mm=bottom_mm, left_mm=left_mm, right_mm=right_mm)
+        set_default_font(prototype, font_name=font_name, font_size_pt=font_size_pt)
+        _DOCUMENT_PROTOTYPES[key] = prototype
+    return copy.deepcopy(prototype)
+
+
 def first_paragraph(doc):
     # python-docx creates an empty paragraph by default; reuse it to avoid an extra blank line at the top.
     try:
@@ -347,33 +573,132 @@ def remove_leading_empty_paragraph(doc) -> None:
     except Exception:
         return
 
+
+def add_standard_header(doc, *, province: str, commune: str, space_after_pt: float) -> None:
+    # Top-left administrative header shared by the receipt and payment documents.
+    p = first_paragraph(doc)
+    p.text = ""
+    p.paragraph_format.space_before = Pt(0)
+    p.paragraph_format.space_after = Pt(space_after_pt)
+    size = Pt(10)
+    r1 = p.add_run("ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\n")
+    r1.bold = True
+    r1.font.size = size
+    r2 = p.add_run(f"PROVINCE DE {province}\n")
+    r2.bold = True
+    r2.font.size = size
+    r3 = p.add_run(f"COMMUNE {commune}")
+    r3.bold = True
+    r3.underline = True
+    r3.font.size = size
+
+
+def fast_add_row(table, values: Sequence[Any], *, font_size_pt: float, height: Any = None) -> None:
+    # Appends a top-aligned, left-justified data row straight to the table XML. It produces the same
+    # markup as table.add_row() + per-cell formatting without python-docx's row/cell/paragraph proxies.
+    tr = OxmlElement("w:tr")
+    if height is not None:
+        tr_pr = OxmlElement("w:trPr")
+        tr_pr.append(OxmlElement("w:trHeight", attrs={_QN["val"]: str(height.twips)}))
+        tr.append(tr_pr)
+    size = str(int(round(font_size_pt * 2)))
+    for grid_col, value in zip(table._tbl.tblGrid.gridCol_lst, values):
+        tc = OxmlElement("w:tc")
+        tc_pr = OxmlElement("w:tcPr")
+        tc_pr.append(OxmlElement("w:tcW", attrs={_QN["type"]: "dxa", _QN["w"]: str(grid_col.w.twips)}))
+        tc_pr.append(OxmlElement("w:vAlign", attrs={_QN["val"]: "top"}))
+        tc.append(tc_pr)
+        p = OxmlElement("w:p")
+        p_pr = OxmlElement("w:pPr")
+        p_pr.append(OxmlElement("w:spacing", attrs={_QN["before"]: "0", _QN["after"]: "0"}))
+        p_pr.append(OxmlElement("w:jc", attrs={_QN["val"]: "left"}))
+        p.append(p_pr)
+        r = OxmlElement("w:r")
+        r_pr = OxmlElement("w:rPr")
+        r_pr.append(OxmlElement("w:sz", attrs={_QN["val"]: size}))
+        r.append(r_pr)
+        r.text = str(value)
+        p.append(r)
+        tc.append(p)
+        tr.append(tc)
+    table._tbl.append(tr)
+
+
 def remove_docx_table_borders(table) -> None:
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
+    remove_tbl_pr_borders(table._tbl.tblPr)
 
-    tbl_pr = table._tbl.tblPr
-    tbl_borders = tbl_pr.find(qn("w:tblBorders"))
+
+def remove_tbl_pr_borders(tbl_pr) -> None:
+    tbl_borders = tbl_pr.find(_QN["tblBorders"])
     if tbl_borders is None:
         tbl_borders = OxmlElement("w:tblBorders")
         tbl_pr.append(tbl_borders)
-    for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
-        element = tbl_borders.find(qn(f"w:{edge}"))
+    val = _QN["val"]
+    for edge in _TABLE_EDGES:
+        element = tbl_borders.find(_QN[edge])
         if element is None:
-            element = OxmlElement(f"w:{edge}")
+            element = OxmlElement("w:" + edge)
             tbl_borders.append(element)
-        element.set(qn("w:val"), "nil")
+        element.set(val, "nil")
+
+
+# Fresh tables have no tblBorders/tblCellMar yet; parsing one fragment lets libxml2 build
+# the whole block instead of one OxmlElement + set() round-trip per edge.
+@lru_cache(maxsize=None)
+def _tbl_borders_xml(sz: int) -> str:
+    edges = "".join(f'<w:{edge} w:val="single" w:sz="{sz}" w:color="000000"/>' for edge in _TABLE_EDGES)
+    return f"<w:tblBorders {_W_XMLNS}>{edges}</w:tblBorders>"
+
+
+@lru_cache(maxsize=None)
+def _tbl_cell_mar_xml(top: int, bottom: int, left: int, right: int) -> str:
+    return (
+        f"<w:tblCellMar {_W_XMLNS}>"
+        f'<w:top w:w="{top}" w:type="dxa"/>'
+        f'<w:bottom w:w="{bottom}" w:type="dxa"/>'
+        f'<w:left w:w="{left}" w:type="dxa"/>'
+        f'<w:right w:w="{right}" w:type="dxa"/>'
+        "</w:tblCellMar>"
+    )
 
 
-def generate_recu_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+def write_docx_package(doc, stream: Any) -> None:
+    # Same members, in the same order, as OpcPackage.save(), but deflated at level 1 through our
+    # own ZipFile: python-docx always uses level 6, and level 1 roughly halves the save time of
+    # our few-tens-of-KB packages for a slightly larger file. Also used by generate_role.
+    _load_docx()
+    package = doc.part.package
+    parts = list(package.iter_parts())
+    for part in parts:
+        part.before_marshal()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("[Content_Types].xml", ContentTypesItem.from_parts(parts).blob)
+        zf.writestr("_rels/.rels", package.rels.xml)
+        for part in parts:
+            zf.writestr(part.partname.membername, part.blob)
+            if len(part.rels):
+                zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+
+def save_docx(doc, target: Any) -> None:
+    # A stream (e.g. a BytesIO for callers that want the bytes) is written directly.
+    if hasattr(target, "write"):
+        write_docx_package(doc, target)
+        return
+    # Serialize in memory and hand the file system one write instead of zipfile's many small ones.
+    # Parts are serialized and deflated one at a time, so the buffer only ever holds the
+    # compressed package (tens of KB here), never the whole uncompressed XML.
+    buf = io.BytesIO()
+    write_docx_package(doc, buf)
+    with open(target, "wb") as f:
+        f.write(buf.getbuffer())
 
-    document_type = str(payload.get("documentType") or "").strip()
+
+def generate_recu_docx(payload: Dict[str, Any], docx_path: str, *, document_type: Optional[str] = None) -> None:
+    _load_docx()
+
+    if document_type is None:
+        document_type = str(payload.get("documentType") or "").strip()
     if document_type != "recu-combined":
         raise ValueError(f"Unsupported document type for recu generator: {document_type}")
 
@@ -392,11 +717,8 @@ def generate_recu_docx(payload: Dict[str, Any], docx_path: str) -> None:
     total_net = round2(totals.get("net") or 0)
 
     amount_digits = fmt_amount_receipt(total_net)
-    words = number_to_words_fr(total_net)
-    whole_part = int(math.floor(float(total_net or 0)))
-    cents = int(round((float(total_net or 0) - float(whole_part)) * 100.0))
-    cents_str = str(cents).rjust(2, "0")
-    amount_words = f"{words} dhs {cents_str} Cts"
+    whole_part, cents = split_amount(total_net)
+    amount_words = f"{number_to_words_fr(whole_part)} dhs {cents:02d} Cts"
 
     regisseur_name = str(options.get("regisseurName") or "MAJDA TAKNOUTI")
     regisseur_cin = str(options.get("regisseurCin") or "I 528862")
@@ -405,28 +727,10 @@ def generate_recu_docx(payload: Dict[str, Any], docx_path: str) -> None:
     commune = str(options.get("communeName") or "OULED NACEUR")
     city = str(options.get("cityName") or "Ouled Naceur")
 
-    doc = Document()
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=15, bottom_mm=15, left_mm=20, right_mm=20)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=11)
+    doc = new_a4_document(top_mm=15, bottom_mm=15, left_mm=20, right_mm=20, font_size_pt=11)
 
     # Header (top-left)
-    p_header = first_paragraph(doc)
-    p_header.text = ""
-    p_header.paragraph_format.space_before = Pt(0)
-    p_header.paragraph_format.space_after = Pt(60)
-    r1 = p_header.add_run("ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\n")
-    r1.bold = True
-    r1.font.size = Pt(10)
-    r2 = p_header.add_run(f"PROVINCE DE {province}\n")
-    r2.bold = True
-    r2.font.size = Pt(10)
-    r3 = p_header.add_run(f"COMMUNE {commune}")
-    r3.bold = True
-    r3.underline = True
-    r3.font.size = Pt(10)
+    add_standard_header(doc, province=province, commune=commune, space_after_pt=60)
 
     # Title (center)
     p_title = doc.add_paragraph()
@@ -468,21 +772,26 @@ def generate_recu_docx(payload: Dict[str, Any], docx_path: str) -> None:
     p3.alignment = WD_ALIGN_PARAGRAPH.CENTER
     p3.paragraph_format.space_before = Pt(6)
     p3.paragraph_format.space_after = Pt(18)
-    p3.add_run(f"{city} Le : " + "." * 45)
+    p3.add_run(f"{city} Le : " + _DOTS_45)
 
     # Signatures (top part)
     usable_w_mm = 210 - 20 - 20
-    sig = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.5, usable_w_mm * 0.5])
+    half_widths = _mm_widths((usable_w_mm * 0.5, usable_w_mm * 0.5))
+    sig = add_table_with_widths(doc, cols=2, col_widths_mm=half_widths)
     sig.alignment = WD_TABLE_ALIGNMENT.CENTER
     remove_docx_table_borders(sig)
-    for cell in sig.rows[0].cells:
+    sig_cells = sig.rows[0].cells
+    for cell in sig_cells:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
-    sig.rows[0].cells[0].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.LEFT
-    sig.rows[0].cells[0].paragraphs[0].add_run("Percepteur de souk sebt")
-    sig.rows[0].cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    sig.rows[0].cells[1].paragraphs[0].add_run("Le Régisseur")
+        fmt = cell.paragraphs[0].paragraph_format
+        fmt.space_before = Pt(0)
+        fmt.space_after = Pt(0)
+    p_left = sig_cells[0].paragraphs[0]
+    p_left.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    p_left.add_run("Percepteur de souk sebt")
+    p_right = sig_cells[1].paragraphs[0]
+    p_right.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p_right.add_run("Le Régisseur")
 
     gap = doc.add_paragraph()
     gap.paragraph_format.space_before = Pt(0)
@@ -527,33 +836,32 @@ def generate_recu_docx(payload: Dict[str, Any], docx_path: str) -> None:
     p8.alignment = WD_ALIGN_PARAGRAPH.CENTER
     p8.paragraph_format.space_before = Pt(0)
     p8.paragraph_format.space_after = Pt(18)
-    p8.add_run(f"A {city} le : " + "." * 25)
+    p8.add_run(f"A {city} le : " + _DOTS_25)
 
-    sig2 = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.5, usable_w_mm * 0.5])
+    sig2 = add_table_with_widths(doc, cols=2, col_widths_mm=half_widths)
     sig2.alignment = WD_TABLE_ALIGNMENT.CENTER
     remove_docx_table_borders(sig2)
-    for cell in sig2.rows[0].cells:
+    sig2_cells = sig2.rows[0].cells
+    for cell in sig2_cells:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
-    sig2.rows[0].cells[0].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.LEFT
-    sig2.rows[0].cells[0].paragraphs[0].add_run("Visa du Président")
-    sig2.rows[0].cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    sig2.rows[0].cells[1].paragraphs[0].add_run("Le Régisseur de dépenses")
+        fmt = cell.paragraphs[0].paragraph_format
+        fmt.space_before = Pt(0)
+        fmt.space_after = Pt(0)
+    p_left = sig2_cells[0].paragraphs[0]
+    p_left.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    p_left.add_run("Visa du Président")
+    p_right = sig2_cells[1].paragraphs[0]
+    p_right.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p_right.add_run("Le Régisseur de dépenses")
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
 
 
-def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str, *, document_type: Optional[str] = None) -> None:
+    _load_docx()
 
-    document_type = str(payload.get("documentType") or "").strip()
+    if document_type is None:
+        document_type = str(payload.get("documentType") or "").strip()
     if document_type != "demande-autorisation":
         raise ValueError(f"Unsupported document type for demande-autorisation generator: {document_type}")
 
@@ -572,11 +880,8 @@ def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str)
     total_net = round2(totals.get("net") or 0)
 
     amount_digits = fmt_amount_receipt(total_net)
-    words = number_to_words_fr(total_net)
-    whole_part = int(math.floor(float(total_net or 0)))
-    cents = int(round((float(total_net or 0) - float(whole_part)) * 100.0))
-    cents_str = str(cents).rjust(2, "0")
-    amount_words = f"{words} dhs {cents_str} Cts"
+    whole_part, cents = split_amount(total_net)
+    amount_words = f"{number_to_words_fr(whole_part)} dhs {cents:02d} Cts"
 
     chap = str(options.get("chap") or "10").strip()
     art = str(options.get("art") or "20").strip()
@@ -589,28 +894,10 @@ def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str)
     commune = str(options.get("communeName") or "OULED NACEUR")
     city = str(options.get("cityName") or "Ouled Naceur")
 
-    doc = Document()
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=20, bottom_mm=20, left_mm=20, right_mm=20)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=11)
+    doc = new_a4_document(top_mm=20, bottom_mm=20, left_mm=20, right_mm=20, font_size_pt=11)
 
     # Header (top-left)
-    p_header = first_paragraph(doc)
-    p_header.text = ""
-    p_header.paragraph_format.space_before = Pt(0)
-    p_header.paragraph_format.space_after = Pt(18)
-    rh1 = p_header.add_run("ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\n")
-    rh1.bold = True
-    rh1.font.size = Pt(10)
-    rh2 = p_header.add_run(f"PROVINCE DE {province}\n")
-    rh2.bold = True
-    rh2.font.size = Pt(10)
-    rh3 = p_header.add_run(f"COMMUNE {commune}")
-    rh3.bold = True
-    rh3.underline = True
-    rh3.font.size = Pt(10)
+    add_standard_header(doc, province=province, commune=commune, space_after_pt=18)
 
     # Title (center)
     p_title = doc.add_paragraph()
@@ -671,28 +958,18 @@ def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str)
     hdr = table.rows[0]
     for cell in hdr.cells:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
-    for i, text in enumerate(headers):
-        p = hdr.cells[i].paragraphs[0]
+        fmt = cell.paragraphs[0].paragraph_format
+        fmt.space_before = Pt(0)
+        fmt.space_after = Pt(0)
+    for cell, text in zip(hdr.cells, headers):
+        p = cell.paragraphs[0]
         p.alignment = WD_ALIGN_PARAGRAPH.LEFT
         r = p.add_run(text)
         r.bold = True
         r.font.size = Pt(9)
 
-    row = table.add_row()
-    row.height = Mm(35)
-    for cell in row.cells:
-        cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
-
     values = [chap, art, prog, proj, ligne, "Salaire du personnel\noccasionnel", amount_digits]
-    for i, value in enumerate(values):
-        p = row.cells[i].paragraphs[0]
-        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        r = p.add_run(str(value))
-        r.font.size = Pt(10)
+    fast_add_row(table, values, font_size_pt=10, height=Mm(35))
 
     doc.add_paragraph().paragraph_format.space_after = Pt(10)
 
@@ -700,7 +977,7 @@ def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str)
     p3.paragraph_format.space_before = Pt(0)
     p3.paragraph_format.space_after = Pt(12)
 
-    p4 = doc.add_paragraph(f"A {city} Le : " + "." * 35)
+    p4 = doc.add_paragraph(f"A {city} Le : " + _DOTS_35)
     p4.alignment = WD_ALIGN_PARAGRAPH.CENTER
     p4.paragraph_format.space_before = Pt(0)
     p4.paragraph_format.space_after = Pt(24)
@@ -709,27 +986,27 @@ def generate_demande_autorisation_docx(payload: Dict[str, Any], docx_path: str)
     sig = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.5, usable_w_mm * 0.5])
     sig.alignment = WD_TABLE_ALIGNMENT.CENTER
     remove_docx_table_borders(sig)
-    for cell in sig.rows[0].cells:
+    sig_cells = sig.rows[0].cells
+    for cell in sig_cells:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
-    sig.rows[0].cells[0].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    sig.rows[0].cells[0].paragraphs[0].add_run("Le Président")
-    sig.rows[0].cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    sig.rows[0].cells[1].paragraphs[0].add_run("Le régisseur")
+        fmt = cell.paragraphs[0].paragraph_format
+        fmt.space_before = Pt(0)
+        fmt.space_after = Pt(0)
+    p_left = sig_cells[0].paragraphs[0]
+    p_left.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p_left.add_run("Le Président")
+    p_right = sig_cells[1].paragraphs[0]
+    p_right.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p_right.add_run("Le régisseur")
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
 
 
-def generate_certificat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+def generate_certificat_paiement_docx(payload: Dict[str, Any], docx_path: str, *, document_type: Optional[str] = None) -> None:
+    _load_docx()
 
-    document_type = str(payload.get("documentType") or "").strip()
+    if document_type is None:
+        document_type = str(payload.get("documentType") or "").strip()
     if document_type not in ("certificat-paiement", "certificat-paiement-combined"):
         raise ValueError(f"Unsupported document type for certificat-paiement generator: {document_type}")
 
@@ -748,11 +1025,8 @@ def generate_certificat_paiement_docx(payload: Dict[str, Any], docx_path: str) -
     total_net = round2(totals.get("net") or 0)
 
     amount_digits = fmt_amount_receipt(total_net)
-    words = number_to_words_fr(total_net)
-    whole_part = int(math.floor(float(total_net or 0)))
-    cents = int(round((float(total_net or 0) - float(whole_part)) * 100.0))
-    cents_str = str(cents).rjust(2, "0")
-    amount_words = f"{words} dhs {cents_str} Cts"
+    whole_part, cents = split_amount(total_net)
+    amount_words = f"{number_to_words_fr(whole_part)} dhs {cents:02d} Cts"
 
     regisseur_name = str(options.get("regisseurName") or "MAJDA TAKNOUTI").strip() or "MAJDA TAKNOUTI"
     decision_number = str(options.get("decisionNumber") or "").strip()
@@ -775,28 +1049,10 @@ def generate_certificat_paiement_docx(payload: Dict[str, Any], docx_path: str) -
     commune = str(options.get("communeName") or "OULED NACEUR")
     city = str(options.get("cityName") or "Ouled Naceur")
 
-    doc = Document()
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=20, bottom_mm=20, left_mm=20, right_mm=20)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=11)
+    doc = new_a4_document(top_mm=20, bottom_mm=20, left_mm=20, right_mm=20, font_size_pt=11)
 
     # Header (top-left)
-    p_header = first_paragraph(doc)
-    p_header.text = ""
-    p_header.paragraph_format.space_before = Pt(0)
-    p_header.paragraph_format.space_after = Pt(28)
-    r1 = p_header.add_run("ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\n")
-    r1.bold = True
-    r1.font.size = Pt(10)
-    r2 = p_header.add_run(f"PROVINCE DE {province}\n")
-    r2.bold = True
-    r2.font.size = Pt(10)
-    r3 = p_header.add_run(f"COMMUNE {commune}")
-    r3.bold = True
-    r3.underline = True
-    r3.font.size = Pt(10)
+    add_standard_header(doc, province=province, commune=commune, space_after_pt=28)
 
     # Title (centered, underlined)
     p_title = doc.add_paragraph()
@@ -845,18 +1101,14 @@ def generate_certificat_paiement_docx(payload: Dict[str, Any], docx_path: str) -
     p_sig.paragraph_format.space_after = Pt(0)
     p_sig.add_run("Le Président")
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
 
 
-def generate_ordre_paiement_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+def generate_ordre_paiement_docx(payload: Dict[str, Any], docx_path: str, *, document_type: Optional[str] = None) -> None:
+    _load_docx()
 
-    document_type = str(payload.get("documentType") or "").strip()
+    if document_type is None:
+        document_type = str(payload.get("documentType") or "").strip()
     if document_type != "ordre-paiement":
         raise ValueError(f"Unsupported document type for ordre-paiement generator: {document_type}")
 
@@ -875,11 +1127,8 @@ def generate_ordre_paiement_docx(payload: Dict[str, Any], docx_path: str) -> Non
     total_net = round2(totals.get("net") or 0)
 
     amount_digits = fmt_amount_receipt(total_net)
-    words = number_to_words_fr(total_net)
-    whole_part = int(math.floor(float(total_net or 0)))
-    cents = int(round((float(total_net or 0) - float(whole_part)) * 100.0))
-    cents_str = str(cents).rjust(2, "0")
-    amount_words = f"{words} dhs {cents_str} Cts"
+    whole_part, cents = split_amount(total_net)
+    amount_words = f"{number_to_words_fr(whole_part)} dhs {cents:02d} Cts"
 
     chap = str(options.get("chap") or "10").strip()
     art = str(options.get("art") or "20").strip()
@@ -893,33 +1142,13 @@ def generate_ordre_paiement_docx(payload: Dict[str, Any], docx_path: str) -> Non
     commune = str(options.get("communeName") or "OULED NACEUR")
     city = str(options.get("cityName") or "Ouled Naceur")
 
-    period_from = date(year, month, 1)
-    period_to = end_date
-    period_from_s = f"{period_from.day:02d}/{period_from.month:02d}/{period_from.year}"
-    period_to_s = f"{period_to.day:02d}/{period_to.month:02d}/{period_to.year}"
+    period_from_s = fmt_ddmmyyyy(year, month, 1)
+    period_to_s = fmt_ddmmyyyy(end_date.year, end_date.month, end_date.day)
 
-    doc = Document()
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=20, bottom_mm=20, left_mm=20, right_mm=20)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=11)
+    doc = new_a4_document(top_mm=20, bottom_mm=20, left_mm=20, right_mm=20, font_size_pt=11)
 
     # Header (top-left)
-    p_header = first_paragraph(doc)
-    p_header.text = ""
-    p_header.paragraph_format.space_before = Pt(0)
-    p_header.paragraph_format.space_after = Pt(55)
-    r1 = p_header.add_run("ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\n")
-    r1.bold = True
-    r1.font.size = Pt(10)
-    r2 = p_header.add_run(f"PROVINCE DE {province}\n")
-    r2.bold = True
-    r2.font.size = Pt(10)
-    r3 = p_header.add_run(f"COMMUNE {commune}")
-    r3.bold = True
-    r3.underline = True
-    r3.font.size = Pt(10)
+    add_standard_header(doc, province=province, commune=commune, space_after_pt=55)
 
     # Title
     p_title = doc.add_paragraph()
@@ -970,19 +1199,14 @@ def generate_ordre_paiement_docx(payload: Dict[str, Any], docx_path: str) -> Non
     p_sig.paragraph_format.space_before = Pt(0)
     p_sig.paragraph_format.space_after = Pt(0)
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
 
 
-def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str, *, document_type: Optional[str] = None) -> None:
+    _load_docx()
 
-    document_type = str(payload.get("documentType") or "").strip()
+    if document_type is None:
+        document_type = str(payload.get("documentType") or "").strip()
     if document_type != "mandat-paiement":
         raise ValueError(f"Unsupported document type for mandat-paiement generator: {document_type}")
 
@@ -1001,11 +1225,8 @@ def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> No
     total_net = round2(totals.get("net") or 0)
 
     amount_digits = fmt_amount_receipt(total_net)
-    words = number_to_words_fr(total_net)
-    whole_part = int(math.floor(float(total_net or 0)))
-    cents = int(round((float(total_net or 0) - float(whole_part)) * 100.0))
-    cents_str = str(cents).rjust(2, "0")
-    amount_words = f"{words} dhs {cents_str} Cts"
+    whole_part, cents = split_amount(total_net)
+    amount_words = f"{number_to_words_fr(whole_part)} dhs {cents:02d} Cts"
 
     exercise_year = str(options.get("exerciseYear") or year).strip() or str(year)
     mandat_number = str(options.get("mandatNumber") or f"{month}/{year}").strip()
@@ -1023,18 +1244,11 @@ def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> No
     commune = str(options.get("communeName") or "OULED NACEUR")
     city = str(options.get("cityName") or "Ouled Naceur")
 
-    period_from = date(year, month, 1)
-    period_to = end_date
-    period_from_s = f"{period_from.day:02d}/{period_from.month:02d}/{period_from.year}"
-    period_to_s = f"{period_to.day:02d}/{period_to.month:02d}/{period_to.year}"
+    period_from_s = fmt_ddmmyyyy(year, month, 1)
+    period_to_s = fmt_ddmmyyyy(end_date.year, end_date.month, end_date.day)
 
-    doc = Document()
+    doc = new_a4_document(top_mm=20, bottom_mm=20, left_mm=20, right_mm=15, font_size_pt=11)
     remove_leading_empty_paragraph(doc)
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=20, bottom_mm=20, left_mm=20, right_mm=15)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=11)
 
     usable_w_mm = 210 - 20 - 15
 
@@ -1044,36 +1258,29 @@ def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> No
     header_tbl.autofit = False
     remove_docx_table_borders(header_tbl)
 
-    for cell in header_tbl.rows[0].cells:
+    header_cells = header_tbl.rows[0].cells
+    for cell in header_cells:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
+        fmt = cell.paragraphs[0].paragraph_format
+        fmt.space_before = Pt(0)
+        fmt.space_after = Pt(0)
 
-    c_left = header_tbl.rows[0].cells[0]
+    c_left = header_cells[0]
     c_left.text = ""
     p_left = c_left.paragraphs[0]
     p_left.paragraph_format.space_before = Pt(0)
     p_left.paragraph_format.space_after = Pt(0)
     p_left.paragraph_format.line_spacing = 1.0
 
-    r = p_left.add_run("ROYAUME DU MAROC")
+    r = p_left.add_run(f"ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\nPROVINCE DE {province}\n")
     r.bold = True
     r.font.size = Pt(10)
-    r.add_break()
-    r2 = p_left.add_run("MINISTERE DE L'INTERIEUR")
+    r2 = p_left.add_run(f"COMMUNE {commune}")
     r2.bold = True
+    r2.underline = True
     r2.font.size = Pt(10)
-    r2.add_break()
-    r3 = p_left.add_run(f"PROVINCE DE {province}")
-    r3.bold = True
-    r3.font.size = Pt(10)
-    r3.add_break()
-    r4 = p_left.add_run(f"COMMUNE {commune}")
-    r4.bold = True
-    r4.underline = True
-    r4.font.size = Pt(10)
-
-    c_right = header_tbl.rows[0].cells[1]
+
+    c_right = header_cells[1]
     c_right.text = ""
     p_right = c_right.paragraphs[0]
     p_right.alignment = WD_ALIGN_PARAGRAPH.RIGHT
@@ -1134,8 +1341,7 @@ def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> No
     ]
     hdr = table.rows[0]
     hdr.height = Mm(8)
-    for i, text in enumerate(headers):
-        cell = hdr.cells[i]
+    for cell, text in zip(hdr.cells, headers):
         cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
         p = cell.paragraphs[0]
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -1150,8 +1356,9 @@ def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> No
     row.height = Mm(50)
     for cell in row.cells:
         cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-        cell.paragraphs[0].paragraph_format.space_before = Pt(0)
-        cell.paragraphs[0].paragraph_format.space_after = Pt(0)
+        fmt = cell.paragraphs[0].paragraph_format
+        fmt.space_before = Pt(0)
+        fmt.space_after = Pt(0)
 
     # Column 1
     c0 = row.cells[0]
@@ -1279,7 +1486,19 @@ def generate_mandat_paiement_docx(payload: Dict[str, Any], docx_path: str) -> No
     r_ar = p_ar.add_run("POUR ACQUIT DE LA SOMME CI-DESSUS\nLA PARTIE PRENANTE")
     r_ar.font.size = Pt(8)
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
+
+
+# Payment documents keyed by their (interned, literal) type; generate_generic_docx dispatches here once
+# and hands the already-normalized type on so the generator does not re-read it from the payload.
+_PAYMENT_DOC_GENERATORS: Dict[str, Callable[..., None]] = {
+    "recu-combined": generate_recu_docx,
+    "demande-autorisation": generate_demande_autorisation_docx,
+    "certificat-paiement": generate_certificat_paiement_docx,
+    "certificat-paiement-combined": generate_certificat_paiement_docx,
+    "ordre-paiement": generate_ordre_paiement_docx,
+    "mandat-paiement": generate_mandat_paiement_docx,
+}
 
 
 def fmt_amount_fr_comma(amount: Any) -> str:
@@ -1287,6 +1506,15 @@ def fmt_amount_fr_comma(amount: Any) -> str:
         value = float(amount or 0)
     except Exception:
         value = 0.0
+    if not value:
+        # Same -0.0 caveat as fmt_amount_receipt.
+        return f"{value:.2f}".replace(".", ",")
+    return _fmt_amount_fr_comma_cached(value)
+
+
+@lru_cache(maxsize=1024)
+def _fmt_amount_fr_comma_cached(value: float) -> str:
+    # Two short replace() calls beat a str.translate() table on strings this size.
     return f"{value:,.2f}".replace(",", " ").replace(".", ",")
 
 
@@ -1295,11 +1523,81 @@ def amount_to_words_dhs_cents(amount: Any) -> str:
         value = float(amount or 0)
     except Exception:
         value = 0.0
-    whole_part = int(math.floor(value))
-    cents = int(round((value - float(whole_part)) * 100.0))
-    cents_str = str(cents).rjust(2, "0")
-    words = number_to_words_fr(value)
-    return f"{words} dhs {cents_str} Cts"
+    return _amount_to_words_dhs_cents_cached(value)
+
+
+@lru_cache(maxsize=1024)
+def _amount_to_words_dhs_cents_cached(value: float) -> str:
+    whole_part, cents = split_amount(value)
+    return f"{number_to_words_fr(whole_part)} dhs {cents:02d} Cts"
+
+
+PresenceRow = Tuple[float, List[int], Optional[Tuple[int, int, int]]]
+
+
+class DayRange(NamedTuple):
+    # One bordereau period inside the month, with its printed dd/mm/yyyy bounds.
+    start_day: int
+    end_day: int
+    date_from_s: str
+    date_to_s: str
+
+
+def prepare_presence_rows(report_rows: List[Dict[str, Any]]) -> List[PresenceRow]:
+    # Normalize each paid worker once per document: (daily salary, sorted day numbers, birth (y, m, d)).
+    # Every range total then counts days with two bisections instead of rescanning the presence list.
+    prepared: List[PresenceRow] = []
+    for w in report_rows:
+        presence_days = w.get("presenceDays") or w.get("presence_days") or []
+        if not isinstance(presence_days, list):
+            presence_days = []
+        daily_salary = float(w.get("salaire_journalier") or w.get("dailySalary") or w.get("daily_salary") or 0.0)
+        if daily_salary <= 0 or not presence_days:
+            continue
+        try:
+            # Clean lists (the normal case) convert in a single C-level pass.
+            days = sorted(map(int, presence_days))
+        except Exception:
+            days = []
+            for d in presence_days:
+                try:
+                    days.append(int(d))
+                except Exception:
+                    continue
+            days.sort()
+        if not days:
+            # No countable day in any range: leave the worker out of every per-range pass.
+            continue
+        birth = parse_date(w.get("date_naissance"))
+        prepared.append((daily_salary, days, (birth.year, birth.month, birth.day) if birth else None))
+    return prepared
+
+
+def _range_net_cents(
+    prepared: List[PresenceRow],
+    start_day: int,
+    end_day: int,
+    cutoff: Tuple[int, int, int],
+) -> int:
+    # Integer-cent total for one day range; a birth tuple at or before cutoff is past the RCAR age limit.
+    # Workers mostly share a daily rate, so a worker's net only depends on (rate, days, eligible):
+    # compute each distinct combination once per range.
+    rate = RCAR_RATE
+    total_cents = 0
+    net_cents_by_key: Dict[Tuple[float, int, bool], int] = {}
+    for daily_salary, days, birth in prepared:
+        days_in_range = bisect_right(days, end_day) - bisect_left(days, start_day)
+        if days_in_range <= 0:
+            continue
+        eligible = birth is None or birth > cutoff
+        key = (daily_salary, days_in_range, eligible)
+        net_cents = net_cents_by_key.get(key)
+        if net_cents is None:
+            gross = round2(days_in_range * daily_salary)
+            deduction = round2(gross * rate) if eligible else 0.0
+            net_cents = net_cents_by_key[key] = int(round(round2(gross - deduction) * 100))
+        total_cents += net_cents
+    return total_cents
 
 
 def calculate_range_net_total(
@@ -1310,44 +1608,241 @@ def calculate_range_net_total(
     start_day: int,
     end_day: int,
     age_limit: int,
+    prepared: Optional[List[PresenceRow]] = None,
 ) -> float:
+    if end_day < start_day:
+        return 0.0
+    if prepared is None:
+        if not report_rows:
+            return 0.0
+        prepared = prepare_presence_rows(report_rows)
+    if not prepared:
+        return 0.0
     ref_date = date(int(year), int(month), int(end_day))
-    total_cents = 0
+    # Same eligibility rule as calculate_igr_deduction (see build_workers_financial_rows).
+    cutoff = (ref_date.year - int(age_limit) - 1, ref_date.month, ref_date.day)
+    return _range_net_cents(prepared, start_day, end_day, cutoff) / 100.0
 
-    for w in report_rows:
-        presence_days = w.get("presenceDays") or w.get("presence_days") or []
-        if not isinstance(presence_days, list):
-            presence_days = []
-        daily_salary = float(w.get("salaire_journalier") or w.get("dailySalary") or w.get("daily_salary") or 0.0)
-        if daily_salary <= 0:
-            continue
-        days_in_range = 0
-        for d in presence_days:
-            try:
-                day_num = int(d)
-            except Exception:
-                continue
-            if start_day <= day_num <= end_day:
-                days_in_range += 1
-        if days_in_range <= 0:
-            continue
 
-        gross = round2(days_in_range * daily_salary)
-        deduction = calculate_igr_deduction(w.get("date_naissance"), ref_date, gross, age_limit)
-        net = round2(gross - deduction)
-        total_cents += int(round(net * 100))
+# Only a handful of widths and margins recur (box widths, cell paddings), so cache the conversion.
+@lru_cache(maxsize=256)
+def mm_to_twips(value_mm: float) -> int:
+    return int(round(float(value_mm) * 72.0 / 25.4 * 20.0))
+
+
+def add_bordereau_header_block(doc, *, usable_w_mm: float, province: str, commune: str) -> None:
+    hdr = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.70, usable_w_mm * 0.30])
+    hdr.alignment = WD_TABLE_ALIGNMENT.CENTER
+    hdr.autofit = False
+    remove_docx_table_borders(hdr)
+
+    left_cell = hdr.rows[0].cells[0]
+    right_cell = hdr.rows[0].cells[1]
+    left_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+    right_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+
+    left_cell.text = ""
+    p = left_cell.paragraphs[0]
+    p.paragraph_format.space_before = Pt(0)
+    p.paragraph_format.space_after = Pt(0)
+    p.paragraph_format.line_spacing = 1.0
+
+    r = p.add_run(f"ROYAUME DU MAROC\nMINISTERE DE L'INTERIEUR\nPROVINCE DE {province}\n")
+    r.bold = True
+    r.font.size = Pt(9)
+    r_commune = p.add_run(f"COMMUNE {commune}")
+    r_commune.bold = True
+    r_commune.underline = True
+    r_commune.font.size = Pt(9)
+    r_commune.add_break()
+
+    right_cell.text = ""
+    pr = right_cell.paragraphs[0]
+    pr.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    pr.paragraph_format.space_before = Pt(0)
+    pr.paragraph_format.space_after = Pt(0)
+    rr1 = pr.add_run("D.216")
+    rr1.bold = True
+    rr1.font.size = Pt(9)
+    rr1.add_break()
+    rr2 = pr.add_run("ANNEXE 19")
+    rr2.bold = True
+    rr2.font.size = Pt(9)
+    rr2.add_break()
+    rr3 = pr.add_run("Titre............................")
+    rr3.font.size = Pt(9)
+
+
+def append_body_element(doc, element) -> None:
+    # Body content goes before the final sectPr, as python-docx's own add_paragraph/add_table do.
+    body = doc.element.body
+    sect_pr = body.sectPr
+    if sect_pr is None:
+        body.append(element)
+    else:
+        sect_pr.addprevious(element)
+
+
+# Same markup add_paragraph() + the property setters below produce, filled in and parsed in one go.
+_CENTERED_LINE_XML = (
+    "<w:p " + _W_XMLNS + '><w:pPr><w:spacing w:before="0" w:after="{after}"/><w:jc w:val="center"/></w:pPr>'
+    '<w:r><w:rPr>{bold}<w:sz w:val="{size}"/>{underline}</w:rPr><w:t>{text}</w:t></w:r></w:p>'
+)
+
+
+def add_centered_line(doc, text: str, *, bold: bool = False, underline: bool = False, size: int = 10, after: int = 0):
+    # Breaks, tabs and edge spaces need python-docx's run text handling; plain text takes the template.
+    if text and text == text.strip() and "\n" not in text and "\t" not in text:
+        append_body_element(
+            doc,
+            parse_xml(
+                _CENTERED_LINE_XML.format(
+                    after=Pt(after).twips,
+                    bold="<w:b/>" if bold else '<w:b w:val="0"/>',
+                    size=int(round(size * 2)),
+                    underline='<w:u w:val="single"/>' if underline else '<w:u w:val="none"/>',
+                    text=xml_escape(text),
+                )
+            ),
+        )
+        return
+    p = doc.add_paragraph()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    p.paragraph_format.space_before = Pt(0)
+    p.paragraph_format.space_after = Pt(after)
+    r = p.add_run(text)
+    r.bold = bool(bold)
+    r.underline = bool(underline)
+    r.font.size = Pt(size)
+
+
+# Top of each bordereau page (administrative block + title lines), keyed by (usable_w_mm, province, commune).
+_BORDEREAU_HEADER_ELEMENTS: Dict[Tuple[float, str, str], List[Any]] = {}
+
+
+def add_bordereau_page_header(doc, *, usable_w_mm: float, province: str, commune: str) -> None:
+    # Only province/commune vary here, so build the block once in a scratch document and
+    # copy its body elements into every bordereau instead of rebuilding it through python-docx.
+    key = (usable_w_mm, province, commune)
+    elements = _BORDEREAU_HEADER_ELEMENTS.get(key)
+    if elements is None:
+        scratch = new_a4_document(top_mm=15, bottom_mm=15, left_mm=15, right_mm=10, font_size_pt=11)
+        scratch_body = scratch.element.body
+        for child in list(scratch_body):
+            if child.tag != _QN["sectPr"]:
+                scratch_body.remove(child)
+        add_bordereau_header_block(scratch, usable_w_mm=usable_w_mm, province=province, commune=commune)
+        add_centered_line(scratch, "DÉPENSE EN RÉGIE", bold=True, size=11, after=2)
+        add_centered_line(scratch, "Salaire du Personnel Occasionnel", underline=True, size=11, after=1)
+        elements = [child for child in scratch_body if child.tag != _QN["sectPr"]]
+        _BORDEREAU_HEADER_ELEMENTS[key] = elements
+
+    for element in elements:
+        append_body_element(doc, copy.deepcopy(element))
+
+
+def bordereau_para_style(doc, size: int):
+    # One paragraph style per font size, so body text inherits its size instead of
+    # carrying a <w:sz> on every run. Kept out of the style gallery and styles pane:
+    # it is a layout detail, not a style users should pick.
+    name = f"Bordereau{size}pt"
+    styles = doc.styles
+    if name in styles:
+        return styles[name]
+    style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = styles["Normal"]
+    style.font.size = Pt(size)
+    style.hidden = True
+    style.quick_style = False
+    return style
+
+
+def add_para(doc, text: str, *, align: str = "left", size: int = 9, after: int = 0, line_spacing: float = 1.15):
+    p = doc.add_paragraph(text, style=bordereau_para_style(doc, size))
+    p.paragraph_format.space_before = Pt(0)
+    p.paragraph_format.space_after = Pt(after)
+    p.paragraph_format.line_spacing = line_spacing
+    if align == "center":
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    elif align == "right":
+        p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    elif align == "justify":
+        p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    else:
+        p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    return p
+
+
+def set_table_fixed_layout(table, col_widths_mm: List[float], *, table_w_mm: float) -> None:
+    table.autofit = False
+    tbl_pr = table._tbl.tblPr
+    type_attr = _QN["type"]
+    w_attr = _QN["w"]
+
+    tbl_layout = tbl_pr.find(_QN["tblLayout"])
+    if tbl_layout is None:
+        tbl_layout = OxmlElement("w:tblLayout")
+        tbl_pr.append(tbl_layout)
+    tbl_layout.set(type_attr, "fixed")
+
+    tbl_w = tbl_pr.find(_QN["tblW"])
+    if tbl_w is None:
+        tbl_w = OxmlElement("w:tblW")
+        tbl_pr.append(tbl_w)
+    tbl_w.set(type_attr, "dxa")
+    tbl_w.set(w_attr, str(mm_to_twips(table_w_mm)))
+
+    tbl_ind = tbl_pr.find(_QN["tblInd"])
+    if tbl_ind is None:
+        tbl_ind = OxmlElement("w:tblInd")
+        tbl_pr.append(tbl_ind)
+    tbl_ind.set(type_attr, "dxa")
+    tbl_ind.set(w_attr, "0")
+
+    set_column_widths(table, col_widths_mm)
+
 
-    return total_cents / 100.0
+def set_table_borders(table, sz: int = 8) -> None:
+    tbl_pr = table._tbl.tblPr
+    tbl_borders = tbl_pr.find(_QN["tblBorders"])
+    if tbl_borders is None:
+        tbl_pr.append(parse_xml(_tbl_borders_xml(sz)))
+        return
+    sz_s = str(sz)
+    for edge in _TABLE_EDGES:
+        element = tbl_borders.find(_QN[edge])
+        if element is None:
+            element = OxmlElement("w:" + edge)
+            tbl_borders.append(element)
+        element.set(_QN["val"], "single")
+        element.set(_QN["sz"], sz_s)
+        element.set(_QN["color"], "000000")
+
+
+def set_table_cell_margins(table, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
+    tbl_pr = table._tbl.tblPr
+    cell_mar = tbl_pr.find(_QN["tblCellMar"])
+    if cell_mar is None:
+        tbl_pr.append(
+            parse_xml(
+                _tbl_cell_mar_xml(
+                    mm_to_twips(top_mm), mm_to_twips(bottom_mm), mm_to_twips(left_mm), mm_to_twips(right_mm)
+                )
+            )
+        )
+        return
+
+    for edge, mm_val in (("top", top_mm), ("bottom", bottom_mm), ("left", left_mm), ("right", right_mm)):
+        node = cell_mar.find(_QN[edge])
+        if node is None:
+            node = OxmlElement("w:" + edge)
+            cell_mar.append(node)
+        node.set(_QN["w"], str(mm_to_twips(mm_val)))
+        node.set(_QN["type"], "dxa")
 
 
 def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.table import WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+    _load_docx()
 
     document_type = str(payload.get("documentType") or "").strip()
     if document_type != "bordereau":
@@ -1363,7 +1858,9 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
     options = payload.get("options") or {}
 
     age_limit = int(options.get("rcarAgeLimit") or 60)
-    last_day = calendar.monthrange(year, month)[1]
+    last_day = _monthrange(year, month)
+
+    presence_rows = prepare_presence_rows(report_rows)
 
     # Ensure we have some payroll data for the period (combined range)
     combined_net = calculate_range_net_total(
@@ -1373,6 +1870,7 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         start_day=1,
         end_day=last_day,
         age_limit=age_limit,
+        prepared=presence_rows,
     )
     if combined_net <= 0:
         raise ValueError("Aucune donnée de paie pour cette période")
@@ -1393,212 +1891,37 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
     commune = str(options.get("communeName") or "OULED NACEUR")
     city = str(options.get("cityName") or "Ouled Naceur")
 
-    doc = Document()
+    doc = new_a4_document(top_mm=15, bottom_mm=15, left_mm=15, right_mm=10, font_size_pt=11)
     remove_leading_empty_paragraph(doc)
 
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=15, bottom_mm=15, left_mm=15, right_mm=10)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=11)
-
     usable_w_mm = 210 - 15 - 10
 
-    def add_header_block() -> None:
-        hdr = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.70, usable_w_mm * 0.30])
-        hdr.alignment = WD_TABLE_ALIGNMENT.CENTER
-        hdr.autofit = False
-        remove_docx_table_borders(hdr)
-
-        left_cell = hdr.rows[0].cells[0]
-        right_cell = hdr.rows[0].cells[1]
-        left_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-        right_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-
-        left_cell.text = ""
-        p = left_cell.paragraphs[0]
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(0)
-        p.paragraph_format.line_spacing = 1.0
-
-        for line, underline in [
-            ("ROYAUME DU MAROC", False),
-            ("MINISTERE DE L'INTERIEUR", False),
-            (f"PROVINCE DE {province}", False),
-            (f"COMMUNE {commune}", True),
-        ]:
-            r = p.add_run(line)
-            r.bold = True
-            r.font.size = Pt(9)
-            if underline:
-                r.underline = True
-            r.add_break()
-
-        right_cell.text = ""
-        pr = right_cell.paragraphs[0]
-        pr.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        pr.paragraph_format.space_before = Pt(0)
-        pr.paragraph_format.space_after = Pt(0)
-        rr1 = pr.add_run("D.216")
-        rr1.bold = True
-        rr1.font.size = Pt(9)
-        rr1.add_break()
-        rr2 = pr.add_run("ANNEXE 19")
-        rr2.bold = True
-        rr2.font.size = Pt(9)
-        rr2.add_break()
-        rr3 = pr.add_run("Titre............................")
-        rr3.font.size = Pt(9)
-
-    def add_centered_line(text: str, *, bold: bool = False, underline: bool = False, size: int = 10, after: int = 0):
-        p = doc.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(after)
-        r = p.add_run(text)
-        r.bold = bool(bold)
-        r.underline = bool(underline)
-        r.font.size = Pt(size)
-
-    def add_para(text: str, *, align: str = "left", size: int = 9, after: int = 0, line_spacing: float = 1.15):
-        p = doc.add_paragraph(text)
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(after)
-        p.paragraph_format.line_spacing = line_spacing
-        if align == "center":
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        elif align == "right":
-            p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        elif align == "justify":
-            p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        else:
-            p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        for run in p.runs:
-            run.font.size = Pt(size)
-        return p
-
-    def add_dots(cell, count: int, *, align=WD_ALIGN_PARAGRAPH.LEFT, size_pt: int = 8):
-        for _ in range(count):
-            p = cell.add_paragraph("." * 45)
-            p.alignment = align
-            p.paragraph_format.space_before = Pt(0)
-            p.paragraph_format.space_after = Pt(0)
-            for run in p.runs:
-                run.font.size = Pt(size_pt)
-
-    def mm_to_twips(value_mm: float) -> int:
-        return int(round(float(value_mm) * 72.0 / 25.4 * 20.0))
-
-    def set_table_fixed_layout(table, col_widths_mm: List[float]) -> None:
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-
-        table.autofit = False
-        tbl_pr = table._tbl.tblPr
-
-        tbl_layout = tbl_pr.find(qn("w:tblLayout"))
-        if tbl_layout is None:
-            tbl_layout = OxmlElement("w:tblLayout")
-            tbl_pr.append(tbl_layout)
-        tbl_layout.set(qn("w:type"), "fixed")
-
-        tbl_w = tbl_pr.find(qn("w:tblW"))
-        if tbl_w is None:
-            tbl_w = OxmlElement("w:tblW")
-            tbl_pr.append(tbl_w)
-        tbl_w.set(qn("w:type"), "dxa")
-        tbl_w.set(qn("w:w"), str(mm_to_twips(usable_w_mm)))
-
-        tbl_ind = tbl_pr.find(qn("w:tblInd"))
-        if tbl_ind is None:
-            tbl_ind = OxmlElement("w:tblInd")
-            tbl_pr.append(tbl_ind)
-        tbl_ind.set(qn("w:type"), "dxa")
-        tbl_ind.set(qn("w:w"), "0")
-
-        for col_idx, width_mm in enumerate(col_widths_mm):
-            if col_idx >= len(table.columns):
-                break
-            table.columns[col_idx].width = Mm(width_mm)
-            for row in table.rows:
-                if col_idx < len(row.cells):
-                    row.cells[col_idx].width = Mm(width_mm)
-
-    def set_table_borders(table, sz: int = 8) -> None:
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-
-        tbl_pr = table._tbl.tblPr
-        tbl_borders = tbl_pr.find(qn("w:tblBorders"))
-        if tbl_borders is None:
-            tbl_borders = OxmlElement("w:tblBorders")
-            tbl_pr.append(tbl_borders)
-        for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
-            element = tbl_borders.find(qn(f"w:{edge}"))
-            if element is None:
-                element = OxmlElement(f"w:{edge}")
-                tbl_borders.append(element)
-            element.set(qn("w:val"), "single")
-            element.set(qn("w:sz"), str(sz))
-            element.set(qn("w:color"), "000000")
-
-    def set_cell_borders(cell, *, top: int = 0, left: int = 0, bottom: int = 0, right: int = 0) -> None:
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-
-        tc_pr = cell._tc.get_or_add_tcPr()
-        tc_borders = tc_pr.find(qn("w:tcBorders"))
-        if tc_borders is None:
-            tc_borders = OxmlElement("w:tcBorders")
-            tc_pr.append(tc_borders)
-
-        for edge, sz in (("top", top), ("left", left), ("bottom", bottom), ("right", right)):
-            if sz <= 0:
-                continue
-            edge_tag = qn(f"w:{edge}")
-            edge_el = tc_borders.find(edge_tag)
-            if edge_el is None:
-                edge_el = OxmlElement(f"w:{edge}")
-                tc_borders.append(edge_el)
-            edge_el.set(qn("w:val"), "single")
-            edge_el.set(qn("w:sz"), str(sz))
-            edge_el.set(qn("w:color"), "000000")
-
-    def set_table_cell_margins(table, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-
-        tbl_pr = table._tbl.tblPr
-        cell_mar = tbl_pr.find(qn("w:tblCellMar"))
-        if cell_mar is None:
-            cell_mar = OxmlElement("w:tblCellMar")
-            tbl_pr.append(cell_mar)
-
-        for edge, mm_val in (("top", top_mm), ("bottom", bottom_mm), ("left", left_mm), ("right", right_mm)):
-            node = cell_mar.find(qn(f"w:{edge}"))
-            if node is None:
-                node = OxmlElement(f"w:{edge}")
-                cell_mar.append(node)
-            node.set(qn("w:w"), str(mm_to_twips(mm_val)))
-            node.set(qn("w:type"), "dxa")
-
     ranges = [
-        ("combined", 1, last_day),
+        DayRange(1, last_day, fmt_ddmmyyyy(year, month, 1), fmt_ddmmyyyy(year, month, last_day)),
     ]
 
-    for idx, (_rid, start_day, end_day) in enumerate(ranges):
-        range_net = calculate_range_net_total(
-            report_rows,
-            year=year,
-            month=month,
-            start_day=start_day,
-            end_day=end_day,
-            age_limit=age_limit,
-        )
+    # Range-independent strings are formatted once rather than per range.
+    admitted_raw = options.get("admittedAmount")
+    rejected_amount_s = fmt_amount_fr_comma(rejected_amount)
+    report_previous_s = fmt_amount_fr_comma(report_previous)
+
+    for idx, (start_day, end_day, date_from_s, date_to_s) in enumerate(ranges):
+        if (start_day, end_day) == (1, last_day):
+            # The whole-month total was already computed for the empty-period check above.
+            range_net = combined_net
+        else:
+            range_net = calculate_range_net_total(
+                report_rows,
+                year=year,
+                month=month,
+                start_day=start_day,
+                end_day=end_day,
+                age_limit=age_limit,
+                prepared=presence_rows,
+            )
         bord_amount = fmt_amount_fr_comma(range_net)
         bord_words = amount_to_words_dhs_cents(range_net)
 
-        admitted_raw = options.get("admittedAmount")
         if admitted_raw in (None, ""):
             admitted = range_net
         else:
@@ -1608,22 +1931,14 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
                 admitted = range_net
         admitted = max(round2(admitted), 0.0)
         admitted_amount = fmt_amount_fr_comma(admitted)
-        rejected_amount_s = fmt_amount_fr_comma(rejected_amount)
-        report_previous_s = fmt_amount_fr_comma(report_previous)
         total_general = report_previous + range_net
         total_general_s = fmt_amount_fr_comma(total_general)
         total_general_words = amount_to_words_dhs_cents(total_general)
 
-        date_from = date(year, month, start_day)
-        date_to = date(year, month, end_day)
-        date_from_s = f"{date_from.day:02d}/{date_from.month:02d}/{date_from.year}"
-        date_to_s = f"{date_to.day:02d}/{date_to.month:02d}/{date_to.year}"
-
         # --- Page 1 ---
-        add_header_block()
-        add_centered_line("DÉPENSE EN RÉGIE", bold=True, size=11, after=2)
-        add_centered_line("Salaire du Personnel Occasionnel", underline=True, size=11, after=1)
+        add_bordereau_page_header(doc, usable_w_mm=usable_w_mm, province=province, commune=commune)
         add_centered_line(
+            doc,
             f"Titre Chap: {chap} Art {art} Prog: {prog}, Pro: {proj}, ligne: {ligne}.",
             size=9,
             after=6,
@@ -1639,10 +1954,11 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         p_reg.add_run("Régie de dépenses auprès\n").font.size = Pt(9)
         p_reg.add_run(f"COMMUNE {commune}").font.size = Pt(9)
 
-        add_centered_line(f"BORDEREAU N: {month}/{year}", bold=True, size=9, after=1)
-        add_centered_line(f"du {date_from_s} AU {date_to_s}", bold=True, size=9, after=4)
+        add_centered_line(doc, f"BORDEREAU N: {month}/{year}", bold=True, size=9, after=1)
+        add_centered_line(doc, f"du {date_from_s} AU {date_to_s}", bold=True, size=9, after=4)
 
         add_para(
+            doc,
             "des quittances et des pièces adressées à M(1): Le percepteur, par le soussigné,\n"
             "pour justifier l’emploi des fonds qui lui ont été remis par le percepteur",
             align="justify",
@@ -1650,7 +1966,14 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
             after=2,
             line_spacing=1.15,
         )
-        add_para(f"d’un montant de: {bord_amount} ({bord_words}).", align="justify", size=10, after=4, line_spacing=1.15)
+        add_para(
+            doc,
+            f"d’un montant de: {bord_amount} ({bord_words}).",
+            align="justify",
+            size=10,
+            after=4,
+            line_spacing=1.15,
+        )
 
         # Main table (page 1): keep fully on first page with tighter row sizing/padding.
         col_w = [
@@ -1663,7 +1986,7 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         ]
         t = add_table_with_widths(doc, cols=6, col_widths_mm=col_w)
         t.alignment = WD_TABLE_ALIGNMENT.CENTER
-        set_table_fixed_layout(t, col_w)
+        set_table_fixed_layout(t, col_w, table_w_mm=usable_w_mm)
         # Tighter padding prevents overflow while keeping readability.
         set_table_cell_margins(t, top_mm=0.4, bottom_mm=0.4, left_mm=1.0, right_mm=1.0)
         set_table_borders(t, sz=8)
@@ -1679,8 +2002,7 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         hdr = t.rows[0]
         hdr.height = Mm(12)
         hdr.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-        for i, h in enumerate(headers):
-            cell = hdr.cells[i]
+        for cell, h in zip(hdr.cells, headers):
             cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
             p = cell.paragraphs[0]
             p.text = ""
@@ -1701,43 +2023,29 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
                 p.paragraph_format.space_after = Pt(0)
                 p.paragraph_format.line_spacing = 1.0
 
-        row.cells[0].text = ""
-
-        # Désignation
-        c1 = row.cells[1]
-        c1.text = ""
-        p1 = c1.paragraphs[0]
-        p1.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        r1 = p1.add_run("Rôle de journée\nOrdre de paiement\nCertificat de paiement\nFeuille d’attachement")
-        r1.font.size = Pt(8.5)
-
-        # Nature
-        c2 = row.cells[2]
-        c2.text = ""
-        p2 = c2.paragraphs[0]
-        p2.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        r2 = p2.add_run("Salaire du Personnel\nOccasionnel")
-        r2.font.size = Pt(8.5)
-
-        # Montant (right aligned)
-        c3 = row.cells[3]
-        c3.text = ""
-        p3 = c3.paragraphs[0]
-        p3.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        r3 = p3.add_run(bord_amount)
-        r3.font.size = Pt(8.5)
-        r3.bold = True
-
-        # Nom des parties prenantes
-        c4 = row.cells[4]
-        c4.text = ""
-        p4 = c4.paragraphs[0]
-        p4.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        r4 = p4.add_run("parties prenantes")
-        r4.font.size = Pt(8.5)
-
-        # Observations
-        row.cells[5].text = ""
+        # (text, alignment, bold) per column; cells with no text are just cleared.
+        main_row_spec = [
+            (None, None, False),  # Numéro des pièces
+            (  # Désignation
+                "Rôle de journée\nOrdre de paiement\nCertificat de paiement\nFeuille d’attachement",
+                WD_ALIGN_PARAGRAPH.LEFT,
+                False,
+            ),
+            ("Salaire du Personnel\nOccasionnel", WD_ALIGN_PARAGRAPH.LEFT, False),  # Nature
+            (bord_amount, WD_ALIGN_PARAGRAPH.RIGHT, True),  # Montant
+            ("parties prenantes", WD_ALIGN_PARAGRAPH.LEFT, False),  # Nom des parties prenantes
+            (None, None, False),  # Observations
+        ]
+        for cell, (text, align, bold) in zip(row.cells, main_row_spec):
+            cell.text = ""
+            if text is None:
+                continue
+            p = cell.paragraphs[0]
+            p.alignment = align
+            r = p.add_run(text)
+            r.font.size = Pt(8.5)
+            if bold:
+                r.bold = True
 
         # A REPORTER row inside the same main table
         rep_row = t.add_row()
@@ -1770,15 +2078,14 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         # --- Page 2 (continuation) ---
         t2 = add_table_with_widths(doc, cols=6, col_widths_mm=col_w)
         t2.alignment = WD_TABLE_ALIGNMENT.CENTER
-        set_table_fixed_layout(t2, col_w)
+        set_table_fixed_layout(t2, col_w, table_w_mm=usable_w_mm)
         set_table_cell_margins(t2, top_mm=1.2, bottom_mm=1.2, left_mm=2.0, right_mm=2.0)
         set_table_borders(t2, sz=8)
 
         hdr2 = t2.rows[0]
         hdr2.height = Mm(16)
         hdr2.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-        for i, h in enumerate(headers):
-            cell = hdr2.cells[i]
+        for cell, h in zip(hdr2.cells, headers):
             cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
             p = cell.paragraphs[0]
             p.text = ""
@@ -1826,18 +2133,18 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         gap_after_top.paragraph_format.space_after = Pt(12)
 
         add_para(
-            "Arrêté le présent bordereau, comprenant quittances et pièces à la somme total\n"
-            f"de : {bord_words}.",
+            doc,
+            _BORDEREAU_ARRETE_TEMPLATE.format(words=bord_words),
             align="justify",
             size=10,
             after=6,
             line_spacing=1.15,
         )
-        add_para(f"A : {city}, Le : {document_date}", align="center", size=10, after=8)
+        add_para(doc, f"A : {city}, Le : {document_date}", align="center", size=10, after=8)
 
         sig = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.5, usable_w_mm * 0.5])
         sig.alignment = WD_TABLE_ALIGNMENT.CENTER
-        set_table_fixed_layout(sig, [usable_w_mm * 0.5, usable_w_mm * 0.5])
+        set_table_fixed_layout(sig, [usable_w_mm * 0.5, usable_w_mm * 0.5], table_w_mm=usable_w_mm)
         remove_docx_table_borders(sig)
         psl = sig.rows[0].cells[0].paragraphs[0]
         psr = sig.rows[0].cells[1].paragraphs[0]
@@ -1863,7 +2170,7 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
         ]
         bottom_tbl = add_table_with_widths(doc, cols=4, col_widths_mm=bottom_w)
         bottom_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-        set_table_fixed_layout(bottom_tbl, bottom_w)
+        set_table_fixed_layout(bottom_tbl, bottom_w, table_w_mm=usable_w_mm)
         set_table_borders(bottom_tbl, sz=8)
         set_table_cell_margins(bottom_tbl, top_mm=0.8, bottom_mm=0.8, left_mm=1.0, right_mm=1.0)
 
@@ -1895,9 +2202,9 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
             p.paragraph_format.space_before = Pt(0)
             p.paragraph_format.space_after = Pt(0)
         l_headers = ["N° d'ordre", "Montant", "Indications des pièces produites"]
-        for i, text in enumerate(l_headers):
-            b_head.cells[i].text = ""
-            ph = b_head.cells[i].paragraphs[0]
+        for cell, text in zip(b_head.cells, l_headers):
+            cell.text = ""
+            ph = cell.paragraphs[0]
             ph.alignment = WD_ALIGN_PARAGRAPH.LEFT
             rh = ph.add_run(text)
             rh.bold = True
@@ -1931,247 +2238,383 @@ def generate_bordereau_docx(payload: Dict[str, Any], docx_path: str) -> None:
             rr.font.size = Pt(9)
 
         add_para(
-            "Renvoi est fait régisseur désigné ci-dessus du présent bordereau été définitivement à la somme\n"
-            f"de : {total_general_words}",
+            doc,
+            _BORDEREAU_RENVOI_TEMPLATE.format(words=total_general_words),
             align="justify",
             size=10,
             after=2,
         )
         add_para(
+            doc,
             "et des quittances et pièces non admises dont le montant est indiqué au tableau ci-dessus",
             align="justify",
             size=10,
             after=4,
         )
-        add_para(f"Souk sebt, Le : …../…../{year}", align="right", size=10, after=1)
-        add_para("le ....................(comptable-assignataire)", align="right", size=10, after=0)
+        add_para(doc, f"Souk sebt, Le : …../…../{year}", align="right", size=10, after=1)
+        add_para(doc, "le ....................(comptable-assignataire)", align="right", size=10, after=0)
 
         if idx < len(ranges) - 1:
             doc.add_page_break()
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
+
+
+# Finished tblPr of the RCAR digit-box tables, keyed by (column widths in mm, bordered).
+_BOX_TABLE_PR: Dict[Tuple[Tuple[float, ...], bool], Any] = {}
+# Cell content around an empty, fully formatted 1 x N digit-box table,
+# keyed by (box count, box width in mm, decimals width in mm).
+_DIGIT_BOX_TABLES: Dict[Tuple[int, float, Optional[float]], Tuple[Any, ...]] = {}
+_DECIMALS_TC_BORDERS_XML = (
+    f'<w:tcBorders {_W_XMLNS}><w:top w:val="nil"/><w:bottom w:val="nil"/><w:right w:val="nil"/></w:tcBorders>'
+)
+# Administrative header paragraph of the RCAR state, keyed by (province, commune).
+_RCAR_HEADER_P: Dict[Tuple[str, str], Any] = {}
+# Justificatif form lines as (label, key); justificatif_rg_key is one of these keys.
+_RCAR_FORM_ROWS: Tuple[Tuple[str, str], ...] = (
+    ("Cotisation Salariale", "cotisation_salariale"),
+    ("Contribution Patronale", "contribution_patronale"),
+    ("Cotisation Validation", "cotisation_validation"),
+    ("Sous-Total", "sous_total"),
+    ("Contribution Validation", "contribution_validation"),
+    ("Majoration de Retard", "majoration_retard"),
+    ("Total (A + B + C)", "total_abc"),
+    ("Total Général (RG + RC)", "total_general"),
+)
+# Blank justificatif form row (label cell and two empty amount strips), keyed by the form column widths.
+_RCAR_FORM_ROW_TR: Dict[Tuple[float, ...], Any] = {}
+# Parsed single-run RCAR paragraphs without their text, keyed by (align, size, bold, underline, before, after).
+_RCAR_P_TEMPLATES: Dict[Tuple[str, float, bool, bool, float, float], Any] = {}
+# Empty spacing paragraphs between consecutive RCAR tables, keyed by space after in points.
+_RCAR_SEPARATOR_P: Dict[float, Any] = {}
+_RCAR_P_XML = (
+    "<w:p " + _W_XMLNS + '><w:pPr><w:spacing w:before="{before}" w:after="{after}"/><w:jc w:val="{align}"/></w:pPr>'
+    '<w:r><w:rPr>{bold}<w:sz w:val="{size}"/>{underline}</w:rPr></w:r></w:p>'
+)
+
+_QUARTER_MONTHS: Tuple[Tuple[int, int, int], ...] = ((1, 2, 3), (4, 5, 6), (7, 8, 9), (10, 11, 12))
+_MONTH_NAMES_FR: Dict[int, str] = {
+    1: "JANVIER",
+    2: "FEVRIER",
+    3: "MARS",
+    4: "AVRIL",
+    5: "MAI",
+    6: "JUIN",
+    7: "JUILLET",
+    8: "AOUT",
+    9: "SEPTEMBRE",
+    10: "OCTOBRE",
+    11: "NOVEMBRE",
+    12: "DECEMBRE",
+}
 
 
-def _generate_rcar_docx(
-    payload: Dict[str, Any],
-    docx_path: str,
+def safe_int(value: Any) -> int:
+    try:
+        return int(str(value).strip())
+    except Exception:
+        return 0
+
+
+def safe_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return float(default)
+
+
+def configure_table(
+    table,
+    col_widths_mm: List[float],
     *,
-    expected_document_type: str,
-    subtitle: str,
-    prelevement_rate: float,
-    justificatif_rg_key: str,
+    bordered: bool,
+    top_mm: float,
+    bottom_mm: float,
+    left_mm: float,
+    right_mm: float,
 ) -> None:
+    # Layout, borders and cell margins all live in the same tblPr, so it is looked up once.
+    table.autofit = False
+    tbl_pr = table._tbl.tblPr
+    set_tbl_pr_layout(tbl_pr, sum(col_widths_mm))
+    if bordered:
+        set_tbl_pr_borders(tbl_pr, sz=4)
+    else:
+        remove_tbl_pr_borders(tbl_pr)
+    # All-zero margins are written too: without a tblCellMar, Word pads cells 0.19 cm left and right.
+    set_tbl_pr_cell_margins(tbl_pr, top_mm=top_mm, bottom_mm=bottom_mm, left_mm=left_mm, right_mm=right_mm)
+    set_column_widths(table, col_widths_mm)
+
+
+def set_tbl_pr_layout(tbl_pr, total_w_mm: float) -> None:
+    tbl_layout = tbl_pr.find(_QN["tblLayout"])
+    if tbl_layout is None:
+        tbl_layout = OxmlElement("w:tblLayout")
+        tbl_pr.append(tbl_layout)
+    tbl_layout.set(_QN["type"], "fixed")
+
+    tbl_w = tbl_pr.find(_QN["tblW"])
+    if tbl_w is None:
+        tbl_w = OxmlElement("w:tblW")
+        tbl_pr.append(tbl_w)
+    tbl_w.set(_QN["type"], "dxa")
+    tbl_w.set(_QN["w"], str(mm_to_twips(total_w_mm)))
+
+
+def set_tbl_pr_borders(tbl_pr, sz: int = 4) -> None:
+    tbl_borders = tbl_pr.find(_QN["tblBorders"])
+    if tbl_borders is None:
+        tbl_pr.append(parse_xml(_tbl_borders_xml(sz)))
+        return
+    for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
+        edge_el = tbl_borders.find(_QN[edge])
+        if edge_el is None:
+            edge_el = OxmlElement(f"w:{edge}")
+            tbl_borders.append(edge_el)
+        edge_el.set(_QN["val"], "single")
+        edge_el.set(_QN["sz"], str(sz))
+        edge_el.set(_QN["color"], "000000")
+
+
+def set_tbl_pr_cell_margins(tbl_pr, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
+    cell_mar = tbl_pr.find(_QN["tblCellMar"])
+    if cell_mar is None:
+        tbl_pr.append(
+            parse_xml(
+                _tbl_cell_mar_xml(
+                    mm_to_twips(top_mm), mm_to_twips(bottom_mm), mm_to_twips(left_mm), mm_to_twips(right_mm)
+                )
+            )
+        )
+        return
+
+    for edge, mm_val in (("top", top_mm), ("bottom", bottom_mm), ("left", left_mm), ("right", right_mm)):
+        edge_el = cell_mar.find(_QN[edge])
+        if edge_el is None:
+            edge_el = OxmlElement(f"w:{edge}")
+            cell_mar.append(edge_el)
+        edge_el.set(_QN["w"], str(mm_to_twips(mm_val)))
+        edge_el.set(_QN["type"], "dxa")
+
+
+def format_box_table(tbl, col_widths_mm: List[float], *, bordered: bool) -> None:
+    # Digit-box tables all start from the same cell.add_table() + LEFT alignment tblPr, so the
+    # finished tblPr for given widths is built once and cloned; only the cell widths are redone.
+    key = (tuple(col_widths_mm), bordered)
+    template = _BOX_TABLE_PR.get(key)
+    if template is None:
+        configure_table(tbl, col_widths_mm, bordered=bordered, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
+        _BOX_TABLE_PR[key] = copy.deepcopy(tbl._tbl.tblPr)
+        return
+    tbl_pr = tbl._tbl.tblPr
+    tbl_pr.getparent().replace(tbl_pr, copy.deepcopy(template))
+    set_column_widths(tbl, col_widths_mm)
+
+
+def clear_cell(cell) -> None:
+    cell.text = ""
+    if cell.paragraphs:
+        p = cell.paragraphs[0]
+        p.paragraph_format.space_before = Pt(0)
+        p.paragraph_format.space_after = Pt(0)
+
+
+def quarter_months(q: int) -> List[int]:
+    if 1 <= q <= 4:
+        return list(_QUARTER_MONTHS[q - 1])
+    return []
+
+
+def quarter_months_label(months: List[int]) -> str:
+    labels = [_MONTH_NAMES_FR.get(m, "") for m in months]
+    return " ".join([x for x in labels if x]).strip()
+
+
+def fmt_amount_fr(value: Any, blank_zero: bool = False) -> str:
     try:
-        from docx import Document
-        from docx.enum.table import WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-        from docx.shared import Mm, Pt
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+        v = float(value)
+    except Exception:
+        return ""
+    if blank_zero and abs(v) < 1e-9:
+        return ""
+    if not v:
+        return f"{v:.2f}".replace(".", ",")
+    # Per-row amounts repeat a lot (same daily rate), so share the bordereau formatter's cache.
+    return _fmt_amount_fr_comma_cached(v)
 
-    document_type = str(payload.get("documentType") or "").strip()
-    if document_type != expected_document_type:
-        raise ValueError(f"Unsupported document type for {expected_document_type} generator: {document_type}")
 
-    report = payload.get("report") or {}
-    report_rows = report.get("rows") or []
-    options = payload.get("options") or {}
+@lru_cache(maxsize=256)
+def fmt_days(value: float) -> str:
+    if abs(value - round(value)) < 1e-9:
+        return str(int(round(value)))
+    return f"{value:.2f}".replace(".", ",")
 
-    def safe_int(value: Any) -> int:
-        try:
-            return int(str(value).strip())
-        except Exception:
-            return 0
 
-    def safe_float(value: Any, default: float = 0.0) -> float:
-        try:
-            return float(value)
-        except Exception:
-            return float(default)
-
-    def mm_to_twips(value_mm: float) -> int:
-        return int(round(float(value_mm) * 72.0 / 25.4 * 20.0))
-
-    def set_table_fixed_layout(table, col_widths_mm: List[float]) -> None:
-        table.autofit = False
-        tbl_pr = table._tbl.tblPr
-
-        tbl_layout = tbl_pr.find(qn("w:tblLayout"))
-        if tbl_layout is None:
-            tbl_layout = OxmlElement("w:tblLayout")
-            tbl_pr.append(tbl_layout)
-        tbl_layout.set(qn("w:type"), "fixed")
-
-        total_w_mm = sum(col_widths_mm)
-        tbl_w = tbl_pr.find(qn("w:tblW"))
-        if tbl_w is None:
-            tbl_w = OxmlElement("w:tblW")
-            tbl_pr.append(tbl_w)
-        tbl_w.set(qn("w:type"), "dxa")
-        tbl_w.set(qn("w:w"), str(mm_to_twips(total_w_mm)))
-
-        for col_idx, width_mm in enumerate(col_widths_mm):
-            if col_idx >= len(table.columns):
-                break
-            table.columns[col_idx].width = Mm(width_mm)
-            for row in table.rows:
-                if col_idx < len(row.cells):
-                    row.cells[col_idx].width = Mm(width_mm)
-
-    def set_table_borders(table, sz: int = 4) -> None:
-        tbl_pr = table._tbl.tblPr
-        tbl_borders = tbl_pr.find(qn("w:tblBorders"))
-        if tbl_borders is None:
-            tbl_borders = OxmlElement("w:tblBorders")
-            tbl_pr.append(tbl_borders)
-        for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
-            edge_el = tbl_borders.find(qn(f"w:{edge}"))
-            if edge_el is None:
-                edge_el = OxmlElement(f"w:{edge}")
-                tbl_borders.append(edge_el)
-            edge_el.set(qn("w:val"), "single")
-            edge_el.set(qn("w:sz"), str(sz))
-            edge_el.set(qn("w:color"), "000000")
-
-    def set_table_cell_margins(table, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
-        tbl_pr = table._tbl.tblPr
-        cell_mar = tbl_pr.find(qn("w:tblCellMar"))
-        if cell_mar is None:
-            cell_mar = OxmlElement("w:tblCellMar")
-            tbl_pr.append(cell_mar)
-
-        for edge, mm_val in (("top", top_mm), ("bottom", bottom_mm), ("left", left_mm), ("right", right_mm)):
-            edge_el = cell_mar.find(qn(f"w:{edge}"))
-            if edge_el is None:
-                edge_el = OxmlElement(f"w:{edge}")
-                cell_mar.append(edge_el)
-            edge_el.set(qn("w:w"), str(mm_to_twips(mm_val)))
-            edge_el.set(qn("w:type"), "dxa")
-
-    def clear_cell(cell) -> None:
-        cell.text = ""
-        if cell.paragraphs:
-            p = cell.paragraphs[0]
-            p.paragraph_format.space_before = Pt(0)
-            p.paragraph_format.space_after = Pt(0)
+def amount_words_upper(amount: float) -> str:
+    return _amount_words_upper(*split_amount(abs(float(amount or 0))))
 
-    def quarter_months(q: int) -> List[int]:
-        mapping = {1: [1, 2, 3], 2: [4, 5, 6], 3: [7, 8, 9], 4: [10, 11, 12]}
-        return mapping.get(q, [])
-
-    def quarter_months_label(months: List[int]) -> str:
-        month_names = {
-            1: "JANVIER",
-            2: "FEVRIER",
-            3: "MARS",
-            4: "AVRIL",
-            5: "MAI",
-            6: "JUIN",
-            7: "JUILLET",
-            8: "AOUT",
-            9: "SEPTEMBRE",
-            10: "OCTOBRE",
-            11: "NOVEMBRE",
-            12: "DECEMBRE",
-        }
-        labels = [month_names.get(m, "") for m in months if m in month_names]
-        return " ".join([x for x in labels if x]).strip()
-
-    def fmt_amount_fr(value: Any, blank_zero: bool = False) -> str:
-        try:
-            v = float(value)
-        except Exception:
-            return ""
-        if blank_zero and abs(v) < 1e-9:
-            return ""
-        return f"{v:,.2f}".replace(",", " ").replace(".", ",")
-
-    def fmt_days(value: float) -> str:
-        if abs(value - round(value)) < 1e-9:
-            return str(int(round(value)))
-        return f"{value:.2f}".replace(".", ",")
 
-    def amount_words_upper(amount: float) -> str:
-        value = abs(float(amount or 0))
-        whole_part = int(math.floor(value))
-        cents = int(round((value - whole_part) * 100))
-        if cents == 100:
-            whole_part += 1
-            cents = 0
-        words = number_to_words_fr(whole_part).upper()
-        return f"{words} DHS {cents:02d} CTS"
-
-    def render_digit_boxes(cell, digits: Any, *, boxes: int, box_width_mm: float = 4.5, font_size_pt: int = 9) -> None:
+def render_digit_boxes(
+    cell,
+    digits: Any,
+    *,
+    boxes: int,
+    box_width_mm: float = 4.5,
+    font_size_pt: int = 9,
+    decimals_width_mm: Optional[float] = None,
+):
+    # With decimals_width_mm, the strip gets one more, unboxed column for the ",cc" part of an amount.
+    count = max(1, int(boxes))
+
+    # The cell content around the empty, formatted box strip only depends on (count, width): build it
+    # through python-docx once, then clone its XML into the cell and append the digit runs directly.
+    key = (count, box_width_mm, decimals_width_mm)
+    template = _DIGIT_BOX_TABLES.get(key)
+    if template is None:
         clear_cell(cell)
-        count = max(1, int(boxes))
-        text = re.sub(r"\D", "", str(digits or ""))
-        text = text[-count:]
-        start = count - len(text)
-
-        tbl = cell.add_table(rows=1, cols=count)
+        col_widths = [box_width_mm] * count
+        if decimals_width_mm is not None:
+            col_widths.append(decimals_width_mm)
+        tbl = cell.add_table(rows=1, cols=len(col_widths))
         tbl.alignment = WD_TABLE_ALIGNMENT.LEFT
-        set_table_fixed_layout(tbl, [box_width_mm] * count)
-        set_table_borders(tbl, sz=4)
-        set_table_cell_margins(tbl, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
+        format_box_table(tbl, col_widths, bordered=True)
 
         row = tbl.rows[0]
         row.height = Mm(7.0)
         row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-        for idx, c in enumerate(row.cells):
+        row_cells = row.cells
+        if decimals_width_mm is not None:
+            # Only the left edge, shared with the last box, keeps its border.
+            row_cells[-1]._tc.get_or_add_tcPr().append(parse_xml(_DECIMALS_TC_BORDERS_XML))
+        for c in row_cells:
             c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
             p = c.paragraphs[0]
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
             p.paragraph_format.space_before = Pt(0)
             p.paragraph_format.space_after = Pt(0)
-            ch = text[idx - start] if idx >= start else ""
-            if ch:
-                r = p.add_run(ch)
-                r.font.size = Pt(font_size_pt)
+        if decimals_width_mm is not None:
+            row_cells[-1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.LEFT
+        tbl_el = tbl._tbl
+        # Cleared paragraph, table and the empty paragraph cell.add_table() leaves after it (Word requires one).
+        _DIGIT_BOX_TABLES[key] = tuple(copy.deepcopy(child) for child in cell._tc if child.tag != _QN["tcPr"])
+    else:
+        tc = cell._tc
+        tc.clear_content()
+        content = [copy.deepcopy(child) for child in template]
+        tc.extend(content)
+        tbl_el = content[1]
 
-    def render_amount_boxes(cell, amount: Optional[float], *, total_width_mm: float, boxes: int = 11) -> None:
-        clear_cell(cell)
-        if total_width_mm <= 8.0:
-            total_width_mm = 8.0
-
-        boxes_width = min(total_width_mm - 6.5, boxes * 4.5)
-        if boxes_width < 4.5:
-            boxes_width = max(4.5, total_width_mm - 6.5)
-        decimals_width = max(4.5, total_width_mm - boxes_width)
-
-        outer = cell.add_table(rows=1, cols=2)
-        outer.alignment = WD_TABLE_ALIGNMENT.LEFT
-        set_table_fixed_layout(outer, [boxes_width, decimals_width])
-        remove_docx_table_borders(outer)
-        set_table_cell_margins(outer, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
-
-        box_cell = outer.rows[0].cells[0]
-        dec_cell = outer.rows[0].cells[1]
-        box_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        dec_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-
-        if amount is None:
-            render_digit_boxes(box_cell, "", boxes=boxes, box_width_mm=4.5, font_size_pt=9)
-            clear_cell(dec_cell)
-            return
+    fill_digit_strip(tbl_el, digits, boxes=count, font_size_pt=font_size_pt)
+    return tbl_el
+
+
+def _sized_run(text: str, size: str):
+    r = OxmlElement("w:r")
+    r_pr = OxmlElement("w:rPr")
+    r_pr.append(OxmlElement("w:sz", attrs={_QN["val"]: size}))
+    r.append(r_pr)
+    r.text = text
+    return r
+
+
+def rcar_paragraph(
+    text: str,
+    *,
+    align: str,
+    size: float,
+    bold: bool = False,
+    underline: bool = False,
+    before: float = 0,
+    after: float = 0,
+):
+    # Same markup as add_paragraph()/add_run() plus the alignment, spacing and font setters,
+    # copied from a parsed template instead of going through python-docx per property.
+    key = (align, size, bold, underline, before, after)
+    template = _RCAR_P_TEMPLATES.get(key)
+    if template is None:
+        template = parse_xml(
+            _RCAR_P_XML.format(
+                align=align,
+                size=int(round(size * 2)),
+                bold="<w:b/>" if bold else "",
+                underline='<w:u w:val="single"/>' if underline else "",
+                before=Pt(before).twips,
+                after=Pt(after).twips,
+            )
+        )
+        _RCAR_P_TEMPLATES[key] = template
+    p = copy.deepcopy(template)
+    p[-1].text = text
+    return p
+
+
+def add_table_separator(doc, after: float) -> None:
+    # An empty paragraph between two body tables; without it Word merges them into one table,
+    # so the gap can't move onto a neighbouring paragraph's spacing.
+    p = _RCAR_SEPARATOR_P.get(after)
+    if p is None:
+        p = parse_xml(f'<w:p {_W_XMLNS}><w:pPr><w:spacing w:before="0" w:after="{Pt(after).twips}"/></w:pPr></w:p>')
+        _RCAR_SEPARATOR_P[after] = p
+    append_body_element(doc, copy.deepcopy(p))
+
+
+def fill_cell_paragraph(cell, text: str, **fmt: Any) -> None:
+    # Replaces the cell's first paragraph, which is still empty when this is called.
+    tc = cell._tc
+    tc.replace(tc.p_lst[0], rcar_paragraph(text, **fmt))
+
+
+def fill_digit_strip(tbl_el, digits: Any, *, boxes: int, font_size_pt: int) -> None:
+    # Right-aligns the digits into the first `boxes` cells of an empty strip from render_digit_boxes.
+    text = _NON_DIGIT_RE.sub("", str(digits or ""))[-boxes:]
+    if not text:
+        return
+    size = str(int(round(font_size_pt * 2)))
+    for tc, ch in zip(tbl_el.tr_lst[0].tc_lst[boxes - len(text):boxes], text):
+        tc.p_lst[0].append(_sized_run(ch, size))
+
+
+def fill_amount_strip(tbl_el, amount: float, *, boxes: int) -> None:
+    integer, cents = split_amount(abs(float(amount)))
+    fill_digit_strip(tbl_el, str(integer), boxes=boxes, font_size_pt=9)
+    tbl_el.tr_lst[0].tc_lst[-1].p_lst[0].append(_sized_run(f",{cents:02d}", "18"))
+
+
+def render_amount_boxes(cell, amount: Optional[float], *, total_width_mm: float, boxes: int = 11) -> None:
+    if total_width_mm <= 8.0:
+        total_width_mm = 8.0
+
+    boxes_width = min(total_width_mm - 6.5, boxes * 4.5)
+    if boxes_width < 4.5:
+        boxes_width = max(4.5, total_width_mm - 6.5)
+    decimals_width = max(4.5, total_width_mm - boxes_width)
 
-        value = abs(float(amount))
-        integer = int(math.floor(value))
-        cents = int(round((value - integer) * 100))
-        if cents == 100:
-            integer += 1
-            cents = 0
+    # One strip: the digit boxes plus a borderless last column for the decimals.
+    tbl_el = render_digit_boxes(
+        cell, "", boxes=boxes, box_width_mm=4.5, font_size_pt=9, decimals_width_mm=decimals_width
+    )
+    if amount is not None:
+        fill_amount_strip(tbl_el, amount, boxes=boxes)
+
+
+def _generate_rcar_docx(
+    payload: Dict[str, Any],
+    docx_path: str,
+    *,
+    expected_document_type: str,
+    subtitle: str,
+    prelevement_rate: float,
+    justificatif_rg_key: str,
+) -> None:
+    _load_docx()
 
-        render_digit_boxes(box_cell, str(integer), boxes=boxes, box_width_mm=4.5, font_size_pt=9)
+    document_type = str(payload.get("documentType") or "").strip()
+    if document_type != expected_document_type:
+        raise ValueError(f"Unsupported document type for {expected_document_type} generator: {document_type}")
 
-        clear_cell(dec_cell)
-        p_dec = dec_cell.paragraphs[0]
-        p_dec.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        p_dec.paragraph_format.space_before = Pt(0)
-        p_dec.paragraph_format.space_after = Pt(0)
-        r_dec = p_dec.add_run(f",{cents:02d}")
-        r_dec.font.size = Pt(9)
+    report = payload.get("report") or {}
+    report_rows = report.get("rows") or []
+    options = payload.get("options") or {}
 
     year = safe_int(payload.get("year"))
     quarter = safe_int(payload.get("quarter"))
@@ -2182,6 +2625,9 @@ def _generate_rcar_docx(
         period_months = quarter_months(quarter)
     if quarter not in (1, 2, 3, 4) and period_months:
         quarter = ((period_months[0] - 1) // 3) + 1
+    # Digits for the justificatif's year and quarter boxes, blank when unknown.
+    year_digits = f"{year:04d}" if year > 0 else ""
+    quarter_digit = str(quarter) if quarter in (1, 2, 3, 4) else ""
 
     period_from_s = ""
     period_to_s = ""
@@ -2190,7 +2636,7 @@ def _generate_rcar_docx(
         end_month = period_months[-1]
         try:
             d_from = date(year, start_month, 1)
-            d_to = date(year, end_month, calendar.monthrange(year, end_month)[1])
+            d_to = date(year, end_month, _monthrange(year, end_month))
             period_from_s = f"{d_from.day:02d}/{d_from.month:02d}/{d_from.year}"
             period_to_s = f"{d_to.day:02d}/{d_to.month:02d}/{d_to.year}"
         except Exception:
@@ -2201,7 +2647,6 @@ def _generate_rcar_docx(
     total_days = 0.0
     total_brut = 0.0
     total_prelev = 0.0
-    total_versement = 0.0
 
     for worker in report_rows:
         monthly_stats = worker.get("monthlyStats") if isinstance(worker.get("monthlyStats"), list) else []
@@ -2250,84 +2695,68 @@ def _generate_rcar_docx(
         total_days += days
         total_brut += brut
         total_prelev += prelev
-        total_versement += versement
 
     total_brut = round2(total_brut)
     total_prelev = round2(total_prelev)
-    total_versement = round2(total_versement)
+    # Versement is the prélèvement row for row, so its total is the same sum.
+    total_versement = total_prelev
 
     commune = str(options.get("communeName") or "OULED NACEUR").strip().upper()
     province = str(options.get("provinceName") or "FQUIH BEN SALAH").strip().upper()
     city = str(options.get("cityName") or "Ouled Naceur").strip() or "Ouled Naceur"
     arabic_header = str(options.get("rcarArabicLine") or "").strip()
-    adhesion_number = re.sub(r"\D", "", str(options.get("rcarAdhesionNumber") or "35160001"))
+    adhesion_number = _NON_DIGIT_RE.sub("", str(options.get("rcarAdhesionNumber") or "35160001"))
 
-    doc = Document()
+    doc = new_a4_document(top_mm=10, bottom_mm=10, left_mm=12, right_mm=12, font_size_pt=10)
     remove_leading_empty_paragraph(doc)
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=10, bottom_mm=10, left_mm=12, right_mm=12)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=10)
 
     usable_w_mm = 210 - 12 - 12
+    # Enum members set on most cells and rows of both pages.
+    v_center = WD_ALIGN_VERTICAL.CENTER
+    exactly = WD_ROW_HEIGHT_RULE.EXACTLY
 
     # ------------------------------
     # Page 1: Etat de versement
     # ------------------------------
     p_header = first_paragraph(doc)
-    p_header.text = ""
-    p_header.paragraph_format.space_before = Pt(0)
-    p_header.paragraph_format.space_after = Pt(16)
-    p_header.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    r0 = p_header.add_run("ROYAUME DU MAROC\n")
-    r0.bold = True
-    r0.font.size = Pt(10)
-    r1 = p_header.add_run("MINISTERE DE L'INTERIEUR\n")
-    r1.bold = True
-    r1.font.size = Pt(10)
-    r2 = p_header.add_run(f"PROVINCE DE {province}\n")
-    r2.bold = True
-    r2.font.size = Pt(10)
-    r3 = p_header.add_run(f"COMMUNE {commune}")
-    r3.bold = True
-    r3.font.size = Pt(10)
-
-    p_title1 = doc.add_paragraph()
-    p_title1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_title1.paragraph_format.space_before = Pt(0)
-    p_title1.paragraph_format.space_after = Pt(0)
-    rt1 = p_title1.add_run("ETAT DE VERSEMENT A LA (R.C.A.R)")
-    rt1.bold = True
-    rt1.underline = True
-    rt1.font.size = Pt(14)
+    header_p = _RCAR_HEADER_P.get((province, commune))
+    if header_p is not None:
+        p_header._p.getparent().replace(p_header._p, copy.deepcopy(header_p))
+    else:
+        p_header.text = ""
+        p_header.paragraph_format.space_before = Pt(0)
+        p_header.paragraph_format.space_after = Pt(16)
+        p_header.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        r0 = p_header.add_run("ROYAUME DU MAROC\n")
+        r0.bold = True
+        r0.font.size = Pt(10)
+        r1 = p_header.add_run("MINISTERE DE L'INTERIEUR\n")
+        r1.bold = True
+        r1.font.size = Pt(10)
+        r2 = p_header.add_run(f"PROVINCE DE {province}\n")
+        r2.bold = True
+        r2.font.size = Pt(10)
+        r3 = p_header.add_run(f"COMMUNE {commune}")
+        r3.bold = True
+        r3.font.size = Pt(10)
+        _RCAR_HEADER_P[(province, commune)] = copy.deepcopy(p_header._p)
 
-    p_title2 = doc.add_paragraph()
-    p_title2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_title2.paragraph_format.space_before = Pt(0)
-    p_title2.paragraph_format.space_after = Pt(6)
-    rt2 = p_title2.add_run(subtitle)
-    rt2.bold = True
-    rt2.underline = True
-    rt2.font.size = Pt(14)
+    append_body_element(
+        doc,
+        rcar_paragraph("ETAT DE VERSEMENT A LA (R.C.A.R)", align="center", size=14, bold=True, underline=True),
+    )
+    append_body_element(doc, rcar_paragraph(subtitle, align="center", size=14, bold=True, underline=True, after=6))
 
-    p_period = doc.add_paragraph()
-    p_period.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_period.paragraph_format.space_before = Pt(0)
-    p_period.paragraph_format.space_after = Pt(8)
     if period_from_s and period_to_s:
         period_text = f"Période du : {period_from_s} au {period_to_s}"
     else:
         period_text = "Période du : .......... au .........."
-    rp = p_period.add_run(period_text)
-    rp.font.size = Pt(12)
+    append_body_element(doc, rcar_paragraph(period_text, align="center", size=12, after=8))
 
     col_w = [55.0, 13.0, 13.0, 18.0, 22.0, 22.0, 22.0]
     state_tbl = add_table_with_widths(doc, cols=7, col_widths_mm=col_w)
     state_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-    set_table_fixed_layout(state_tbl, col_w)
-    set_table_borders(state_tbl, sz=4)
-    set_table_cell_margins(state_tbl, top_mm=0.3, bottom_mm=0.3, left_mm=0.3, right_mm=0.3)
+    configure_table(state_tbl, col_w, bordered=True, top_mm=0.3, bottom_mm=0.3, left_mm=0.3, right_mm=0.3)
 
     headers = [
         "Nom et prénom",
@@ -2341,23 +2770,15 @@ def _generate_rcar_docx(
 
     hdr = state_tbl.rows[0]
     hdr.height = Mm(10.0)
-    hdr.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-    for idx, htxt in enumerate(headers):
-        c = hdr.cells[idx]
-        c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        c.text = ""
-        p = c.paragraphs[0]
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(0)
-        rr = p.add_run(htxt)
-        rr.bold = True
-        rr.font.size = Pt(10)
-
+    hdr.height_rule = exactly
+    for c, htxt in zip(hdr.cells, headers):
+        c.vertical_alignment = v_center
+        fill_cell_paragraph(c, htxt, align="center", size=10, bold=True)
+
+    # Data rows differ only in their run text, so rows after the first are clones of it
+    # (the text run is the last child of each cell paragraph).
+    row_template = None
     for row_data in table_rows:
-        row = state_tbl.add_row()
-        row.height = Mm(6.3)
-        row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
         values = [
             row_data["nom_prenom"],
             row_data["qualite"],
@@ -2367,100 +2788,67 @@ def _generate_rcar_docx(
             fmt_amount_fr(row_data["prelev"]),
             fmt_amount_fr(row_data["versement"]),
         ]
-        aligns = [
-            WD_ALIGN_PARAGRAPH.LEFT,
-            WD_ALIGN_PARAGRAPH.CENTER,
-            WD_ALIGN_PARAGRAPH.CENTER,
-            WD_ALIGN_PARAGRAPH.RIGHT,
-            WD_ALIGN_PARAGRAPH.RIGHT,
-            WD_ALIGN_PARAGRAPH.RIGHT,
-            WD_ALIGN_PARAGRAPH.RIGHT,
-        ]
-        for idx, value in enumerate(values):
-            c = row.cells[idx]
-            c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            c.text = ""
-            p = c.paragraphs[0]
-            p.alignment = aligns[idx]
-            p.paragraph_format.space_before = Pt(0)
-            p.paragraph_format.space_after = Pt(0)
-            rv = p.add_run(str(value))
-            rv.font.size = Pt(10)
+        if row_template is not None:
+            tr = copy.deepcopy(row_template)
+            for p, value in zip(tr.iter(_QN["p"]), values):
+                p[-1].text = str(value)
+            state_tbl._tbl.append(tr)
+            continue
+        row = state_tbl.add_row()
+        row.height = Mm(6.3)
+        row.height_rule = exactly
+        aligns = ["left", "center", "center", "right", "right", "right", "right"]
+        for c, value, align in zip(row.cells, values, aligns):
+            c.vertical_alignment = v_center
+            fill_cell_paragraph(c, str(value), align=align, size=10)
+        row_template = row._tr
 
     total_row = state_tbl.add_row()
     total_row.height = Mm(7.0)
-    total_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
+    total_row.height_rule = exactly
     
     # Merge first 3 cells for "TOTAUX"
-    c0 = total_row.cells[0]
-    c1 = total_row.cells[1]
-    c2 = total_row.cells[2]
+    # Read once: the _Cell wrappers for columns 3-6 stay valid across the merge below.
+    total_cells = total_row.cells
+    c0 = total_cells[0]
+    c1 = total_cells[1]
+    c2 = total_cells[2]
     c0.merge(c2)
     
-    c0.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    c0.text = ""
-    p0 = c0.paragraphs[0]
-    p0.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p0.paragraph_format.space_before = Pt(0)
-    p0.paragraph_format.space_after = Pt(0)
-    r0 = p0.add_run("TOTAUX")
-    r0.bold = True
-    r0.font.size = Pt(10)
+    c0.vertical_alignment = v_center
+    fill_cell_paragraph(c0, "TOTAUX", align="center", size=10, bold=True)
     
     # Column 3 (index 3): empty
-    c3 = total_row.cells[3]
-    c3.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+    c3 = total_cells[3]
+    c3.vertical_alignment = v_center
     c3.text = ""
     
     # Column 4 (index 4): total brut
-    c4 = total_row.cells[4]
-    c4.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    c4.text = ""
-    p4 = c4.paragraphs[0]
-    p4.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    p4.paragraph_format.space_before = Pt(0)
-    p4.paragraph_format.space_after = Pt(0)
-    r4 = p4.add_run(fmt_amount_fr(total_brut))
-    r4.bold = True
-    r4.font.size = Pt(10)
+    c4 = total_cells[4]
+    c4.vertical_alignment = v_center
+    fill_cell_paragraph(c4, fmt_amount_fr(total_brut), align="right", size=10, bold=True)
     
     # Column 5 (index 5): total prélèvement
-    c5 = total_row.cells[5]
-    c5.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    c5.text = ""
-    p5 = c5.paragraphs[0]
-    p5.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    p5.paragraph_format.space_before = Pt(0)
-    p5.paragraph_format.space_after = Pt(0)
-    r5 = p5.add_run(fmt_amount_fr(total_prelev))
-    r5.bold = True
-    r5.font.size = Pt(10)
+    c5 = total_cells[5]
+    c5.vertical_alignment = v_center
+    fill_cell_paragraph(c5, fmt_amount_fr(total_prelev), align="right", size=10, bold=True)
     
     # Column 6 (index 6): total versement
-    c6 = total_row.cells[6]
-    c6.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    c6.text = ""
-    p6 = c6.paragraphs[0]
-    p6.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    p6.paragraph_format.space_before = Pt(0)
-    p6.paragraph_format.space_after = Pt(0)
-    r6 = p6.add_run(fmt_amount_fr(total_versement))
-    r6.bold = True
-    r6.font.size = Pt(10)
-
-    p_words = doc.add_paragraph()
-    p_words.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_words.paragraph_format.space_before = Pt(8)
-    p_words.paragraph_format.space_after = Pt(10)
-    p_words.add_run("Le présent état est arrêté à la somme de : ").font.size = Pt(11)
-    p_words.add_run(amount_words_upper(total_versement)).font.size = Pt(11)
-
-    p_date = doc.add_paragraph(f"{city} le : ..............................")
-    p_date.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    p_date.paragraph_format.space_before = Pt(0)
-    p_date.paragraph_format.space_after = Pt(0)
-    for run in p_date.runs:
-        run.font.size = Pt(11)
+    c6 = total_cells[6]
+    c6.vertical_alignment = v_center
+    fill_cell_paragraph(c6, fmt_amount_fr(total_versement), align="right", size=10, bold=True)
+
+    append_body_element(
+        doc,
+        rcar_paragraph(
+            "Le présent état est arrêté à la somme de : " + amount_words_upper(total_versement),
+            align="left",
+            size=11,
+            before=8,
+            after=10,
+        ),
+    )
+    append_body_element(doc, rcar_paragraph(f"{city} le : ..............................", align="right", size=11))
 
     # Start page 2 (exactly 2 pages)
     doc.add_page_break()
@@ -2468,277 +2856,153 @@ def _generate_rcar_docx(
     # ------------------------------
     # Page 2: Justificatif de Versement
     # ------------------------------
-    top_tbl = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.62, usable_w_mm * 0.38])
+    top_col_w = [usable_w_mm * 0.62, usable_w_mm * 0.38]
+    top_tbl = add_table_with_widths(doc, cols=2, col_widths_mm=top_col_w)
     top_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-    set_table_fixed_layout(top_tbl, [usable_w_mm * 0.62, usable_w_mm * 0.38])
-    remove_docx_table_borders(top_tbl)
-    set_table_cell_margins(top_tbl, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
+    configure_table(top_tbl, top_col_w, bordered=False, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
 
-    c_left = top_tbl.rows[0].cells[0]
+    top_cells = top_tbl.rows[0].cells
+    c_left = top_cells[0]
     c_left.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-    clear_cell(c_left)
-    p_logo = c_left.paragraphs[0]
-    p_logo.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_logo.paragraph_format.space_before = Pt(0)
-    p_logo.paragraph_format.space_after = Pt(0)
-    r_logo = p_logo.add_run("RCAR")
-    r_logo.bold = True
-    r_logo.font.size = Pt(24)
-
+    fill_cell_paragraph(c_left, "RCAR", align="left", size=24, bold=True)
     if arabic_header:
-        p_ar = c_left.add_paragraph(arabic_header)
-        p_ar.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        p_ar.paragraph_format.space_before = Pt(0)
-        p_ar.paragraph_format.space_after = Pt(0)
-        for run in p_ar.runs:
-            run.font.size = Pt(8)
-
-    p_sub = c_left.add_paragraph("Regime Collectif d'Allocation de Retraite")
-    p_sub.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_sub.paragraph_format.space_before = Pt(0)
-    p_sub.paragraph_format.space_after = Pt(0)
-    for run in p_sub.runs:
-        run.font.size = Pt(9)
+        c_left._tc.append(rcar_paragraph(arabic_header, align="left", size=8))
+    c_left._tc.append(rcar_paragraph("Regime Collectif d'Allocation de Retraite", align="left", size=9))
 
-    clear_cell(top_tbl.rows[0].cells[1])
-    spacer_top = doc.add_paragraph()
-    spacer_top.paragraph_format.space_before = Pt(0)
-    spacer_top.paragraph_format.space_after = Pt(4)
+    clear_cell(top_cells[1])
+    add_table_separator(doc, 4)
 
     title_width = 95.0
     title_tbl = add_table_with_widths(doc, cols=1, col_widths_mm=[title_width])
     title_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-    set_table_fixed_layout(title_tbl, [title_width])
-    set_table_borders(title_tbl, sz=4)
-    set_table_cell_margins(title_tbl, top_mm=0.8, bottom_mm=0.8, left_mm=1.0, right_mm=1.0)
+    configure_table(title_tbl, [title_width], bordered=True, top_mm=0.8, bottom_mm=0.8, left_mm=1.0, right_mm=1.0)
     tcell = title_tbl.rows[0].cells[0]
-    tcell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    p_title = tcell.paragraphs[0]
-    p_title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_title.paragraph_format.space_before = Pt(0)
-    p_title.paragraph_format.space_after = Pt(0)
-    r_title = p_title.add_run("Justificatif de Versement")
-    r_title.bold = True
-    r_title.font.size = Pt(14)
+    tcell.vertical_alignment = v_center
+    fill_cell_paragraph(tcell, "Justificatif de Versement", align="center", size=14, bold=True)
 
-    spacer_after_title = doc.add_paragraph()
-    spacer_after_title.paragraph_format.space_before = Pt(0)
-    spacer_after_title.paragraph_format.space_after = Pt(4)
+    add_table_separator(doc, 4)
 
-    info_tbl = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.34, usable_w_mm * 0.66])
+    info_col_w = [usable_w_mm * 0.34, usable_w_mm * 0.66]
+    info_tbl = add_table_with_widths(doc, cols=2, col_widths_mm=info_col_w)
     info_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-    set_table_fixed_layout(info_tbl, [usable_w_mm * 0.34, usable_w_mm * 0.66])
-    remove_docx_table_borders(info_tbl)
-    set_table_cell_margins(info_tbl, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
+    configure_table(info_tbl, info_col_w, bordered=False, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
 
-    info_left = info_tbl.rows[0].cells[0]
-    info_right = info_tbl.rows[0].cells[1]
+    info_left, info_right = info_tbl.rows[0].cells
     info_left.vertical_alignment = WD_ALIGN_VERTICAL.TOP
     info_right.vertical_alignment = WD_ALIGN_VERTICAL.TOP
 
-    left_box_width = (usable_w_mm * 0.34) - 2.0
+    left_box_width = info_col_w[0] - 2.0
     left_box = info_left.add_table(rows=1, cols=1)
     left_box.alignment = WD_TABLE_ALIGNMENT.LEFT
-    set_table_fixed_layout(left_box, [left_box_width])
-    set_table_borders(left_box, sz=4)
-    set_table_cell_margins(left_box, top_mm=1.0, bottom_mm=1.0, left_mm=1.5, right_mm=1.5)
+    configure_table(left_box, [left_box_width], bordered=True, top_mm=1.0, bottom_mm=1.0, left_mm=1.5, right_mm=1.5)
     lcell = left_box.rows[0].cells[0]
     lcell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-    pl0 = lcell.paragraphs[0]
-    pl0.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    pl0.paragraph_format.space_before = Pt(0)
-    pl0.paragraph_format.space_after = Pt(8)
-    rl0 = pl0.add_run("Dénomination")
-    rl0.bold = True
-    rl0.font.size = Pt(10)
-    pl1 = lcell.add_paragraph(f"COMMUNE {commune}")
-    pl1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    pl1.paragraph_format.space_before = Pt(5)
-    pl1.paragraph_format.space_after = Pt(2)
-    for run in pl1.runs:
-        run.font.size = Pt(10)
-    pl2 = lcell.add_paragraph(f"PROVINCE DE {province}")
-    pl2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    pl2.paragraph_format.space_before = Pt(0)
-    pl2.paragraph_format.space_after = Pt(0)
-    for run in pl2.runs:
-        run.font.size = Pt(10)
+    fill_cell_paragraph(lcell, "Dénomination", align="left", size=10, bold=True, after=8)
+    lcell._tc.append(rcar_paragraph(f"COMMUNE {commune}", align="center", size=10, before=5, after=2))
+    lcell._tc.append(rcar_paragraph(f"PROVINCE DE {province}", align="center", size=10))
 
     fields_tbl = info_right.add_table(rows=3, cols=2)
     fields_tbl.alignment = WD_TABLE_ALIGNMENT.LEFT
-    set_table_fixed_layout(fields_tbl, [45.0, (usable_w_mm * 0.66) - 45.0])
-    remove_docx_table_borders(fields_tbl)
-    set_table_cell_margins(fields_tbl, top_mm=0.2, bottom_mm=0.2, left_mm=0.0, right_mm=0.0)
+    configure_table(
+        fields_tbl,
+        [45.0, info_col_w[1] - 45.0],
+        bordered=False,
+        top_mm=0.2, bottom_mm=0.2, left_mm=0.0, right_mm=0.0,
+    )
 
-    for row in fields_tbl.rows:
-        for c in row.cells:
-            c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+    fields_cells = [row.cells for row in fields_tbl.rows]
+    for row_cells in fields_cells:
+        for c in row_cells:
+            c.vertical_alignment = v_center
+
+    fill_cell_paragraph(fields_cells[0][0], "Numéro d'adhésion :", align="left", size=10)
+    render_digit_boxes(fields_cells[0][1], adhesion_number, boxes=8, box_width_mm=4.5, font_size_pt=10)
 
-    p_a = fields_tbl.rows[0].cells[0].paragraphs[0]
-    p_a.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_a.paragraph_format.space_before = Pt(0)
-    p_a.paragraph_format.space_after = Pt(0)
-    p_a.add_run("Numéro d'adhésion :").font.size = Pt(10)
-    render_digit_boxes(fields_tbl.rows[0].cells[1], adhesion_number, boxes=8, box_width_mm=4.5, font_size_pt=10)
-
-    p_y = fields_tbl.rows[1].cells[0].paragraphs[0]
-    p_y.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_y.paragraph_format.space_before = Pt(0)
-    p_y.paragraph_format.space_after = Pt(0)
-    p_y.add_run("Année :").font.size = Pt(10)
-    render_digit_boxes(fields_tbl.rows[1].cells[1], f"{year:04d}" if year > 0 else "", boxes=4, box_width_mm=4.5, font_size_pt=10)
-
-    p_q = fields_tbl.rows[2].cells[0].paragraphs[0]
-    p_q.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_q.paragraph_format.space_before = Pt(0)
-    p_q.paragraph_format.space_after = Pt(0)
-    p_q.add_run("Trimestre :").font.size = Pt(10)
-
-    tri_cell = fields_tbl.rows[2].cells[1]
+    fill_cell_paragraph(fields_cells[1][0], "Année :", align="left", size=10)
+    render_digit_boxes(fields_cells[1][1], year_digits, boxes=4, box_width_mm=4.5, font_size_pt=10)
+
+    fill_cell_paragraph(fields_cells[2][0], "Trimestre :", align="left", size=10)
+
+    tri_cell = fields_cells[2][1]
     tri_tbl = tri_cell.add_table(rows=1, cols=3)
     tri_tbl.alignment = WD_TABLE_ALIGNMENT.LEFT
-    set_table_fixed_layout(tri_tbl, [8.5, 10.0, 58.0])
-    remove_docx_table_borders(tri_tbl)
-    set_table_cell_margins(tri_tbl, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
-    render_digit_boxes(
-        tri_tbl.rows[0].cells[0],
-        str(quarter) if quarter in (1, 2, 3, 4) else "",
-        boxes=1,
-        box_width_mm=4.5,
-        font_size_pt=10,
-    )
-    p_mois_label = tri_tbl.rows[0].cells[1].paragraphs[0]
-    p_mois_label.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_mois_label.paragraph_format.space_before = Pt(0)
-    p_mois_label.paragraph_format.space_after = Pt(0)
-    p_mois_label.add_run("MOIS").font.size = Pt(9)
-    p_mois_val = tri_tbl.rows[0].cells[2].paragraphs[0]
-    p_mois_val.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p_mois_val.paragraph_format.space_before = Pt(0)
-    p_mois_val.paragraph_format.space_after = Pt(0)
-    rv_mois = p_mois_val.add_run(quarter_months_label(period_months))
-    rv_mois.bold = True
-    rv_mois.font.size = Pt(10)
-
-    spacer_before_amounts = doc.add_paragraph()
-    spacer_before_amounts.paragraph_format.space_before = Pt(0)
-    spacer_before_amounts.paragraph_format.space_after = Pt(4)
-
-    rg_rows = {
-        "cotisation_salariale": None,
-        "contribution_patronale": None,
-        "cotisation_validation": None,
-        "sous_total": None,
-        "contribution_validation": None,
-        "majoration_retard": None,
-        "total_abc": None,
-        "total_general": None,
-    }
-    rg_rows[justificatif_rg_key] = total_prelev
-    rg_rows["sous_total"] = total_prelev
-    rg_rows["total_abc"] = total_prelev
-    rg_rows["total_general"] = total_prelev
+    configure_table(tri_tbl, [8.5, 10.0, 58.0], bordered=False, top_mm=0.0, bottom_mm=0.0, left_mm=0.0, right_mm=0.0)
+    tri_cells = tri_tbl.rows[0].cells
+    render_digit_boxes(tri_cells[0], quarter_digit, boxes=1, box_width_mm=4.5, font_size_pt=10)
+    fill_cell_paragraph(tri_cells[1], "MOIS", align="center", size=9)
+    fill_cell_paragraph(tri_cells[2], quarter_months_label(period_months), align="left", size=10, bold=True)
+
+    add_table_separator(doc, 4)
+
+    # RG amount per form line, in _RCAR_FORM_ROWS order; the other lines stay blank.
+    prelev_keys = (justificatif_rg_key, "sous_total", "total_abc", "total_general")
+    rg_values = tuple(total_prelev if key in prelev_keys else None for _, key in _RCAR_FORM_ROWS)
 
     form_col_w = [usable_w_mm * 0.34, usable_w_mm * 0.33, usable_w_mm * 0.33]
     form_tbl = add_table_with_widths(doc, cols=3, col_widths_mm=form_col_w)
     form_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-    set_table_fixed_layout(form_tbl, form_col_w)
-    set_table_borders(form_tbl, sz=4)
-    set_table_cell_margins(form_tbl, top_mm=0.35, bottom_mm=0.35, left_mm=0.8, right_mm=0.8)
+    configure_table(form_tbl, form_col_w, bordered=True, top_mm=0.35, bottom_mm=0.35, left_mm=0.8, right_mm=0.8)
 
     h1 = form_tbl.rows[0]
     h1.height = Mm(7.5)
-    h1.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-    h1.cells[0].vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-    p0 = h1.cells[0].paragraphs[0]
-    p0.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p0.paragraph_format.space_before = Pt(0)
-    p0.paragraph_format.space_after = Pt(0)
-    rr0 = p0.add_run("Nature du Versement")
-    rr0.bold = True
-    rr0.font.size = Pt(10)
-    h1.cells[1].merge(h1.cells[2])
-    p01 = h1.cells[1].paragraphs[0]
-    p01.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p01.paragraph_format.space_before = Pt(0)
-    p01.paragraph_format.space_after = Pt(0)
-    rr01 = p01.add_run("Montants en DH")
-    rr01.bold = True
-    rr01.font.size = Pt(10)
+    h1.height_rule = exactly
+    h1_cells = h1.cells
+    h1_cells[0].vertical_alignment = v_center
+    fill_cell_paragraph(h1_cells[0], "Nature du Versement", align="center", size=10, bold=True)
+    h1_cells[1].merge(h1_cells[2])
+    fill_cell_paragraph(h1_cells[1], "Montants en DH", align="center", size=10, bold=True)
 
     h2 = form_tbl.add_row()
     h2.height = Mm(7.5)
-    h2.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-    h2.cells[0].text = ""
-    p_rg = h2.cells[1].paragraphs[0]
-    p_rg.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_rg.paragraph_format.space_before = Pt(0)
-    p_rg.paragraph_format.space_after = Pt(0)
-    rr_rg = p_rg.add_run("Régime Général (RG)")
-    rr_rg.bold = True
-    rr_rg.font.size = Pt(9)
-    p_rc = h2.cells[2].paragraphs[0]
-    p_rc.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p_rc.paragraph_format.space_before = Pt(0)
-    p_rc.paragraph_format.space_after = Pt(0)
-    rr_rc = p_rc.add_run("Régime Complémentaire (RC)")
-    rr_rc.bold = True
-    rr_rc.font.size = Pt(9)
-
-    form_rows = [
-        ("Cotisation Salariale", "cotisation_salariale"),
-        ("Contribution Patronale", "contribution_patronale"),
-        ("Cotisation Validation", "cotisation_validation"),
-        ("Sous-Total", "sous_total"),
-        ("Contribution Validation", "contribution_validation"),
-        ("Majoration de Retard", "majoration_retard"),
-        ("Total (A + B + C)", "total_abc"),
-        ("Total Général (RG + RC)", "total_general"),
-    ]
-
-    for label, key in form_rows:
+    h2.height_rule = exactly
+    h2_cells = h2.cells
+    h2_cells[0].text = ""
+    fill_cell_paragraph(h2_cells[1], "Régime Général (RG)", align="center", size=9, bold=True)
+    fill_cell_paragraph(h2_cells[2], "Régime Complémentaire (RC)", align="center", size=9, bold=True)
+
+    # The form rows share everything but the label and the RG amount: a blank row is built once
+    # through python-docx and cached, then each document fills in copies and appends them together.
+    form_key = tuple(form_col_w)
+    blank_form_tr = _RCAR_FORM_ROW_TR.get(form_key)
+    if blank_form_tr is None:
         row = form_tbl.add_row()
         row.height = Mm(10.2)
-        row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-        for c in row.cells:
-            c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        pl = row.cells[0].paragraphs[0]
-        pl.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        pl.paragraph_format.space_before = Pt(0)
-        pl.paragraph_format.space_after = Pt(0)
-        rl = pl.add_run(label)
-        rl.font.size = Pt(10)
-
-        render_amount_boxes(row.cells[1], rg_rows.get(key), total_width_mm=form_col_w[1] - 2.0, boxes=11)
-        render_amount_boxes(row.cells[2], None, total_width_mm=form_col_w[2] - 2.0, boxes=11)
-
-    spacer_bottom = doc.add_paragraph()
-    spacer_bottom.paragraph_format.space_before = Pt(0)
-    spacer_bottom.paragraph_format.space_after = Pt(5)
-
-    bottom_tbl = add_table_with_widths(doc, cols=2, col_widths_mm=[usable_w_mm * 0.5, usable_w_mm * 0.5])
+        row.height_rule = exactly
+        row_cells = row.cells
+        for c in row_cells:
+            c.vertical_alignment = v_center
+        fill_cell_paragraph(row_cells[0], "", align="left", size=10)
+        render_amount_boxes(row_cells[1], None, total_width_mm=form_col_w[1] - 2.0, boxes=11)
+        render_amount_boxes(row_cells[2], None, total_width_mm=form_col_w[2] - 2.0, boxes=11)
+        blank_form_tr = row._tr
+        form_tbl._tbl.remove(blank_form_tr)
+        _RCAR_FORM_ROW_TR[form_key] = blank_form_tr
+
+    form_trs = []
+    for (label, _), rg_amount in zip(_RCAR_FORM_ROWS, rg_values):
+        tr = copy.deepcopy(blank_form_tr)
+        tr.tc_lst[0].p_lst[0][-1].text = label
+        if rg_amount is not None:
+            fill_amount_strip(tr.tc_lst[1].find(_QN["tbl"]), rg_amount, boxes=11)
+        form_trs.append(tr)
+    form_tbl._tbl.extend(form_trs)
+
+    add_table_separator(doc, 5)
+
+    bottom_col_w = [usable_w_mm * 0.5, usable_w_mm * 0.5]
+    bottom_tbl = add_table_with_widths(doc, cols=2, col_widths_mm=bottom_col_w)
     bottom_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
-    set_table_fixed_layout(bottom_tbl, [usable_w_mm * 0.5, usable_w_mm * 0.5])
-    set_table_borders(bottom_tbl, sz=4)
-    set_table_cell_margins(bottom_tbl, top_mm=1.0, bottom_mm=1.0, left_mm=1.0, right_mm=1.0)
+    configure_table(bottom_tbl, bottom_col_w, bordered=True, top_mm=1.0, bottom_mm=1.0, left_mm=1.0, right_mm=1.0)
 
     b_row = bottom_tbl.rows[0]
     b_row.height = Mm(42)
-    b_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-    for c in b_row.cells:
+    b_row.height_rule = exactly
+    b_cells = b_row.cells
+    for c, text in zip(b_cells, ("Cadre réservé au RCAR", "Cachet et signature")):
         c.vertical_alignment = WD_ALIGN_VERTICAL.TOP
-        p = c.paragraphs[0]
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(0)
-    lrun = b_row.cells[0].paragraphs[0].add_run("Cadre réservé au RCAR")
-    lrun.bold = True
-    lrun.font.size = Pt(10)
-    rrun = b_row.cells[1].paragraphs[0].add_run("Cachet et signature")
-    rrun.bold = True
-    rrun.font.size = Pt(10)
+        fill_cell_paragraph(c, text, align="center", size=10, bold=True)
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
 
 
 def generate_rcar_salariale_docx(payload: Dict[str, Any], docx_path: str) -> None:
@@ -2763,15 +3027,27 @@ def generate_rcar_patronale_docx(payload: Dict[str, Any], docx_path: str) -> Non
     )
 
 
+# Document types with their own layout; everything else gets the generic worker table below.
+_DOC_GENERATORS: Dict[str, Callable[[Dict[str, Any], str], None]] = {
+    "bordereau": generate_bordereau_docx,
+    "rcar-salariale": generate_rcar_salariale_docx,
+    "rcar-patronale": generate_rcar_patronale_docx,
+}
+
+
 def generate_generic_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    try:
-        from docx import Document
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Mm
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+    _load_docx()
 
     document_type = str(payload.get("documentType") or "").strip()
+    payment_generator = _PAYMENT_DOC_GENERATORS.get(document_type)
+    if payment_generator is not None:
+        payment_generator(payload, docx_path, document_type=document_type)
+        return
+    generator = _DOC_GENERATORS.get(document_type)
+    if generator is not None:
+        generator(payload, docx_path)
+        return
+
     year = int(payload.get("year") or 0)
     month = payload.get("month")
     quarter = payload.get("quarter")
@@ -2781,37 +3057,7 @@ def generate_generic_docx(payload: Dict[str, Any], docx_path: str) -> None:
     ref = options or {}
     age_limit = int(options.get("rcarAgeLimit") or 60)
 
-    if document_type == "recu-combined":
-        generate_recu_docx(payload, docx_path)
-        return
-    if document_type == "demande-autorisation":
-        generate_demande_autorisation_docx(payload, docx_path)
-        return
-    if document_type in ("certificat-paiement", "certificat-paiement-combined"):
-        generate_certificat_paiement_docx(payload, docx_path)
-        return
-    if document_type == "ordre-paiement":
-        generate_ordre_paiement_docx(payload, docx_path)
-        return
-    if document_type == "mandat-paiement":
-        generate_mandat_paiement_docx(payload, docx_path)
-        return
-    if document_type == "bordereau":
-        generate_bordereau_docx(payload, docx_path)
-        return
-    if document_type == "rcar-salariale":
-        generate_rcar_salariale_docx(payload, docx_path)
-        return
-    if document_type == "rcar-patronale":
-        generate_rcar_patronale_docx(payload, docx_path)
-        return
-
-    doc = Document()
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(section0, top_mm=12, bottom_mm=12, left_mm=12, right_mm=12)
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=10)
+    doc = new_a4_document(top_mm=12, bottom_mm=12, left_mm=12, right_mm=12, font_size_pt=10)
 
     title = DOC_TITLE_MAP.get(document_type, document_type.upper() if document_type else "DOCUMENT")
     add_centered_title(doc, title, font_size_pt=14)
@@ -2869,27 +3115,53 @@ def generate_generic_docx(payload: Dict[str, Any], docx_path: str) -> None:
             for i, h in enumerate(headers):
                 hdr[i].text = h
 
+            # Worker rows only differ in their run texts: the first goes through python-docx and the
+            # rest are clones of its w:tr with the texts swapped, appended in one go.
+            first_tr = None
+            worker_trs = []
             for w in rows_fin:
-                r = table.add_row().cells
-                r[0].text = w["nom_prenom"]
-                r[1].text = w["cin"]
-                r[2].text = w["type"]
-                r[3].text = str(w["days"])
-                r[4].text = fmt_amount(w["gross"])
-                r[5].text = fmt_amount(w["deduction"])
-                r[6].text = fmt_amount(w["net"])
+                values = (
+                    w.nom_prenom,
+                    w.cin,
+                    w.type,
+                    str(w.days),
+                    fmt_amount(w.gross),
+                    fmt_amount(w.deduction),
+                    fmt_amount(w.net),
+                )
+                if first_tr is None:
+                    for cell, value in zip(table.add_row().cells, values):
+                        cell.text = value
+                    first_tr = table._tbl.tr_lst[-1]
+                    continue
+                tr = copy.deepcopy(first_tr)
+                for tc, value in zip(tr.tc_lst, values):
+                    tc.p_lst[0].r_lst[0].text = value
+                worker_trs.append(tr)
+            table._tbl.extend(worker_trs)
 
             doc.add_paragraph(
                 f"Totaux - Jours: {int(totals['days'])} | Brut: {fmt_amount(totals['gross'])} | "
                 f"Prélèvement: {fmt_amount(totals['deduction'])} | Net: {fmt_amount(totals['net'])}"
             )
 
-    doc.save(docx_path)
+    save_docx(doc, docx_path)
+
+
+def write_json(payload: Any) -> None:
+    # Encoded once and written as UTF-8 bytes, as backend/main.py does for its responses.
+    if orjson is not None:
+        data = orjson.dumps(payload)
+    else:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 def main() -> None:
     payload = parse_input_json()
-    document_type = str(payload.get("documentType") or "").strip()
+    # Interned so the type-keyed maps and comparisons downstream hit the identity fast path.
+    document_type = sys.intern(str(payload.get("documentType") or "").strip())
     output_dir = str(payload.get("outputDir") or "").strip()
 
     if not output_dir:
@@ -2903,8 +3175,7 @@ def main() -> None:
     docx_path = os.path.join(output_dir, docx_name)
     generate_generic_docx({**payload, "documentType": document_type}, docx_path)
     result: Dict[str, Any] = {"success": True, "docxFileName": docx_name, "docxFilePath": docx_path}
-
-    sys.stdout.write(json.dumps(result, ensure_ascii=False))
+    write_json(result)
 
 
 if __name__ == "__main__":
@@ -2912,5 +3183,5 @@ if __name__ == "__main__":
         main()
     except Exception as exc:
         error = {"success": False, "message": str(exc)}
-        sys.stdout.write(json.dumps(error, ensure_ascii=False))
+        write_json(error)
         sys.exit(1)
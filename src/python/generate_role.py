@@ -1,11 +1,120 @@
 #!/usr/bin/env python3
+import copy
+import io
 import json
 import math
 import os
 import re
 import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None
+
+try:
+    from .generate_document import write_docx_package
+except ImportError:  # run as a script from src/python
+    from generate_document import write_docx_package
+
+_SAFE_FN_RE = re.compile(r"[^0-9A-Za-z._-]+")
+_DMY_DATE_RE = re.compile(r"^\d{2}/\d{2}/\d{4}$")
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_TRUE_TEXTS = frozenset(("1", "true", "yes", "y", "on"))
+
+# Clark-notation WordprocessingML tags, identical to qn("w:<name>") but built once for the XML helpers.
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_XMLNS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_QN = {
+    name: _W_NS + name
+    for name in (
+        "tcBorders",
+        "textDirection",
+        "tblBorders",
+        "tblCellMar",
+        "tblLayout",
+        "tblW",
+        "tblInd",
+        "top",
+        "left",
+        "bottom",
+        "right",
+        "insideH",
+        "insideV",
+        "val",
+        "sz",
+        "color",
+        "w",
+        "type",
+    )
+}
+
+# python-docx symbols, bound by _load_docx() on first use so the module stays
+# importable (filename helpers, number formatting) without the dependency.
+Document: Any = None
+Mm: Any = None
+Pt: Any = None
+OxmlElement: Any = None
+parse_xml: Any = None
+WD_ALIGN_PARAGRAPH: Any = None
+WD_ALIGN_VERTICAL: Any = None
+WD_ROW_HEIGHT_RULE: Any = None
+WD_TABLE_ALIGNMENT: Any = None
+
+
+def _load_docx() -> None:
+    global Document, Mm, Pt, OxmlElement, parse_xml
+    global WD_ALIGN_PARAGRAPH, WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT
+    if Document is not None:
+        return
+    try:
+        from docx import Document as document_factory
+        from docx.enum.table import WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.oxml import OxmlElement, parse_xml
+        from docx.shared import Mm, Pt
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("Missing Python dependency for Word generation. Install: python-docx") from exc
+    Document = document_factory
+
+
+# Blank A4 documents with the role margins and default font, keyed by (top, bottom, left, right) in mm.
+# Deep-copying one is much cheaper than Document() re-reading and parsing the bundled template.
+_ROLE_DOCUMENT_PROTOTYPES: Dict[Tuple[float, float, float, float], Any] = {}
+# Parsed cell paragraphs without their text, keyed by (align, bold, size_pt, underline).
+_ROLE_CELL_P_TEMPLATES: Dict[Tuple[Any, bool, float, bool], Any] = {}
+_ROLE_CELL_P_XML = (
+    "<w:p " + _W_XMLNS + '><w:pPr><w:spacing w:before="0" w:after="0"/><w:jc w:val="{align}"/></w:pPr>'
+    '<w:r/><w:r><w:rPr>{bold}<w:sz w:val="{size}"/>{underline}</w:rPr></w:r></w:p>'
+)
+# Role body rows with borders and empty cells, keyed by (gridCol widths, row height in twips).
+_ROLE_BODY_TR: Dict[Tuple[Tuple[str, ...], int], Any] = {}
+_ROLE_BODY_TC_XML = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/><w:vAlign w:val="center"/><w:tcBorders>'
+    '<w:top w:val="single" w:sz="10" w:color="000000"/><w:left w:val="single" w:sz="10" w:color="000000"/>'
+    '<w:bottom w:val="single" w:sz="10" w:color="000000"/><w:right w:val="single" w:sz="10" w:color="000000"/>'
+    "</w:tcBorders></w:tcPr></w:tc>"
+)
+# CIN cell paragraph: number line, break, validity line, both runs in 8 pt.
+_ROLE_CIN_P_XML = (
+    "<w:p " + _W_XMLNS + '><w:pPr><w:spacing w:before="0" w:after="0"/><w:jc w:val="left"/></w:pPr><w:r/>'
+    '<w:r><w:rPr><w:sz w:val="16"/></w:rPr></w:r><w:r><w:rPr><w:sz w:val="16"/></w:rPr></w:r></w:p>'
+)
+_ROLE_EMPTY_P_XML = "<w:p " + _W_XMLNS + "><w:r/></w:p>"
+# Parsed fixed fragments (the XML strings above and below), keyed by their source text.
+_ROLE_XML_TEMPLATES: Dict[str, Any] = {}
+# Parsed <w:tcBorders> keyed by their (edge, val, sz, color) entries, and <w:tblCellMar> keyed by
+# the (top, bottom, left, right) margins in mm; fresh cells and tables get a deep copy.
+_TC_BORDERS_TEMPLATES: Dict[Tuple[Tuple[str, str, str, str], ...], Any] = {}
+_TBL_CELL_MAR_TEMPLATES: Dict[Tuple[float, float, float, float], Any] = {}
+_TBL_NO_BORDERS_XML = (
+    f"<w:tblBorders {_W_XMLNS}>"
+    + "".join(f'<w:{edge} w:val="nil"/>' for edge in ("top", "left", "bottom", "right", "insideH", "insideV"))
+    + "</w:tblBorders>"
+)
 
 
 def mm_to_pt(value_mm: float) -> float:
@@ -19,23 +128,30 @@ def parse_bool(value: Any) -> bool:
         return False
     if isinstance(value, (int, float)):
         return bool(value)
-    text = str(value).strip().lower()
-    if text in ("1", "true", "yes", "y", "on"):
-        return True
-    if text in ("0", "false", "no", "n", "off", ""):
-        return False
-    return False
+    # Anything that is not an explicit "true" spelling ("0", "no", "", unknown text) is False.
+    return str(value).strip().lower() in _TRUE_TEXTS
 
 
 def fmt_amount(amount: Any, *, decimal_comma: bool) -> str:
-    text = f"{float(amount or 0):.2f}"
+    value = float(amount or 0)
+    if not value:
+        # -0.0 hashes like 0.0 but formats differently, so keep it out of the cache.
+        text = f"{value:.2f}"
+        return text.replace(".", ",") if decimal_comma else text
+    return _fmt_amount_cached(value, decimal_comma)
+
+
+# A role repeats the same daily rate and a few gross/deduction/net amounts on every page.
+@lru_cache(maxsize=2048)
+def _fmt_amount_cached(value: float, decimal_comma: bool) -> str:
+    text = f"{value:.2f}"
     return text.replace(".", ",") if decimal_comma else text
 
 
 def safe_filename_part(value: Any) -> str:
     text = str(value or "").strip()
     text = text.replace("\\", "-").replace("/", "-")
-    text = re.sub(r"[^0-9A-Za-z._-]+", "_", text)
+    text = _SAFE_FN_RE.sub("_", text)
     text = text.strip("._-")
     return text or "unknown"
 
@@ -45,89 +161,113 @@ def parse_input_json() -> Dict[str, Any]:
     if not raw:
         raise ValueError("No JSON input received on stdin")
     try:
+        # orjson parses the UTF-8 bytes directly, without decoding to str first.
+        if orjson is not None:
+            return orjson.loads(raw)
         return json.loads(raw.decode("utf-8"))
     except Exception as exc:
         raise ValueError(f"Invalid JSON input: {exc}") from exc
 
 
 def ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+    # The output directory usually exists already; one stat() then replaces makedirs' stat + mkdir attempt.
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+_UNITS_FR = ("", "Un", "Deux", "Trois", "Quatre", "Cinq", "Six", "Sept", "Huit", "Neuf")
+_TEENS_FR = (
+    "Dix",
+    "Onze",
+    "Douze",
+    "Treize",
+    "Quatorze",
+    "Quinze",
+    "Seize",
+    "Dix Sept",
+    "Dix Huit",
+    "Dix Neuf",
+)
+_TENS_FR = (
+    "",
+    "",
+    "Vingt",
+    "Trente",
+    "Quarante",
+    "Cinquante",
+    "Soixante",
+    "Soixante Dix",
+    "Quatre Vingt",
+    "Quatre Vingt Dix",
+)
 
 
 def number_to_words_fr(num: float) -> str:
     whole_part = int(math.floor(float(num or 0)))
     if whole_part == 0:
         return "Zero"
+    return _int_to_words_fr(whole_part)
 
-    units = ["", "Un", "Deux", "Trois", "Quatre", "Cinq", "Six", "Sept", "Huit", "Neuf"]
-    teens = [
-        "Dix",
-        "Onze",
-        "Douze",
-        "Treize",
-        "Quatorze",
-        "Quinze",
-        "Seize",
-        "Dix Sept",
-        "Dix Huit",
-        "Dix Neuf",
-    ]
-    tens = [
-        "",
-        "",
-        "Vingt",
-        "Trente",
-        "Quarante",
-        "Cinquante",
-        "Soixante",
-        "Soixante Dix",
-        "Quatre Vingt",
-        "Quatre Vingt Dix",
-    ]
 
-    def convert_below_hundred(n: int) -> str:
-        if n < 10:
-            return units[n]
-        if n < 20:
-            return teens[n - 10]
-        tens_digit = n // 10
-        unit_digit = n % 10
-        tens_word = tens[tens_digit]
-        if unit_digit == 0:
-            return tens_word
-        if unit_digit == 1 and tens_digit in (2, 3, 4, 5, 6):
-            return f"{tens_word} Et {units[unit_digit]}".strip()
-        unit_word = units[unit_digit]
-        return f"{tens_word} {unit_word}".strip()
-
-    def convert_below_thousand(n: int) -> str:
-        hundreds = n // 100
-        remainder = n % 100
-        words = ""
-        if hundreds > 0:
-            words += f"{units[hundreds]} Cent".strip()
-            if remainder > 0:
-                words += " "
+def _spell_below_hundred_fr(n: int) -> str:
+    if n < 10:
+        return _UNITS_FR[n]
+    if n < 20:
+        return _TEENS_FR[n - 10]
+    tens_digit, unit_digit = divmod(n, 10)
+    tens_word = _TENS_FR[tens_digit]
+    if unit_digit == 0:
+        return tens_word
+    if unit_digit == 1 and tens_digit in (2, 3, 4, 5, 6):
+        return f"{tens_word} Et Un"
+    return f"{tens_word} {_UNITS_FR[unit_digit]}"
+
+
+# 0-99 and the hundreds prefixes are small enough to spell out once at import.
+_FR_0_99 = tuple(_spell_below_hundred_fr(n) for n in range(100))
+_FR_HUNDREDS = tuple(f"{unit} Cent".strip() for unit in _UNITS_FR)
+
+
+def _below_thousand_fr(n: int) -> str:
+    hundreds, remainder = divmod(n, 100)
+    if hundreds > 0:
         if remainder > 0:
-            words += convert_below_hundred(remainder)
-        return words.strip()
-
-    def convert(n: int) -> str:
-        if n < 1000:
-            return convert_below_thousand(n)
-        if n < 1_000_000:
-            thousands = n // 1000
-            remainder = n % 1000
-            thousand_words = "Mille" if thousands == 1 else f"{convert_below_thousand(thousands)} Mille"
-            remainder_words = f" {convert_below_thousand(remainder)}" if remainder > 0 else ""
-            return f"{thousand_words}{remainder_words}".strip()
-        millions = n // 1_000_000
-        remainder = n % 1_000_000
-        million_words = "Un Million" if millions == 1 else f"{convert_below_thousand(millions)} Millions"
-        remainder_words = f" {convert(remainder)}" if remainder > 0 else ""
-        return f"{million_words}{remainder_words}".strip()
-
-    return convert(whole_part)
+            return f"{_FR_HUNDREDS[hundreds]} {_FR_0_99[remainder]}"
+        return _FR_HUNDREDS[hundreds]
+    return _FR_0_99[remainder]
+
+
+# Every group is non-empty when present, so the pieces are joined without any strip().
+@lru_cache(maxsize=4096)
+def _int_to_words_fr(n: int) -> str:
+    if n < 1000:
+        return _below_thousand_fr(n)
+    if n < 1_000_000:
+        thousands, remainder = divmod(n, 1000)
+        thousand_words = "Mille" if thousands == 1 else f"{_below_thousand_fr(thousands)} Mille"
+        if remainder > 0:
+            return f"{thousand_words} {_below_thousand_fr(remainder)}"
+        return thousand_words
+    millions, remainder = divmod(n, 1_000_000)
+    million_words = "Un Million" if millions == 1 else f"{_below_thousand_fr(millions)} Millions"
+    if remainder > 0:
+        return f"{million_words} {_int_to_words_fr(remainder)}"
+    return million_words
+
+
+class RoleRow(NamedTuple):
+    row_no: int
+    nom_prenom: str = ""
+    type_display: str = ""
+    # Cell texts, formatted once when the row is built; blank filler rows keep the empty defaults.
+    days_text: str = ""
+    salaire_text: str = ""
+    gross_text: str = ""
+    deduction_text: str = ""
+    net_text: str = ""
+    cin: str = ""
+    cin_validite: str = ""
+    is_blank: bool = False
 
 
 @dataclass(frozen=True)
@@ -590,65 +730,131 @@ def draw_role_pdf(payload: Dict[str, Any], pdf_path: str) -> None:
     c.save()
 
 
-def set_docx_cell_border(cell, **kwargs) -> None:
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
+def role_cell_paragraph(text: str, *, align, bold: bool, size_pt: float, underline: bool):
+    # Same markup as cell.text = "" followed by the alignment, spacing, add_run() and font setters
+    # (including the empty run and the explicit bold/underline "off" values), copied from a parsed
+    # template instead of going through python-docx per property.
+    key = (align, bold, size_pt, underline)
+    template = _ROLE_CELL_P_TEMPLATES.get(key)
+    if template is None:
+        template = parse_xml(
+            _ROLE_CELL_P_XML.format(
+                align=WD_ALIGN_PARAGRAPH.to_xml(align),
+                bold="<w:b/>" if bold else '<w:b w:val="0"/>',
+                size=int(Pt(size_pt).pt * 2),
+                underline='<w:u w:val="single"/>' if underline else '<w:u w:val="none"/>',
+            )
+        )
+        _ROLE_CELL_P_TEMPLATES[key] = template
+    p = copy.deepcopy(template)
+    # CT_R.text turns "\n" into <w:br/> exactly like add_run(text).
+    p[-1].text = text
+    return p
+
+
+def role_body_row(tbl, height_twips: int):
+    # Same markup as table.add_row() (tcW copied from the grid columns) followed by the exact
+    # row height, centred cells and the 1.25 pt grid borders add_role_table puts on every cell.
+    widths = tuple(grid_col.get(_QN["w"]) for grid_col in tbl.tblGrid.gridCol_lst)
+    key = (widths, height_twips)
+    template = _ROLE_BODY_TR.get(key)
+    if template is None:
+        template = parse_xml(
+            f"<w:tr {_W_XMLNS}><w:trPr>"
+            f'<w:trHeight w:val="{height_twips}" w:hRule="exact"/></w:trPr>'
+            + "".join(_ROLE_BODY_TC_XML.format(width=width) for width in widths)
+            + "</w:tr>"
+        )
+        _ROLE_BODY_TR[key] = template
+    return copy.deepcopy(template)
+
 
+def role_cin_paragraph(cin_value: str, cin_validite: str, *, blank: bool):
+    # Blank rows keep the bare paragraph left by cell.text = "".
+    xml = _ROLE_EMPTY_P_XML if blank else _ROLE_CIN_P_XML
+    template = _ROLE_XML_TEMPLATES.get(xml)
+    if template is None:
+        template = _ROLE_XML_TEMPLATES[xml] = parse_xml(xml)
+    p = copy.deepcopy(template)
+    if not blank:
+        # The trailing "\n" becomes the <w:br/> that add_break() used to append.
+        p[-2].text = (f"CIN N°: {cin_value}" if cin_value else "") + "\n"
+        p[-1].text = f"AU : {cin_validite}" if cin_validite else "AU :"
+    return p
+
+
+def set_docx_cell_border(cell, **kwargs) -> None:
     tc_pr = cell._tc.get_or_add_tcPr()
-    tc_borders = tc_pr.find(qn("w:tcBorders"))
+    tc_borders = tc_pr.find(_QN["tcBorders"])
     if tc_borders is None:
-        tc_borders = OxmlElement("w:tcBorders")
-        tc_pr.append(tc_borders)
+        # A cell without borders yet (the usual case) gets the whole element from a cached template.
+        key = tuple(
+            (edge, kwargs[edge].get("val", "single"), str(kwargs[edge].get("sz", 8)), kwargs[edge].get("color", "000000"))
+            for edge in ("top", "left", "bottom", "right")
+            if edge in kwargs
+        )
+        template = _TC_BORDERS_TEMPLATES.get(key)
+        if template is None:
+            template = parse_xml(
+                f"<w:tcBorders {_W_XMLNS}>"
+                + "".join(f'<w:{edge} w:val="{val}" w:sz="{sz}" w:color="{color}"/>' for edge, val, sz, color in key)
+                + "</w:tcBorders>"
+            )
+            _TC_BORDERS_TEMPLATES[key] = template
+        tc_pr.append(copy.deepcopy(template))
+        return
+    val_attr = _QN["val"]
+    sz_attr = _QN["sz"]
+    color_attr = _QN["color"]
     for edge in ("top", "left", "bottom", "right"):
         if edge in kwargs:
             edge_data = kwargs[edge]
-            tag = qn(f"w:{edge}")
-            element = tc_borders.find(tag)
+            element = tc_borders.find(_QN[edge])
             if element is None:
-                element = OxmlElement(f"w:{edge}")
+                element = OxmlElement("w:" + edge)
                 tc_borders.append(element)
-            element.set(qn("w:val"), edge_data.get("val", "single"))
-            element.set(qn("w:sz"), str(edge_data.get("sz", 8)))
-            element.set(qn("w:color"), edge_data.get("color", "000000"))
+            element.set(val_attr, edge_data.get("val", "single"))
+            element.set(sz_attr, str(edge_data.get("sz", 8)))
+            element.set(color_attr, edge_data.get("color", "000000"))
 
 
 def set_docx_cell_text_direction(cell, direction: str) -> None:
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
-
     tc_pr = cell._tc.get_or_add_tcPr()
-    text_dir = tc_pr.find(qn("w:textDirection"))
+    text_dir = tc_pr.find(_QN["textDirection"])
     if text_dir is None:
         text_dir = OxmlElement("w:textDirection")
         tc_pr.append(text_dir)
-    text_dir.set(qn("w:val"), direction)
+    text_dir.set(_QN["val"], direction)
 
 
 def remove_docx_table_borders(table) -> None:
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
-
     tbl_pr = table._tbl.tblPr
-    tbl_borders = tbl_pr.find(qn("w:tblBorders"))
+    tbl_borders = tbl_pr.find(_QN["tblBorders"])
     if tbl_borders is None:
-        tbl_borders = OxmlElement("w:tblBorders")
-        tbl_pr.append(tbl_borders)
+        # New tables have no tblBorders yet: copy the whole element instead of building six edges
+        # through OxmlElement, which resolves the prefixed tag and runs the parser for each one.
+        template = _ROLE_XML_TEMPLATES.get(_TBL_NO_BORDERS_XML)
+        if template is None:
+            template = _ROLE_XML_TEMPLATES[_TBL_NO_BORDERS_XML] = parse_xml(_TBL_NO_BORDERS_XML)
+        tbl_pr.append(copy.deepcopy(template))
+        return
     for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
-        element = tbl_borders.find(qn(f"w:{edge}"))
+        element = tbl_borders.find(_QN[edge])
         if element is None:
             element = OxmlElement(f"w:{edge}")
             tbl_borders.append(element)
-        element.set(qn("w:val"), "nil")
+        element.set(_QN["val"], "nil")
 
 
+# Only a handful of distinct widths and margins reach this (layout constants and column widths), so
+# each conversion is done once. The float chain is kept as is so the twips stay bit-for-bit the same.
+@lru_cache(maxsize=256)
 def mm_to_twips(value_mm: float) -> int:
     # 1 point = 20 twips
     return int(round(mm_to_pt(float(value_mm)) * 20.0))
 
 
 def set_page_margins(section, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
-    from docx.shared import Mm
-
     section.top_margin = Mm(top_mm)
     section.bottom_margin = Mm(bottom_mm)
     section.left_margin = Mm(left_mm)
@@ -656,29 +862,32 @@ def set_page_margins(section, *, top_mm: float, bottom_mm: float, left_mm: float
 
 
 def set_default_font(doc, *, font_name: str, font_size_pt: float) -> None:
-    from docx.shared import Pt
-
     normal_style = doc.styles["Normal"]
     normal_style.font.name = font_name
     normal_style.font.size = Pt(font_size_pt)
 
 
-def add_centered_title(doc, text: str, *, font_size_pt: float) -> None:
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.shared import Pt
-
+def add_centered_title(doc, text: str, *, font_size_pt: float):
     p = doc.add_paragraph()
     p.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = p.add_run(text)
     run.bold = True
     run.underline = True
     run.font.size = Pt(font_size_pt)
+    return p
 
 
-def add_table_with_widths(doc, *, cols: int, col_widths_mm: List[float]):
-    from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.shared import Mm
+def append_body_element(doc, element) -> None:
+    # Body content goes before the final sectPr, as python-docx's own add_paragraph/add_table do.
+    body = doc.element.body
+    sect_pr = body.sectPr
+    if sect_pr is None:
+        body.append(element)
+    else:
+        sect_pr.addprevious(element)
+
 
+def add_table_with_widths(doc, *, cols: int, col_widths_mm: List[float]):
     t = doc.add_table(rows=1, cols=cols)
     t.alignment = WD_TABLE_ALIGNMENT.CENTER
     t.style = "Table Grid"
@@ -690,96 +899,114 @@ def add_table_with_widths(doc, *, cols: int, col_widths_mm: List[float]):
 
 
 def set_docx_table_cell_margins(table, *, top_mm: float, bottom_mm: float, left_mm: float, right_mm: float) -> None:
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
-
     tbl_pr = table._tbl.tblPr
-    cell_mar = tbl_pr.find(qn("w:tblCellMar"))
+    cell_mar = tbl_pr.find(_QN["tblCellMar"])
     if cell_mar is None:
-        cell_mar = OxmlElement("w:tblCellMar")
-        tbl_pr.append(cell_mar)
+        key = (top_mm, bottom_mm, left_mm, right_mm)
+        template = _TBL_CELL_MAR_TEMPLATES.get(key)
+        if template is None:
+            template = parse_xml(
+                f"<w:tblCellMar {_W_XMLNS}>"
+                + "".join(
+                    f'<w:{edge} w:w="{mm_to_twips(mm_val)}" w:type="dxa"/>'
+                    for edge, mm_val in (("top", top_mm), ("bottom", bottom_mm), ("left", left_mm), ("right", right_mm))
+                )
+                + "</w:tblCellMar>"
+            )
+            _TBL_CELL_MAR_TEMPLATES[key] = template
+        tbl_pr.append(copy.deepcopy(template))
+        return
 
     for edge, mm_val in (("top", top_mm), ("bottom", bottom_mm), ("left", left_mm), ("right", right_mm)):
-        node = cell_mar.find(qn(f"w:{edge}"))
+        node = cell_mar.find(_QN[edge])
         if node is None:
             node = OxmlElement(f"w:{edge}")
             cell_mar.append(node)
-        node.set(qn("w:w"), str(mm_to_twips(mm_val)))
-        node.set(qn("w:type"), "dxa")
+        node.set(_QN["w"], str(mm_to_twips(mm_val)))
+        node.set(_QN["type"], "dxa")
 
 
 def set_docx_table_fixed_layout(table, *, total_width_mm: float, col_widths_mm: List[float]) -> None:
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
-    from docx.shared import Mm
-
     table.autofit = False
     tbl_pr = table._tbl.tblPr
     if tbl_pr is None:
         tbl_pr = OxmlElement("w:tblPr")
         table._tbl.insert(0, tbl_pr)
 
-    tbl_layout = tbl_pr.find(qn("w:tblLayout"))
+    tbl_layout = tbl_pr.find(_QN["tblLayout"])
     if tbl_layout is None:
         tbl_layout = OxmlElement("w:tblLayout")
         tbl_pr.append(tbl_layout)
-    tbl_layout.set(qn("w:type"), "fixed")
+    tbl_layout.set(_QN["type"], "fixed")
 
-    tbl_w = tbl_pr.find(qn("w:tblW"))
+    tbl_w = tbl_pr.find(_QN["tblW"])
     if tbl_w is None:
         tbl_w = OxmlElement("w:tblW")
         tbl_pr.append(tbl_w)
-    tbl_w.set(qn("w:type"), "dxa")
-    tbl_w.set(qn("w:w"), str(mm_to_twips(total_width_mm)))
+    tbl_w.set(_QN["type"], "dxa")
+    tbl_w.set(_QN["w"], str(mm_to_twips(total_width_mm)))
 
-    tbl_ind = tbl_pr.find(qn("w:tblInd"))
+    tbl_ind = tbl_pr.find(_QN["tblInd"])
     if tbl_ind is None:
         tbl_ind = OxmlElement("w:tblInd")
         tbl_pr.append(tbl_ind)
-    tbl_ind.set(qn("w:type"), "dxa")
-    tbl_ind.set(qn("w:w"), "0")
+    tbl_ind.set(_QN["type"], "dxa")
+    tbl_ind.set(_QN["w"], "0")
 
-    for col_idx, width_mm in enumerate(col_widths_mm):
-        if col_idx >= len(table.columns):
-            break
-        table.columns[col_idx].width = Mm(width_mm)
-        for row in table.rows:
-            if col_idx < len(row.cells):
-                row.cells[col_idx].width = Mm(width_mm)
+    # Build each width once, and read row.cells (which rebuilds the row's cell list) once per row.
+    columns = table.columns
+    widths = [Mm(width_mm) for width_mm in col_widths_mm[: len(columns)]]
+    for column, width in zip(columns, widths):
+        column.width = width
+    for row in table.rows:
+        for cell, width in zip(row.cells, widths):
+            cell.width = width
 
 
 def format_doc_date(value: Any) -> str:
-    text = str(value or "").strip()
+    return _format_doc_date_text(str(value or "").strip())
+
+
+# Worker rows mostly repeat a handful of CIN validity dates, so each distinct text is converted once.
+@lru_cache(maxsize=1024)
+def _format_doc_date_text(text: str) -> str:
     if not text:
         return ""
-    if re.match(r"^\d{2}/\d{2}/\d{4}$", text):
+    if _DMY_DATE_RE.match(text):
         return text
-    iso_match = re.match(r"^(\d{4})-(\d{2})-(\d{2})$", text)
+    iso_match = _ISO_DATE_RE.match(text)
     if iso_match:
         return f"{iso_match.group(3)}/{iso_match.group(2)}/{iso_match.group(1)}"
     return text
 
 
 def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
-    from docx import Document
-    from docx.enum.table import WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE, WD_TABLE_ALIGNMENT
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.shared import Mm, Pt
+    _load_docx()
 
     layout = Layout()
 
-    doc = Document()
-    section0 = doc.sections[0]
-    section0.page_width = Mm(210)
-    section0.page_height = Mm(297)
-    set_page_margins(
-        section0,
-        top_mm=layout.page_top_margin_mm,
-        bottom_mm=layout.page_bottom_margin_mm,
-        left_mm=layout.page_left_margin_mm,
-        right_mm=layout.page_right_margin_mm,
+    margins_key = (
+        layout.page_top_margin_mm,
+        layout.page_bottom_margin_mm,
+        layout.page_left_margin_mm,
+        layout.page_right_margin_mm,
     )
-    set_default_font(doc, font_name="Times New Roman", font_size_pt=9)
+    prototype = _ROLE_DOCUMENT_PROTOTYPES.get(margins_key)
+    if prototype is None:
+        prototype = Document()
+        section0 = prototype.sections[0]
+        section0.page_width = Mm(210)
+        section0.page_height = Mm(297)
+        set_page_margins(
+            section0,
+            top_mm=layout.page_top_margin_mm,
+            bottom_mm=layout.page_bottom_margin_mm,
+            left_mm=layout.page_left_margin_mm,
+            right_mm=layout.page_right_margin_mm,
+        )
+        set_default_font(prototype, font_name="Times New Roman", font_size_pt=9)
+        _ROLE_DOCUMENT_PROTOTYPES[margins_key] = prototype
+    doc = copy.deepcopy(prototype)
 
     regisseur = str(payload.get("regisseurName") or "MAJDA TAKNOUTI")
     year = str(payload.get("year") or "")
@@ -796,6 +1023,16 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
     gap_mm = layout.post_grid_gap_mm
     left_block_mm = (usable_w_mm - gap_mm) * 0.56
     right_block_mm = (usable_w_mm - gap_mm) * 0.44
+    # Layout lengths every section reuses for its table header and post-table block.
+    header_row_h = Mm(layout.table_header_h_mm)
+    post_top_gap_h = Mm(layout.post_block_margin_top_mm)
+    post_indent = Mm(layout.post_indent_mm)
+    post_bottom_padding_h = Mm(layout.post_bottom_padding_mm)
+    signature_reserve_h = Mm(layout.post_signature_reserve_mm)
+    row_h = Mm(layout.table_row_h_mm)
+    # Length values are immutable ints, so one instance can be assigned to every paragraph and run.
+    pt0 = Pt(0)
+    pt9 = Pt(9)
 
     # Column ratios tuned to match the scanned paper with full-width fixed table layout.
     col_perc = [6, 27, 9, 8, 8, 10, 10, 10, 12]
@@ -811,30 +1048,61 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
             return float(default)
 
     def round2(value: Any) -> float:
-        return float(f"{to_float(value, 0):.2f}")
+        # round() is correctly rounded like the "%.2f" formatting it replaces, without the str round-trip.
+        return round(to_float(value, 0), 2)
 
     def format_cell_text(cell, text: str, *, align=WD_ALIGN_PARAGRAPH.CENTER, bold=False, size_pt=9, underline=False) -> None:
-        cell.text = ""
-        p = cell.paragraphs[0]
-        p.alignment = align
-        p.paragraph_format.space_before = Pt(0)
-        p.paragraph_format.space_after = Pt(0)
-        run = p.add_run(text)
-        run.bold = bold
-        run.underline = underline
-        run.font.size = Pt(size_pt)
-
-    def sum_workers(rows: List[Dict[str, Any]]) -> Dict[str, float]:
-        totals_out = {"totalDays": 0.0, "totalGross": 0.0, "totalDeduction": 0.0, "totalNet": 0.0}
-        for row in rows:
-            totals_out["totalDays"] += to_float(row.get("daysWorked"), 0)
-            totals_out["totalGross"] += to_float(row.get("grossSalary"), 0)
-            totals_out["totalDeduction"] += to_float(row.get("deduction"), 0)
-            totals_out["totalNet"] += to_float(row.get("netSalary"), 0)
-        totals_out["totalGross"] = round2(totals_out["totalGross"])
-        totals_out["totalDeduction"] = round2(totals_out["totalDeduction"])
-        totals_out["totalNet"] = round2(totals_out["totalNet"])
-        return totals_out
+        tc = cell._tc
+        tc.clear_content()
+        tc.append(role_cell_paragraph(text, align=align, bold=bold, size_pt=size_pt, underline=underline))
+
+    def role_totals(days: float, gross: float, deduction: float, net: float) -> Dict[str, float]:
+        return {
+            "totalDays": days,
+            "totalGross": round2(gross),
+            "totalDeduction": round2(deduction),
+            "totalNet": round2(net),
+        }
+
+    def prepare_role_rows(
+        workers: List[Dict[str, Any]], page1_count: int
+    ) -> Tuple[List[RoleRow], Dict[str, float], Dict[str, float]]:
+        # One pass over the payload: every worker dict is read once, its cell texts are formatted, and
+        # the page 1 and section totals are accumulated in the same loop (page 1 being a prefix of the
+        # section, its running sums are simply captured on the way).
+        rows_out: List[RoleRow] = []
+        days_sum = gross_sum = deduction_sum = net_sum = 0.0
+        page1_sums = None
+        for i, w in enumerate(workers):
+            if i == page1_count:
+                page1_sums = (days_sum, gross_sum, deduction_sum, net_sum)
+            get = w.get
+            type_code = str(get("type") or "").strip()
+            days = to_float(get("daysWorked"), 0)
+            # Same conversion as fmt_amount, which rejects non-numeric amounts instead of printing 0.
+            gross = float(get("grossSalary") or 0)
+            deduction = float(get("deduction") or 0)
+            net = float(get("netSalary") or 0)
+            days_sum += days
+            gross_sum += gross
+            deduction_sum += deduction
+            net_sum += net
+            rows_out.append(
+                RoleRow(
+                    i + 1,
+                    str(get("nom_prenom") or ""),
+                    "O.S" if type_code == "OS" else ("O.N.S" if type_code else ""),
+                    str(int(round(days))),
+                    fmt_amount(get("salaire_journalier"), decimal_comma=decimal_comma),
+                    fmt_amount(gross, decimal_comma=decimal_comma),
+                    fmt_amount(deduction, decimal_comma=decimal_comma),
+                    fmt_amount(net, decimal_comma=decimal_comma),
+                    str(get("cin") or "").strip(),
+                    format_doc_date(get("cin_validite")),
+                )
+            )
+        section_sums = (days_sum, gross_sum, deduction_sum, net_sum)
+        return rows_out, role_totals(*(page1_sums or section_sums)), role_totals(*section_sums)
 
     def normalize_totals(raw: Dict[str, Any], fallback: Dict[str, float]) -> Dict[str, float]:
         total_days = to_float(raw.get("totalDays"), fallback["totalDays"])
@@ -848,7 +1116,26 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
             "totalNet": total_net,
         }
 
+    # Body elements of the first section's header (title tables and paragraphs). Only the regisseur,
+    # the period dates and the amount change between sections, so later headers are deep copies
+    # with those four runs rewritten.
+    header_elements: List[Any] = []
+
+    def fill_role_header(elements: List[Any], data: Dict[str, Any]) -> None:
+        info_tcs = elements[2].tr_lst[0].tc_lst
+        info_tcs[0].p_lst[0][-1].text = f"NOM DU REGISSEUR : {data['regisseur']}"
+        info_tcs[2].p_lst[0][-1].text = data["startDate"]
+        info_tcs[4].p_lst[0][-1].text = data["endDate"]
+        elements[5][-1].text = fmt_amount(data["totalNet"], decimal_comma=decimal_comma)
+
     def add_role_header_page1(doc_ref, data: Dict[str, Any]) -> None:
+        if header_elements:
+            elements = [copy.deepcopy(el) for el in header_elements]
+            fill_role_header(elements, data)
+            for el in elements:
+                append_body_element(doc_ref, el)
+            return
+
         header_tbl = doc_ref.add_table(rows=1, cols=3)
         header_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
         remove_docx_table_borders(header_tbl)
@@ -864,8 +1151,8 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
 
         left_p = left_cell.paragraphs[0]
         left_p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        left_p.paragraph_format.space_before = Pt(0)
-        left_p.paragraph_format.space_after = Pt(0)
+        left_p.paragraph_format.space_before = pt0
+        left_p.paragraph_format.space_after = pt0
         for line in [
             "ROYAUME DU MAROC",
             "MINISTERE DE L'INTERIEUR",
@@ -875,12 +1162,12 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         ]:
             r = left_p.add_run(line + "\n")
             r.bold = True
-            r.font.size = Pt(9)
+            r.font.size = pt9
 
         center_p = center_cell.paragraphs[0]
         center_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        center_p.paragraph_format.space_before = Pt(0)
-        center_p.paragraph_format.space_after = Pt(0)
+        center_p.paragraph_format.space_before = pt0
+        center_p.paragraph_format.space_after = pt0
         for line in ["DEPENSES EN REGIE", "SALAIRE DU PERSONNEL OCCASIONNEL"]:
             r = center_p.add_run(line + "\n")
             r.bold = True
@@ -889,13 +1176,13 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
 
         right_p = right_cell.paragraphs[0]
         right_p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        right_p.paragraph_format.space_before = Pt(0)
-        right_p.paragraph_format.space_after = Pt(0)
+        right_p.paragraph_format.space_before = pt0
+        right_p.paragraph_format.space_after = pt0
         rr = right_p.add_run("ANNEXE : 9……….\n")
         rr.bold = True
-        rr.font.size = Pt(9)
+        rr.font.size = pt9
 
-        add_centered_title(doc_ref, "ROLE DES JOURNEES D'OUVRIERS EMPLOYES", font_size_pt=11)
+        title_p = add_centered_title(doc_ref, "ROLE DES JOURNEES D'OUVRIERS EMPLOYES", font_size_pt=11)
 
         info_tbl = doc_ref.add_table(rows=1, cols=5)
         info_tbl.alignment = WD_TABLE_ALIGNMENT.CENTER
@@ -919,8 +1206,13 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
 
         for date_cell, date_text in ((info_cells[2], data["startDate"]), (info_cells[4], data["endDate"])):
             format_cell_text(date_cell, date_text, align=WD_ALIGN_PARAGRAPH.CENTER, bold=False, size_pt=9)
-            for edge in ("top", "left", "bottom", "right"):
-                set_docx_cell_border(date_cell, **{edge: {"val": "single", "sz": 10, "color": "000000"}})
+            set_docx_cell_border(
+                date_cell,
+                top={"val": "single", "sz": 10, "color": "000000"},
+                left={"val": "single", "sz": 10, "color": "000000"},
+                bottom={"val": "single", "sz": 10, "color": "000000"},
+                right={"val": "single", "sz": 10, "color": "000000"},
+            )
 
         travaux_p = doc_ref.add_paragraph()
         travaux_p.paragraph_format.space_before = Pt(1)
@@ -928,8 +1220,8 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         travaux_p.add_run("(2)TRAVAUX DIVERS A LA COMMUNE OULED NACEUR").bold = True
 
         refs_p = doc_ref.add_paragraph()
-        refs_p.paragraph_format.space_before = Pt(0)
-        refs_p.paragraph_format.space_after = Pt(0)
+        refs_p.paragraph_format.space_before = pt0
+        refs_p.paragraph_format.space_after = pt0
         ref_parts = [
             ("ANNEE :", year),
             ("CHAP :", str(reference.get("chapitre") or reference.get("chap") or "")),
@@ -943,21 +1235,23 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
             rl.bold = True
             rv = refs_p.add_run(f"{value}    ")
             rv.bold = False
-            rl.font.size = Pt(9)
-            rv.font.size = Pt(9)
+            rl.font.size = pt9
+            rv.font.size = pt9
 
         somme_p = doc_ref.add_paragraph()
-        somme_p.paragraph_format.space_before = Pt(0)
+        somme_p.paragraph_format.space_before = pt0
         somme_p.paragraph_format.space_after = Pt(2)
         rs = somme_p.add_run("SOMME A PAYER : ")
         rs.bold = True
-        rs.font.size = Pt(9)
+        rs.font.size = pt9
         rv = somme_p.add_run(fmt_amount(data["totalNet"], decimal_comma=decimal_comma))
-        rv.font.size = Pt(9)
+        rv.font.size = pt9
+
+        header_elements.extend((header_tbl._tbl, title_p._p, info_tbl._tbl, travaux_p._p, refs_p._p, somme_p._p))
 
     def add_role_table(
         doc_ref,
-        rows: List[Dict[str, Any]],
+        rows: List[RoleRow],
         totals: Dict[str, Any],
         is_continuation: bool = False,
         report_totals: Optional[Dict[str, Any]] = None,
@@ -971,7 +1265,7 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         set_docx_table_cell_margins(table, top_mm=2.8, bottom_mm=2.8, left_mm=3.5, right_mm=3.5)
 
         header = table.rows[0]
-        header.height = Mm(layout.table_header_h_mm)
+        header.height = header_row_h
         header.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
         header_labels = [
             "N° DESP.\nD'ATTACH.",
@@ -985,132 +1279,120 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
             "N° DE LA C.I.N\nET SIGNATURE",
         ]
         rotated_header_cols = {0, 2, 3, 4, 5, 6}
-        for idx, label in enumerate(header_labels):
+        body_aligns = (WD_ALIGN_PARAGRAPH.CENTER, WD_ALIGN_PARAGRAPH.LEFT) + (WD_ALIGN_PARAGRAPH.CENTER,) * 6
+
+        def set_grid_borders(row) -> None:
+            # Body rows come from role_body_row with these borders already in place.
+            for cell in row.cells:
+                set_docx_cell_border(
+                    cell,
+                    top={"val": "single", "sz": 10, "color": "000000"},
+                    left={"val": "single", "sz": 10, "color": "000000"},
+                    bottom={"val": "single", "sz": 10, "color": "000000"},
+                    right={"val": "single", "sz": 10, "color": "000000"},
+                )
+
+        # row.cells rebuilds the cell list on every access, so it is read once per row.
+        for idx, (cell, label) in enumerate(zip(header.cells, header_labels)):
             format_cell_text(
-                header.cells[idx],
+                cell,
                 label,
                 align=WD_ALIGN_PARAGRAPH.CENTER,
                 bold=True,
                 size_pt=8 if idx in (0, 3, 4, 6, 8) else 9,
             )
-            header.cells[idx].vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
             if idx in rotated_header_cols:
-                set_docx_cell_text_direction(header.cells[idx], "btLr")
+                set_docx_cell_text_direction(cell, "btLr")
+        set_grid_borders(header)
 
         slot_count = continuation_worker_rows if is_continuation else page1_worker_rows
         slot_count = max(slot_count, len(rows))
         base_start = page1_worker_rows + 1 if is_continuation else 1
         if rows:
-            base_start = int(rows[0].get("rowNo") or base_start)
-
-        rendered_rows = [dict(r) for r in rows]
-        if force_blank_rows:
-            while len(rendered_rows) < slot_count:
-                rendered_rows.append({"rowNo": base_start + len(rendered_rows), "_blank": True})
+            base_start = rows[0].row_no
 
         def add_summary_row(label: str, totals_row: Dict[str, Any]) -> None:
             row = table.add_row()
-            row.height = Mm(layout.table_row_h_mm)
+            row.height = row_h
             row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            for c in row.cells:
+            cells = row.cells
+            for c in cells:
                 c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
 
-            label_cell = row.cells[0].merge(row.cells[2])
+            # Merging the label columns leaves the <w:tc> behind cells[3:] untouched.
+            label_cell = cells[0].merge(cells[2])
             format_cell_text(label_cell, label, align=WD_ALIGN_PARAGRAPH.CENTER, bold=True, size_pt=9)
-            format_cell_text(row.cells[3], str(int(round(to_float(totals_row.get("totalDays"), 0)))), bold=True, size_pt=9)
-            format_cell_text(row.cells[4], "", bold=True, size_pt=9)
-            format_cell_text(row.cells[5], fmt_amount(totals_row.get("totalGross"), decimal_comma=decimal_comma), bold=True, size_pt=9)
-            format_cell_text(row.cells[6], fmt_amount(totals_row.get("totalDeduction"), decimal_comma=decimal_comma), bold=True, size_pt=9)
-            format_cell_text(row.cells[7], fmt_amount(totals_row.get("totalNet"), decimal_comma=decimal_comma), bold=True, size_pt=9)
-            format_cell_text(row.cells[8], "", bold=True, size_pt=9)
+            format_cell_text(cells[3], str(int(round(to_float(totals_row.get("totalDays"), 0)))), bold=True, size_pt=9)
+            format_cell_text(cells[4], "", bold=True, size_pt=9)
+            format_cell_text(cells[5], fmt_amount(totals_row.get("totalGross"), decimal_comma=decimal_comma), bold=True, size_pt=9)
+            format_cell_text(cells[6], fmt_amount(totals_row.get("totalDeduction"), decimal_comma=decimal_comma), bold=True, size_pt=9)
+            format_cell_text(cells[7], fmt_amount(totals_row.get("totalNet"), decimal_comma=decimal_comma), bold=True, size_pt=9)
+            format_cell_text(cells[8], "", bold=True, size_pt=9)
+            set_grid_borders(row)
 
         if is_continuation:
             add_summary_row("REPORT :", report_totals or {"totalDays": 0, "totalGross": 0, "totalDeduction": 0, "totalNet": 0})
 
-        for row_data in rendered_rows:
-            row = table.add_row()
-            row.height = Mm(layout.table_row_h_mm)
-            row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            for c in row.cells:
-                c.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-
-            is_blank = bool(row_data.get("_blank"))
-            type_code = str(row_data.get("type") or "").strip()
-            type_display = "O.S" if type_code == "OS" else ("O.N.S" if type_code else "")
-
-            format_cell_text(row.cells[0], str(row_data.get("rowNo") or ""), align=WD_ALIGN_PARAGRAPH.CENTER, size_pt=9)
-            format_cell_text(
-                row.cells[1],
-                "" if is_blank else str(row_data.get("nom_prenom") or ""),
-                align=WD_ALIGN_PARAGRAPH.LEFT,
-                size_pt=9,
-            )
-            format_cell_text(row.cells[2], "" if is_blank else type_display, align=WD_ALIGN_PARAGRAPH.CENTER, size_pt=9)
-            format_cell_text(
-                row.cells[3],
-                "" if is_blank else str(int(round(to_float(row_data.get("daysWorked"), 0)))),
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                size_pt=9,
-            )
-            format_cell_text(
-                row.cells[4],
-                "" if is_blank else fmt_amount(row_data.get("salaire_journalier"), decimal_comma=decimal_comma),
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                size_pt=9,
-            )
-            format_cell_text(
-                row.cells[5],
-                "" if is_blank else fmt_amount(row_data.get("grossSalary"), decimal_comma=decimal_comma),
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                size_pt=9,
-            )
-            format_cell_text(
-                row.cells[6],
-                "" if is_blank else fmt_amount(row_data.get("deduction"), decimal_comma=decimal_comma),
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                size_pt=9,
-            )
-            format_cell_text(
-                row.cells[7],
-                "" if is_blank else fmt_amount(row_data.get("netSalary"), decimal_comma=decimal_comma),
-                align=WD_ALIGN_PARAGRAPH.CENTER,
-                size_pt=9,
+        # Body rows are copied from a bordered row template and appended straight to <w:tbl>,
+        # bypassing add_row(), the _Cell proxies and a final border pass over every cell.
+        tbl = table._tbl
+        row_h_twips = row_h.twips
+
+        def build_body_row(row_data: RoleRow):
+            tr = role_body_row(tbl, row_h_twips)
+            tcs = tr.tc_lst
+            texts = (
+                str(row_data.row_no),
+                row_data.nom_prenom,
+                row_data.type_display,
+                row_data.days_text,
+                row_data.salaire_text,
+                row_data.gross_text,
+                row_data.deduction_text,
+                row_data.net_text,
             )
-
-            cin_cell = row.cells[8]
-            cin_cell.text = ""
-            if not is_blank:
-                cin_value = str(row_data.get("cin") or "").strip()
-                cin_validite = format_doc_date(row_data.get("cin_validite"))
-                p1 = cin_cell.paragraphs[0]
-                p1.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                p1.paragraph_format.space_before = Pt(0)
-                p1.paragraph_format.space_after = Pt(0)
-                r1 = p1.add_run(f"CIN N°: {cin_value}" if cin_value else "")
-                r1.font.size = Pt(8)
-                r1.add_break()
-                r2 = p1.add_run(f"AU : {cin_validite}" if cin_validite else "AU :")
-                r2.font.size = Pt(8)
+            for tc, text, align in zip(tcs, texts, body_aligns):
+                tc.append(role_cell_paragraph(text, align=align, bold=False, size_pt=9, underline=False))
+            tcs[8].append(role_cin_paragraph(row_data.cin, row_data.cin_validite, blank=row_data.is_blank))
+            return tr
+
+        for row_data in rows:
+            tbl.append(build_body_row(row_data))
+
+        if force_blank_rows and len(rows) < slot_count:
+            # Filler rows only differ by their number: build one, then copy it and set the number run.
+            blank_tr = build_body_row(RoleRow(0, is_blank=True))
+            for row_no in range(base_start + len(rows), base_start + slot_count):
+                tr = copy.deepcopy(blank_tr)
+                tr.tc_lst[0][-1][-1].text = str(row_no)
+                tbl.append(tr)
 
         add_summary_row("TOTAL :", totals)
 
-        for row in table.rows:
-            for cell in row.cells:
-                set_docx_cell_border(
-                    cell,
-                    top={"val": "single", "sz": 10, "color": "000000"},
-                    left={"val": "single", "sz": 10, "color": "000000"},
-                    bottom={"val": "single", "sz": 10, "color": "000000"},
-                    right={"val": "single", "sz": 10, "color": "000000"},
-                )
+    # Body elements of the first section's declaration and signature block, cloned for later
+    # sections like the header: only the amount in words and the two dates change.
+    declaration_elements: List[Any] = []
+
+    def fill_declaration(elements: List[Any], totals_in_words: str, dates: Dict[str, str]) -> None:
+        elements[1].tr_lst[0].tc_lst[1].p_lst[1][-1].text = totals_in_words
+        elements[3][-1].text = f"A OULED NACEUR LE : {dates.get('document_date') or ''}"
+        elements[5].tr_lst[0].tc_lst[0].p_lst[0][-1].text = f"PAYER PAR Moi Le : {dates.get('pay_date') or ''}"
 
     def add_declaration_and_signatures(doc_ref, totals_in_words: str, dates: Dict[str, str]) -> None:
+        if declaration_elements:
+            elements = [copy.deepcopy(el) for el in declaration_elements]
+            fill_declaration(elements, totals_in_words, dates)
+            for el in elements:
+                append_body_element(doc_ref, el)
+            return
+
         # Keep a visible top margin between the table and the declaration/signature area.
         top_gap_tbl = doc_ref.add_table(rows=1, cols=1)
         remove_docx_table_borders(top_gap_tbl)
         set_docx_table_fixed_layout(top_gap_tbl, total_width_mm=usable_w_mm, col_widths_mm=[usable_w_mm])
         top_gap_row = top_gap_tbl.rows[0]
-        top_gap_row.height = Mm(layout.post_block_margin_top_mm)
+        top_gap_row.height = post_top_gap_h
         top_gap_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
 
         top_tbl = doc_ref.add_table(rows=1, cols=2)
@@ -1125,40 +1407,40 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
 
         format_cell_text(left_cell, "NOUS SOUSSIGNONS :", align=WD_ALIGN_PARAGRAPH.LEFT, bold=True, size_pt=9)
         p_mr1 = left_cell.add_paragraph()
-        p_mr1.paragraph_format.space_before = Pt(0)
-        p_mr1.paragraph_format.space_after = Pt(0)
-        p_mr1.paragraph_format.left_indent = Mm(layout.post_indent_mm)
+        p_mr1.paragraph_format.space_before = pt0
+        p_mr1.paragraph_format.space_after = pt0
+        p_mr1.paragraph_format.left_indent = post_indent
         r_mr1 = p_mr1.add_run("Mr")
         r_mr1.bold = True
-        r_mr1.font.size = Pt(9)
+        r_mr1.font.size = pt9
 
         p_blank = left_cell.add_paragraph("\u00a0")
-        p_blank.paragraph_format.left_indent = Mm(layout.post_indent_mm)
-        p_blank.paragraph_format.space_before = Pt(0)
-        p_blank.paragraph_format.space_after = Pt(0)
-        p_blank.runs[0].font.size = Pt(9)
+        p_blank.paragraph_format.left_indent = post_indent
+        p_blank.paragraph_format.space_before = pt0
+        p_blank.paragraph_format.space_after = pt0
+        p_blank.runs[0].font.size = pt9
 
         p_mr2 = left_cell.add_paragraph()
         p_mr2.paragraph_format.space_before = Pt(8)
-        p_mr2.paragraph_format.space_after = Pt(0)
-        p_mr2.paragraph_format.left_indent = Mm(layout.post_indent_mm)
+        p_mr2.paragraph_format.space_after = pt0
+        p_mr2.paragraph_format.left_indent = post_indent
         r_mr2 = p_mr2.add_run("Mr")
         r_mr2.bold = True
-        r_mr2.font.size = Pt(9)
+        r_mr2.font.size = pt9
 
         p_cert = left_cell.add_paragraph()
         p_cert.paragraph_format.space_before = Pt(3)
-        p_cert.paragraph_format.space_after = Pt(0)
+        p_cert.paragraph_format.space_after = pt0
         r_cert = p_cert.add_run("CERTIFIONS QUE LES SIEURS :")
         r_cert.bold = True
-        r_cert.font.size = Pt(9)
+        r_cert.font.size = pt9
 
         p_phrase = left_cell.add_paragraph()
         p_phrase.paragraph_format.space_before = Pt(1)
-        p_phrase.paragraph_format.space_after = Pt(0)
+        p_phrase.paragraph_format.space_after = pt0
         p_phrase.alignment = WD_ALIGN_PARAGRAPH.LEFT
         r_phrase = p_phrase.add_run("Portés au présent Role ont été payés en notre opposition de leurs signatures")
-        r_phrase.font.size = Pt(9)
+        r_phrase.font.size = pt9
 
         format_cell_text(
             right_cell,
@@ -1169,32 +1451,32 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         )
         p_words = right_cell.add_paragraph()
         p_words.paragraph_format.space_before = Pt(1)
-        p_words.paragraph_format.space_after = Pt(0)
+        p_words.paragraph_format.space_after = pt0
         p_words.alignment = WD_ALIGN_PARAGRAPH.LEFT
         rw = p_words.add_run(totals_in_words)
         rw.bold = True
-        rw.font.size = Pt(9)
+        rw.font.size = pt9
 
         center_line_1 = doc_ref.add_paragraph()
         center_line_1.paragraph_format.space_before = Pt(2)
-        center_line_1.paragraph_format.space_after = Pt(0)
+        center_line_1.paragraph_format.space_after = pt0
         center_line_1.alignment = WD_ALIGN_PARAGRAPH.CENTER
         rc1 = center_line_1.add_run("DRESSE ET CERTIFIE CONFORME AUX ATTACHEMENTS")
         rc1.bold = True
-        rc1.font.size = Pt(9)
+        rc1.font.size = pt9
 
         center_line_2 = doc_ref.add_paragraph()
-        center_line_2.paragraph_format.space_before = Pt(0)
-        center_line_2.paragraph_format.space_after = Pt(0)
+        center_line_2.paragraph_format.space_before = pt0
+        center_line_2.paragraph_format.space_after = pt0
         center_line_2.alignment = WD_ALIGN_PARAGRAPH.CENTER
         rc2 = center_line_2.add_run(f"A OULED NACEUR LE : {dates.get('document_date') or ''}")
-        rc2.font.size = Pt(9)
+        rc2.font.size = pt9
 
         spacer_tbl = doc_ref.add_table(rows=1, cols=1)
         remove_docx_table_borders(spacer_tbl)
         set_docx_table_fixed_layout(spacer_tbl, total_width_mm=usable_w_mm, col_widths_mm=[usable_w_mm])
         spacer_row = spacer_tbl.rows[0]
-        spacer_row.height = Mm(layout.post_bottom_padding_mm)
+        spacer_row.height = post_bottom_padding_h
         spacer_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
 
         bottom_tbl = doc_ref.add_table(rows=1, cols=2)
@@ -1213,7 +1495,7 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         )
         p_reg = left_bottom.add_paragraph()
         p_reg.paragraph_format.space_before = Pt(4)
-        p_reg.paragraph_format.space_after = Pt(0)
+        p_reg.paragraph_format.space_after = pt0
         p_reg.alignment = WD_ALIGN_PARAGRAPH.LEFT
         rr = p_reg.add_run("LE REGISSEUR DE DEPENSES")
         rr.bold = True
@@ -1233,9 +1515,21 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         remove_docx_table_borders(reserve_tbl)
         set_docx_table_fixed_layout(reserve_tbl, total_width_mm=usable_w_mm, col_widths_mm=[usable_w_mm])
         reserve_row = reserve_tbl.rows[0]
-        reserve_row.height = Mm(layout.post_signature_reserve_mm)
+        reserve_row.height = signature_reserve_h
         reserve_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
 
+        declaration_elements.extend(
+            (
+                top_gap_tbl._tbl,
+                top_tbl._tbl,
+                center_line_1._p,
+                center_line_2._p,
+                spacer_tbl._tbl,
+                bottom_tbl._tbl,
+                reserve_tbl._tbl,
+            )
+        )
+
     def add_table_top_spacing(doc_ref, spacing_mm: float = 10.0) -> None:
         spacer_tbl = doc_ref.add_table(rows=1, cols=1)
         remove_docx_table_borders(spacer_tbl)
@@ -1245,18 +1539,12 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         spacer_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
 
     for idx, sec in enumerate(sections):
-        sec_workers = sec.get("workers") or []
-        prepared_rows: List[Dict[str, Any]] = []
-        for i, worker in enumerate(sec_workers):
-            row = dict(worker)
-            row["rowNo"] = i + 1
-            prepared_rows.append(row)
+        prepared_rows, page1_partial, section_sum = prepare_role_rows(sec.get("workers") or [], page1_worker_rows)
 
         page1_rows = prepared_rows[:page1_worker_rows]
         page2_rows = prepared_rows[page1_worker_rows:]
 
-        page1_partial = sum_workers(page1_rows)
-        section_totals = normalize_totals(sec, sum_workers(prepared_rows))
+        section_totals = normalize_totals(sec, section_sum)
 
         start_date = format_doc_date(sec.get("startDate"))
         end_date = format_doc_date(sec.get("endDate"))
@@ -1306,7 +1594,21 @@ def draw_role_docx(payload: Dict[str, Any], docx_path: str) -> None:
         if idx < len(sections) - 1:
             doc.add_page_break()
 
-    doc.save(docx_path)
+    # Serialize in memory so the file system gets one write instead of zipfile's many small ones.
+    buf = io.BytesIO()
+    write_docx_package(doc, buf)
+    with open(docx_path, "wb") as f:
+        f.write(buf.getbuffer())
+
+
+def write_json(payload: Any) -> None:
+    # Encoded once and written as UTF-8 bytes, as backend/main.py does for its responses.
+    if orjson is not None:
+        data = orjson.dumps(payload)
+    else:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 def main() -> None:
@@ -1332,7 +1634,7 @@ def main() -> None:
 
     result = {"docxFileName": docx_name, "docxFilePath": docx_path}
 
-    sys.stdout.write(json.dumps(result, ensure_ascii=False))
+    write_json(result)
 
 
 if __name__ == "__main__":
@@ -1340,5 +1642,5 @@ if __name__ == "__main__":
         main()
     except Exception as exc:
         error = {"success": False, "message": str(exc)}
-        sys.stdout.write(json.dumps(error, ensure_ascii=False))
+        write_json(error)
         sys.exit(1)